@@ -154,6 +154,12 @@ class ONNXVectorAnalyzer:
             logger.warning("ONNXVectorAnalyzer.analyze failed: %s", exc, exc_info=True)
             return None
 
+    def embed(self, text: str):
+        """Return the L2-normalised embedding of *text*, or None if unavailable."""
+        if not self.supports(text):
+            return None
+        return self._embed(text)
+
     # ── Companion package resolution ─────────────────────────────────
 
     @staticmethod
@@ -305,7 +311,17 @@ class ONNXVectorAnalyzer:
                 )
             except Exception:
                 # Try alternate input names (some ONNX exports differ)
-                outputs = self._session.run(None, {"input_ids": input_ids})
+                try:
+                    outputs = self._session.run(
+                        None,
+                        {
+                            "input_ids": input_ids,
+                            "attention_mask": attention_mask,
+                            "token_type_ids": np.zeros_like(input_ids),
+                        },
+                    )
+                except Exception:
+                    outputs = self._session.run(None, {"input_ids": input_ids})
 
             # last_hidden_state: [batch, seq, hidden_dim]
             last_hidden = outputs[0].astype(np.float32)
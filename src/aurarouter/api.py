@@ -10,6 +10,7 @@ No PySide6 imports.  All public methods return typed dataclasses.
 from __future__ import annotations
 
 import time
+from collections import deque
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -1029,21 +1030,17 @@ class AuraRouterAPI:
         start = time_range[0] if time_range else None
         end = time_range[1] if time_range else None
 
-        totals = self._usage_store.total_tokens(start=start, end=end)
-        by_model = self._usage_store.aggregate_tokens(
-            start=start, end=end, group_by="model_id",
-        )
-        spend = self._cost_engine.total_spend(start=start, end=end)
-        spend_by = self._cost_engine.spend_by_provider(start=start, end=end)
+        # One grouped query yields the totals, spend and per-model split.
+        stats = self._cost_engine.window_stats(start=start, end=end)
         projection = self._cost_engine.monthly_projection()
 
         return TrafficSummary(
-            total_tokens=totals["total_tokens"],
-            input_tokens=totals["input_tokens"],
-            output_tokens=totals["output_tokens"],
-            by_model=by_model,
-            total_spend=spend,
-            spend_by_provider=spend_by,
+            total_tokens=stats["total_tokens"],
+            input_tokens=stats["input_tokens"],
+            output_tokens=stats["output_tokens"],
+            by_model=stats["by_model"],
+            total_spend=stats["total_cost"],
+            spend_by_provider=stats["spend_by_provider"],
             projection=projection,
         )
 
@@ -1058,21 +1055,29 @@ class AuraRouterAPI:
         from datetime import datetime, timedelta, timezone
 
         start_time = (datetime.now(timezone.utc) - timedelta(days=timeframe_days)).isoformat()
-        records = self._usage_store.query(start=start_time)
-
-        if not records:
+        # Single streaming pass over the window; only the 50 most recent
+        # local records are retained.
+        total_count = 0
+        total_cost_avoided = 0.0
+        total_latency = 0.0
+        local_count = 0
+        local_latency = 0.0
+        recent_local: deque = deque(maxlen=50)
+        for r in self._usage_store.iter_query(start=start_time):
+            total_count += 1
+            total_cost_avoided += r.simulated_cost_avoided
+            total_latency += r.elapsed_s
+            if not r.is_cloud:
+                local_count += 1
+                local_latency += r.elapsed_s
+                recent_local.append(r)
+
+        if not total_count:
             return ROIMetrics()
 
-        total_cost_avoided = sum(r.simulated_cost_avoided for r in records)
-        
-        local_records = [r for r in records if not r.is_cloud]
-        hard_route_percentage = (len(local_records) / len(records)) * 100.0 if records else 0.0
-        
-        avg_pipeline_latency = sum(r.elapsed_s for r in records) / len(records) if records else 0.0
-        avg_hard_routed_latency = (
-            sum(r.elapsed_s for r in local_records) / len(local_records)
-            if local_records else 0.0
-        )
+        hard_route_percentage = (local_count / total_count) * 100.0
+        avg_pipeline_latency = total_latency / total_count
+        avg_hard_routed_latency = local_latency / local_count if local_count else 0.0
 
         # Recent hard-routed tasks (top 50)
         recent_hard_routed = [
@@ -1083,7 +1088,7 @@ class AuraRouterAPI:
                 "savings": r.simulated_cost_avoided,
                 "latency": r.elapsed_s,
             }
-            for r in reversed(local_records[-50:]) # Top 50 most recent local tasks
+            for r in reversed(recent_local) # Top 50 most recent local tasks
         ]
 
         return ROIMetrics(
@@ -1977,11 +1982,12 @@ class AuraRouterAPI:
             cost_avoided = 0.0
             hard_route_count = 0
             total_count = 0
-            if hasattr(self._usage_store, "query"):
-                records = self._usage_store.query(start=start, end=end)
-                total_count = len(records)
-                cost_avoided = sum(getattr(r, "simulated_cost_avoided", 0.0) for r in records)
-                hard_route_count = sum(1 for r in records if not getattr(r, "is_cloud", True))
+            if hasattr(self._usage_store, "iter_query"):
+                for r in self._usage_store.iter_query(start=start, end=end):
+                    total_count += 1
+                    cost_avoided += getattr(r, "simulated_cost_avoided", 0.0)
+                    if not getattr(r, "is_cloud", True):
+                        hard_route_count += 1
             hard_route_ratio = (hard_route_count / total_count * 100.0) if total_count > 0 else 0.0
             local_routing_pct = hard_route_ratio
             projection = 0.0
@@ -6,6 +6,7 @@ that can be discovered and called by other grid applications.
 """
 
 import asyncio
+import functools
 import logging
 from typing import Any, Dict, Optional
 
@@ -28,7 +29,7 @@ except ImportError:
 
 
 from aurarouter.fabric import ComputeFabric
-from aurarouter.routing import analyze_intent, generate_plan
+from aurarouter.routing import analyze_intent, generate_plan, plan_waves
 
 
 @auragrid_service(name="RouterService")
@@ -196,33 +197,45 @@ class UnifiedRouterService:
     ) -> str:
         """AuraRouter V3: Multi-model routing with Intent Classification and Auto-Planning."""
         loop = asyncio.get_running_loop()
-        intent = await loop.run_in_executor(None, analyze_intent, self._fabric, task_description)
+        triage = await loop.run_in_executor(None, analyze_intent, self._fabric, task_description)
 
-        if intent == "SIMPLE_CODE":
+        if triage.intent == "SIMPLE_CODE":
             prompt = (
                 f"TASK: {task_description}\n"
                 f"LANG: {language}\n"
                 f"CONTEXT: {file_context}\n"
                 "CODE ONLY."
             )
-            return await loop.run_in_executor(None, self._fabric.execute, "coding", prompt) or "Error: Generation failed."
+            result = await loop.run_in_executor(None, self._fabric.execute, "coding", prompt)
+            return result.text if result and result.text else "Error: Generation failed."
 
-        # COMPLEX_REASONING path
-        plan = await loop.run_in_executor(None, generate_plan, self._fabric, task_description, file_context)
+        # COMPLEX_REASONING path: steps in the same wave do not depend on
+        # each other, so their calls overlap instead of running back to back.
+        plan = await loop.run_in_executor(
+            None,
+            functools.partial(
+                generate_plan, self._fabric, task_description, file_context,
+                with_dependencies=True,
+            ),
+        )
 
-        output: list[str] = []
-        for i, step in enumerate(plan):
+        output: list[str] = [""] * len(plan)
+        step_head = f"LANG: {language}\nCONTEXT: {file_context}\n"
+
+        async def run_step(i: int) -> str:
+            step = plan[i]
             prompt = (
-                f"GOAL: {step}\n"
-                f"LANG: {language}\n"
-                f"CONTEXT: {file_context}\n"
-                f"PREVIOUS_CODE: {output}\n"
+                f"GOAL: {step.goal}\n{step_head}"
+                f"PREVIOUS_CODE: {[output[d] for d in step.depends_on]}\n"
                 "Return ONLY valid code."
             )
-            code = await loop.run_in_executor(None, self._fabric.execute, "coding", prompt)
-            if code:
-                output.append(f"\n# --- Step {i + 1}: {step} ---\n{code}")
-            else:
-                output.append(f"\n# Step {i + 1} Failed.")
+            result = await loop.run_in_executor(None, self._fabric.execute, "coding", prompt)
+            if result and result.text:
+                return f"\n# --- Step {i + 1}: {step.goal} ---\n{result.text}"
+            return f"\n# Step {i + 1} Failed."
+
+        for wave in plan_waves(plan):
+            for i, part in zip(wave, await asyncio.gather(*(run_step(i) for i in wave))):
+                output[i] = part
 
         return "\n".join(output)
@@ -867,7 +867,7 @@ def _cmd_legacy_list_models(args: argparse.Namespace) -> None:
 
     storage = FileModelStorage(getattr(args, "dir", None))
     storage.scan()
-    models = storage.list_models()
+    models = storage.list_models_for_display()
 
     if not models:
         print("No models found in:", storage.models_dir)
@@ -876,9 +876,8 @@ def _cmd_legacy_list_models(args: argparse.Namespace) -> None:
 
     print(f"Models in {storage.models_dir}:\n")
     for m in models:
-        size_mb = m.get("size_bytes", 0) / (1024 * 1024)
         repo = m.get("repo", "unknown")
-        print(f"  {m['filename']}  ({size_mb:.0f} MB)  repo: {repo}")
+        print(f"  {m['filename']}  ({m['size_mb_str']} MB)  repo: {repo}")
     print(f"\n{len(models)} model(s) total.")
 
 
@@ -1424,6 +1423,7 @@ def main() -> None:
     # ---- Default: run MCP server ----
     from aurarouter.config import ConfigLoader
     from aurarouter.server import create_mcp_server
+    from aurarouter.worker_pool import shutdown_executor
 
     try:
         config = ConfigLoader(config_path=args.config)
@@ -1436,4 +1436,7 @@ def main() -> None:
         sys.exit(1)
 
     mcp = create_mcp_server(config)
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        shutdown_executor()
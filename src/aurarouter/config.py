@@ -34,6 +34,7 @@ class ConfigLoader:
         allow_missing: bool = False,
     ):
         self._config_path: Optional[Path] = None
+        self._revision = 0
 
         if allow_missing:
             self.config: dict = {}
@@ -102,6 +103,18 @@ class ConfigLoader:
         """The resolved path the config was loaded from (or will save to)."""
         return self._config_path
 
+    @property
+    def revision(self) -> int:
+        """Counter bumped by every mutation method.
+
+        Lets callers cache views derived from the config and notice when
+        they go stale.  Edits made directly to ``config`` do not bump it.
+        """
+        return self._revision
+
+    def _touch(self) -> None:
+        self._revision += 1
+
     # ------------------------------------------------------------------
     # Read accessors
     # ------------------------------------------------------------------
@@ -164,6 +177,7 @@ class ConfigLoader:
             if entry.get("name") == name:
                 entry["endpoint"] = endpoint
                 entry["auto_start"] = auto_start
+                self._touch()
                 return
 
         manual.append({
@@ -171,6 +185,7 @@ class ConfigLoader:
             "endpoint": endpoint,
             "auto_start": auto_start,
         })
+        self._touch()
 
     def remove_catalog_manual_entry(self, name: str) -> bool:
         """Remove a manual provider entry by name. Returns True if found."""
@@ -178,6 +193,7 @@ class ConfigLoader:
         for i, entry in enumerate(manual):
             if entry.get("name") == name:
                 manual.pop(i)
+                self._touch()
                 return True
         return False
 
@@ -197,6 +213,20 @@ class ConfigLoader:
             self.config.get("execution", {}).get("broadcast_timeout", 10.0)
         )
 
+    def get_max_local_concurrency(self) -> int:
+        """Return how many local_inference calls may run at once, default 8."""
+        return max(
+            1, int(self.config.get("execution", {}).get("max_local_concurrency", 8))
+        )
+
+    def get_response_cache_config(self) -> dict:
+        """Return the response cache section of the execution config."""
+        return self.config.get("execution", {}).get("response_cache", {})
+
+    def get_semantic_cache_config(self) -> dict:
+        """Return the semantic cache section of the execution config."""
+        return self.config.get("execution", {}).get("semantic_cache", {})
+
     @property
     def event_reporter_max_workers(self) -> int:
         """Max worker threads for the EventReporter pool (default 8)."""
@@ -221,12 +251,14 @@ class ConfigLoader:
         if "models" not in self.config:
             self.config["models"] = {}
         self.config["models"][model_id] = model_config
+        self._touch()
 
     def remove_model(self, model_id: str) -> bool:
         """Remove a model definition. Returns True if it existed."""
         models = self.config.get("models", {})
         if model_id in models:
             del models[model_id]
+            self._touch()
             return True
         return False
 
@@ -235,12 +267,14 @@ class ConfigLoader:
         if "roles" not in self.config:
             self.config["roles"] = {}
         self.config["roles"][role] = chain
+        self._touch()
 
     def remove_role(self, role: str) -> bool:
         """Remove a role. Returns True if it existed."""
         roles = self.config.get("roles", {})
         if role in roles:
             del roles[role]
+            self._touch()
             return True
         return False
 
@@ -469,6 +503,7 @@ class ConfigLoader:
         mcp = self.config.setdefault("mcp", {})
         tools = mcp.setdefault("tools", {})
         tools.setdefault(tool_name, {})["enabled"] = enabled
+        self._touch()
 
     def get_mcp_tools_config(self) -> dict:
         """Return the full mcp.tools config section."""
@@ -482,6 +517,7 @@ class ConfigLoader:
         """Set custom semantic verb synonyms for a role."""
         verbs = self.config.setdefault("semantic_verbs", {})
         verbs[role] = synonyms
+        self._touch()
 
     def get_semantic_verbs(self) -> dict:
         """Return custom semantic verb mappings."""
@@ -622,6 +658,7 @@ class ConfigLoader:
         """
         catalog = self.config.setdefault("catalog", {})
         catalog[artifact_id] = data
+        self._touch()
 
         # Validate analyzer specs at registration time (warn-only)
         if data.get("kind") == "analyzer":
@@ -645,6 +682,7 @@ class ConfigLoader:
         catalog = self.config.get("catalog", {})
         if artifact_id in catalog:
             del catalog[artifact_id]
+            self._touch()
             return True
         return False
 
@@ -765,3 +803,4 @@ class ConfigLoader:
             system.pop("active_analyzer", None)
         else:
             system["active_analyzer"] = analyzer_id
+        self._touch()
@@ -1,9 +1,10 @@
 import inspect
 import os
 import random
+import re
 import threading
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Callable, Dict, Optional
@@ -14,6 +15,7 @@ from aurarouter.event_reporter import EventReporter
 from aurarouter.providers import get_provider, BaseProvider
 from aurarouter.providers.ollama import OllamaProvider
 from aurarouter.savings.models import GenerateResult, UsageRecord
+from aurarouter.worker_pool import bounded_map
 
 logger = get_logger("AuraRouter.Fabric")
 
@@ -124,6 +126,21 @@ def compile_modifications_schema(
     return schema
 
 
+_BATCH_MARKER = re.compile(r"^[ \t]*\[(\d+)\][ \t]*", re.MULTILINE)
+
+
+def _split_batch_reply(text: str, count: int) -> list[str] | None:
+    """Split a ``[n]``-marked reply into *count* answers, or ``None``."""
+    matches = list(_BATCH_MARKER.finditer(text))
+    if [int(m.group(1)) for m in matches] != list(range(1, count + 1)):
+        return None
+    answers = [
+        text[m.end():nxt.start() if nxt else len(text)].strip()
+        for m, nxt in zip(matches, matches[1:] + [None])
+    ]
+    return answers if all(answers) else None
+
+
 class ComputeFabric:
     """N-model routing with graceful degradation.
 
@@ -135,6 +152,9 @@ class ComputeFabric:
                  feedback_store=None, **kwargs):
         self._config = config
         self._provider_cache: Dict[str, BaseProvider] = {}
+        # role -> ((config revision, config dict id), local chain)
+        self._local_chains: Dict[str, tuple[tuple[int, int], list[str]]] = {}
+        self._known_models: tuple[tuple[int, int], frozenset[str]] | None = None
         self._ollama_discovery = ollama_discovery
         self._xlm_client = xlm_client
         self._feedback_store = feedback_store
@@ -175,8 +195,90 @@ class ComputeFabric:
         """Return max review-correct iterations from config."""
         return self._config.config.get("execution", {}).get("max_review_iterations", 3)
 
+    def get_max_plan_concurrency(self) -> int:
+        """Return how many independent plan steps may run at once, default 8."""
+        return max(
+            1, int(self._config.config.get("execution", {}).get("max_plan_concurrency", 8))
+        )
+
+    def get_plan_batch_size(self) -> int:
+        """Return how many plan steps may share one prompt, default 1.
+
+        The default of 1 sends every step in its own call; larger values
+        opt in to batching.
+        """
+        return max(
+            1, int(self._config.config.get("execution", {}).get("plan_batch_size", 1))
+        )
+
+    def get_plan_step_retries(self) -> int:
+        """Return how often a failed plan step is retried, default 0."""
+        return max(
+            0, int(self._config.config.get("execution", {}).get("plan_step_retries", 0))
+        )
+
+    def get_max_consecutive_step_failures(self) -> int:
+        """Return how many failed plan steps in a row stop a plan, default 2.
+
+        A value of 0 never stops early.
+        """
+        return max(
+            0,
+            int(self._config.config.get("execution", {}).get(
+                "max_consecutive_step_failures", 2
+            )),
+        )
+
+    def get_plan_token_budget(self) -> int:
+        """Return the estimated prompt tokens a plan may send, default 0.
+
+        A value of 0 means no budget.
+        """
+        return max(
+            0, int(self._config.config.get("execution", {}).get("plan_token_budget", 0))
+        )
+
+    def get_plan_checkpoints(self) -> bool:
+        """Return whether plans checkpoint their progress to disk, default False."""
+        return bool(self._config.config.get("execution", {}).get("plan_checkpoints", False))
+
+    def get_max_provider_concurrency(self) -> int:
+        """Return how many compare calls one provider may serve at once.
+
+        Defaults to 0, meaning no per-provider limit.
+        """
+        return max(
+            0,
+            int(self._config.config.get("execution", {}).get("max_provider_concurrency", 0)),
+        )
+
     def get_local_chain(self, role: str) -> list[str]:
-        """Return only non-cloud models from the role's chain."""
+        """Return only non-cloud models from the role's chain.
+
+        The filtered chain is cached per role until the config changes
+        through its mutation methods, is replaced, or :meth:`update_config`
+        is called.
+        """
+        stamp = (self._config.revision, id(self._config.config))
+        cached = self._local_chains.get(role)
+        if cached is not None and cached[0] == stamp:
+            return list(cached[1])
+        local = self._filter_local_chain(role)
+        self._local_chains[role] = (stamp, local)
+        return list(local)
+
+    def known_model_ids(self) -> frozenset[str]:
+        """Return the IDs of all configured models.
+
+        Cached like :meth:`get_local_chain` and rebuilt when the config
+        changes.
+        """
+        stamp = (self._config.revision, id(self._config.config))
+        if self._known_models is None or self._known_models[0] != stamp:
+            self._known_models = (stamp, frozenset(self._config.get_all_model_ids()))
+        return self._known_models[1]
+
+    def _filter_local_chain(self, role: str) -> list[str]:
         from aurarouter.savings.pricing import is_cloud_tier
         chain = self._config.get_role_chain(role)
         local: list[str] = []
@@ -327,6 +429,8 @@ class ComputeFabric:
     def update_config(self, new_config):
         self._config = new_config
         self._provider_cache.clear()
+        self._local_chains.clear()
+        self._known_models = None
 
     # ------------------------------------------------------------------
     # Provider resolution
@@ -349,7 +453,7 @@ class ComputeFabric:
             endpoints = self._ollama_discovery.get_available_endpoints()
             if endpoints:
                 provider.config["endpoints"] = endpoints
-                logger.debug(f"Injected {len(endpoints)} discovered endpoints for {model_id}")
+                logger.debug("Injected %d discovered endpoints for %s", len(endpoints), model_id)
         return provider
 
     # ------------------------------------------------------------------
@@ -743,7 +847,7 @@ class ComputeFabric:
 
             provider_name = model_cfg.get("provider", "")
             hosting_tier = model_cfg.get("hosting_tier")
-            logger.info(f"[{role.upper()}] Routing to: {model_id} ({provider_name})")
+            logger.info("[%s] Routing to: %s (%s)", role.upper(), model_id, provider_name)
 
             # Budget check for cloud models
             if self._budget_manager is not None:
@@ -794,7 +898,7 @@ class ComputeFabric:
                     result.model_id = result.model_id or model_id
                     result.provider = result.provider or provider_name
                     result.routing_context = routing_context  # TG4
-                    logger.info(f"[{role.upper()}] Success from {model_id}.")
+                    logger.info("[%s] Success from %s.", role.upper(), model_id)
                     self._fire_callback(on_model_tried, role, model_id, True, elapsed,
                                         result.input_tokens, result.output_tokens)
                     self._report_usage(role, model_id, True, elapsed,
@@ -832,6 +936,37 @@ class ComputeFabric:
         )
         return None
 
+    # ------------------------------------------------------------------
+    # execute_batch (several queries, one prompt)
+    # ------------------------------------------------------------------
+
+    def execute_batch(
+        self,
+        role: str,
+        shared_prefix: str,
+        queries: list[str],
+        **execute_kwargs,
+    ) -> list[str] | None:
+        """Answer several queries with one call through the role's chain.
+
+        The queries are numbered ``[1]``, ``[2]``, ... after
+        *shared_prefix*, so the prefix is sent once instead of once per
+        query.  Returns one answer per query, in order, or ``None`` when
+        the call fails or the reply does not contain a non-empty answer
+        for every marker; callers then fall back to one call per query.
+        """
+        numbered = "\n".join(f"[{i}] {q}" for i, q in enumerate(queries, 1))
+        prompt = (
+            f"{shared_prefix}\n"
+            "Answer every numbered item below. Start each answer with its "
+            "marker alone on a line, e.g. [1], and answer items in order.\n"
+            f"{numbered}"
+        )
+        result = self.execute(role, prompt, **execute_kwargs)
+        if not result or not result.text:
+            return None
+        return _split_batch_reply(result.text, len(queries))
+
     # ------------------------------------------------------------------
     # execute_all (compare models)
     # ------------------------------------------------------------------
@@ -842,46 +977,120 @@ class ComputeFabric:
         prompt: str,
         model_ids: list[str] | None = None,
         json_mode: bool = False,
+        max_concurrency: int = 8,
     ) -> list[dict]:
-        """Execute a prompt across all models in a role chain and collect results."""
+        """Execute a prompt across all models in a role chain and collect results.
+
+        Every model call is submitted before any result is awaited, so the
+        comparison takes roughly as long as the slowest model rather than
+        the sum of all of them.  At most *max_concurrency* calls are in
+        flight at once, and at most ``execution.max_provider_concurrency``
+        per provider.  Results keep the order of the chain.
+        """
         chain = model_ids if model_ids is not None else self._config.get_role_chain(role)
-        results: list[dict] = []
+        if len(chain) <= 1 or max_concurrency <= 1:
+            results = [self._execute_one(m, prompt, json_mode) for m in chain]
+        else:
+            results = [None] * len(chain)
+            for i, result in bounded_map(
+                self._compare_call(chain, prompt, json_mode), chain, max_concurrency,
+            ):
+                results[i] = result
+        return [r for r in results if r is not None]
+
+    def iter_all(
+        self,
+        role: str,
+        prompt: str,
+        model_ids: list[str] | None = None,
+        json_mode: bool = False,
+        max_concurrency: int = 8,
+    ) -> Iterator[dict]:
+        """Like :meth:`execute_all`, but yield each result as its model finishes.
 
-        for model_id in chain:
-            model_cfg = self._config.get_model_config(model_id)
-            if not model_cfg:
-                continue
+        The first result arrives after the fastest model rather than the
+        slowest.  Closing the iterator early cancels calls not yet started.
+        """
+        chain = model_ids if model_ids is not None else self._config.get_role_chain(role)
+        if len(chain) <= 1 or max_concurrency <= 1:
+            for model_id in chain:
+                result = self._execute_one(model_id, prompt, json_mode)
+                if result is not None:
+                    yield result
+            return
+        results = bounded_map(
+            self._compare_call(chain, prompt, json_mode), chain, max_concurrency,
+        )
+        try:
+            for _i, result in results:
+                if result is not None:
+                    yield result
+        finally:
+            results.close()
+
+    def _compare_call(
+        self, chain: list[str], prompt: str, json_mode: bool,
+    ) -> Callable[[str], dict | None]:
+        """Return the per-model call for a concurrent :meth:`execute_all`.
+
+        With ``execution.max_provider_concurrency`` set, models of the same
+        provider share a semaphore, so one backend (e.g. a single Ollama
+        server) is not sent more requests than it can serve at once.
+        """
+        limit = self.get_max_provider_concurrency()
+        if limit <= 0:
+            return lambda m: self._execute_one(m, prompt, json_mode)
+        provider_of = {
+            m: (self._config.get_model_config(m) or {}).get("provider", "")
+            for m in chain
+        }
+        slots = {p: threading.Semaphore(limit) for p in set(provider_of.values())}
+
+        def call(model_id: str) -> dict | None:
+            with slots[provider_of[model_id]]:
+                return self._execute_one(model_id, prompt, json_mode)
+
+        return call
+
+    def _execute_one(
+        self, model_id: str, prompt: str, json_mode: bool,
+    ) -> dict | None:
+        """Run *prompt* on one model for :meth:`execute_all`.
+
+        Returns ``None`` for unknown or unavailable models.
+        """
+        model_cfg = self._config.get_model_config(model_id)
+        if not model_cfg:
+            return None
 
-            provider_name = model_cfg.get("provider", "")
-            start = time.monotonic()
-            try:
-                provider = self._get_provider(model_id)
-                if provider is None:
-                    continue
-                gen_result = provider.generate_with_usage(prompt, json_mode=json_mode)
-                elapsed = time.monotonic() - start
-                results.append({
-                    "model_id": model_id,
-                    "provider": provider_name,
-                    "success": True,
-                    "text": gen_result.text,
-                    "input_tokens": gen_result.input_tokens,
-                    "output_tokens": gen_result.output_tokens,
-                    "elapsed_s": round(elapsed, 3),
-                })
-            except Exception as e:
-                elapsed = time.monotonic() - start
-                results.append({
-                    "model_id": model_id,
-                    "provider": provider_name,
-                    "success": False,
-                    "text": f"ERROR: {e}",
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "elapsed_s": round(elapsed, 3),
-                })
-
-        return results
+        provider_name = model_cfg.get("provider", "")
+        start = time.monotonic()
+        try:
+            provider = self._get_provider(model_id)
+            if provider is None:
+                return None
+            gen_result = provider.generate_with_usage(prompt, json_mode=json_mode)
+            elapsed = time.monotonic() - start
+            return {
+                "model_id": model_id,
+                "provider": provider_name,
+                "success": True,
+                "text": gen_result.text,
+                "input_tokens": gen_result.input_tokens,
+                "output_tokens": gen_result.output_tokens,
+                "elapsed_s": round(elapsed, 3),
+            }
+        except Exception as e:
+            elapsed = time.monotonic() - start
+            return {
+                "model_id": model_id,
+                "provider": provider_name,
+                "success": False,
+                "text": f"ERROR: {e}",
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "elapsed_s": round(elapsed, 3),
+            }
 
     # ------------------------------------------------------------------
     # execute_session (session-aware execution)
@@ -928,7 +1137,10 @@ class ComputeFabric:
                 max_continuations = 3
                 continuations = 0
                 while result and result.finish_reason == "length" and continuations < max_continuations:
-                    logger.info(f"[{role.upper()}] Response truncated (length), auto-continuing... ({continuations+1}/{max_continuations})")
+                    logger.info(
+                        "[%s] Response truncated (length), auto-continuing... (%d/%d)",
+                        role.upper(), continuations + 1, max_continuations,
+                    )
                     
                     # Add partial response to history and ask for continuation
                     messages_with_partial = list(messages)
@@ -1038,7 +1250,7 @@ class ComputeFabric:
                 continue
 
             provider_name = model_cfg.get("provider")
-            logger.info(f"[{role.upper()}] Streaming from: {model_id} ({provider_name})")
+            logger.info("[%s] Streaming from: %s (%s)", role.upper(), model_id, provider_name)
 
             provider = self._get_provider(model_id)
             if provider is None:
@@ -1059,7 +1271,7 @@ class ComputeFabric:
             except Exception as e:
                 if tokens_yielded:
                     raise
-                logger.warning(f"{model_id} streaming failed: {e}")
+                logger.warning("%s streaming failed: %s", model_id, e)
                 if on_model_tried:
                     on_model_tried(role, model_id, False, 0.0)
                 self._report_usage(role, model_id, False, 0.0)
@@ -10,7 +10,7 @@ from __future__ import annotations
 import math
 from typing import Optional
 
-from PySide6.QtCore import QRectF, Qt, Signal
+from PySide6.QtCore import QEvent, QPointF, QRectF, Qt, QTimer, Signal
 from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
 from PySide6.QtWidgets import (
     QDialog,
@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QTextEdit,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
@@ -50,10 +51,44 @@ _STATUS_BG: dict[NodeStatus, QColor] = {
     NodeStatus.SKIPPED: QColor("#f5f5f5"),
 }
 
+# Per-status paint dispatch: (background, (border pen, hover border pen)).
+# The pen pair is indexed by ``is_hover`` so _draw_node never branches or
+# allocates pens.
+_STATUS_STYLE: dict[NodeStatus, tuple[QColor, tuple[QPen, QPen]]] = {
+    status: (
+        _STATUS_BG[status],
+        (QPen(_STATUS_BORDER[status], 1.5), QPen(_STATUS_BORDER[status], 2.0)),
+    )
+    for status in NodeStatus
+}
+_DEFAULT_STYLE = _STATUS_STYLE[NodeStatus.PENDING]
+
+# Pens and stylesheets reused across every paint / reset.
+_EDGE_COLOR = QColor("#757575")
+_EDGE_PEN = QPen(_EDGE_COLOR, 1.5)
+_LABEL_PEN = QPen(QColor("#212121"))
+_SUB_PEN = QPen(QColor("#616161"))
+_SUMMARY_STYLE = "color: #616161; font-size: 11px;"
+
 # ------------------------------------------------------------------
 # Layout constants
 # ------------------------------------------------------------------
 
+# Sentinel for single-lookup ``dict.get`` probes.
+_MISSING = object()
+
+# TraceNode fields that ``update_node`` copies through unchanged.
+_SIMPLE_NODE_FIELDS = (
+    "model_id",
+    "elapsed_s",
+    "input_tokens",
+    "output_tokens",
+    "result_preview",
+)
+
+# Coalescing window for model-attempt repaints (fallback storms).
+_ATTEMPT_FLUSH_MS = 50
+
 _NODE_W = 140
 _NODE_H = 52
 _H_GAP = 40
@@ -119,19 +154,39 @@ class _DAGCanvas(QWidget):
         super().__init__(parent)
         self._trace = ExecutionTrace()
         self._node_rects: dict[str, QRectF] = {}
+        # Connector geometry, rebuilt on relayout and reused by every paint.
+        self._edge_path = QPainterPath()
+        self._arrow_path = QPainterPath()
         self.setMouseTracking(True)
         self._hover_node: Optional[str] = None
+        # node id -> rendered tooltip; built only when the user hovers and
+        # dropped by invalidate_tooltip whenever the node changes.
+        self._tooltip_cache: dict[str, str] = {}
+
+        self._label_font = QFont()
+        self._label_font.setPointSize(9)
+        self._label_font.setBold(True)
+        self._sub_font = QFont()
+        self._sub_font.setPointSize(8)
 
     def set_trace(self, trace: ExecutionTrace) -> None:
+        if trace is not self._trace:
+            self._tooltip_cache.clear()
         self._trace = trace
         self._layout_nodes()
         self.update()
 
+    def invalidate_tooltip(self, node_id: str) -> None:
+        """Forget the rendered tooltip of *node_id* after it changes."""
+        self._tooltip_cache.pop(node_id, None)
+
     # ---- layout ----
 
     def _layout_nodes(self) -> None:
         """Left-to-right topological layout: columns by depth, rows within."""
         self._node_rects.clear()
+        self._edge_path = QPainterPath()
+        self._arrow_path = QPainterPath()
         if not self._trace.nodes:
             self.setMinimumSize(0, 0)
             return
@@ -162,6 +217,8 @@ class _DAGCanvas(QWidget):
                 y = _MARGIN + row_idx * (_NODE_H + _V_GAP)
                 self._node_rects[nid] = QRectF(x, y, _NODE_W, _NODE_H)
 
+        self._build_edge_paths()
+
         if self._node_rects:
             max_x = max(r.right() for r in self._node_rects.values()) + _MARGIN
             max_y = max(r.bottom() for r in self._node_rects.values()) + _MARGIN
@@ -169,18 +226,8 @@ class _DAGCanvas(QWidget):
             max_x = max_y = 0
         self.setMinimumSize(int(max_x), int(max_y))
 
-    # ---- painting ----
-
-    def paintEvent(self, event) -> None:
-        if not self._trace.nodes:
-            return
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Edges (behind nodes).
-        edge_pen = QPen(QColor("#757575"), 1.5)
-        painter.setPen(edge_pen)
+    def _build_edge_paths(self) -> None:
+        """Collect every parent -> child connector into two cached paths."""
         for node in self._trace.nodes.values():
             child_rect = self._node_rects.get(node.id)
             if child_rect is None:
@@ -193,8 +240,23 @@ class _DAGCanvas(QWidget):
                 y1 = parent_rect.center().y()
                 x2 = child_rect.left()
                 y2 = child_rect.center().y()
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-                self._draw_arrowhead(painter, x1, y1, x2, y2)
+                self._edge_path.moveTo(x1, y1)
+                self._edge_path.lineTo(x2, y2)
+                self._add_arrowhead(self._arrow_path, x1, y1, x2, y2)
+
+    # ---- painting ----
+
+    def paintEvent(self, event) -> None:
+        if not self._trace.nodes:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Edges (behind nodes).
+        painter.setPen(_EDGE_PEN)
+        painter.drawPath(self._edge_path)
+        painter.fillPath(self._arrow_path, _EDGE_COLOR)
 
         # Nodes.
         for nid, rect in self._node_rects.items():
@@ -207,31 +269,24 @@ class _DAGCanvas(QWidget):
     def _draw_node(
         self, painter: QPainter, node: TraceNode, rect: QRectF
     ) -> None:
-        border = _STATUS_BORDER.get(node.status, QColor("#bdbdbd"))
-        bg = _STATUS_BG.get(node.status, QColor("#fafafa"))
+        bg, border_pens = _STATUS_STYLE.get(node.status, _DEFAULT_STYLE)
 
         path = QPainterPath()
         path.addRoundedRect(rect, 6, 6)
         painter.fillPath(path, bg)
 
-        pen_w = 2.0 if node.id == self._hover_node else 1.5
-        painter.setPen(QPen(border, pen_w))
+        painter.setPen(border_pens[node.id == self._hover_node])
         painter.drawRoundedRect(rect, 6, 6)
 
         # Label (top line).
-        painter.setPen(QPen(QColor("#212121")))
-        font = QFont()
-        font.setPointSize(9)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setPen(_LABEL_PEN)
+        painter.setFont(self._label_font)
         label_rect = QRectF(rect.x() + 4, rect.y() + 4, rect.width() - 8, 18)
         painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, node.label)
 
         # Sub-text (bottom line).
-        font.setBold(False)
-        font.setPointSize(8)
-        painter.setFont(font)
-        painter.setPen(QPen(QColor("#616161")))
+        painter.setFont(self._sub_font)
+        painter.setPen(_SUB_PEN)
         sub_rect = QRectF(rect.x() + 4, rect.y() + 24, rect.width() - 8, 16)
         sub = node.model_id or node.status.value
         if node.elapsed_s > 0:
@@ -239,8 +294,8 @@ class _DAGCanvas(QWidget):
         painter.drawText(sub_rect, Qt.AlignmentFlag.AlignCenter, sub)
 
     @staticmethod
-    def _draw_arrowhead(
-        painter: QPainter,
+    def _add_arrowhead(
+        path: QPainterPath,
         x1: float,
         y1: float,
         x2: float,
@@ -253,12 +308,47 @@ class _DAGCanvas(QWidget):
         p2x = x2 - size * math.cos(angle + 0.4)
         p2y = y2 - size * math.sin(angle + 0.4)
 
-        path = QPainterPath()
         path.moveTo(x2, y2)
         path.lineTo(p1x, p1y)
         path.lineTo(p2x, p2y)
         path.closeSubpath()
-        painter.fillPath(path, QColor("#757575"))
+
+    # ---- tooltips ----
+
+    def event(self, event) -> bool:
+        if event.type() == QEvent.Type.ToolTip:
+            nid = self._node_at(QPointF(event.pos()))
+            text = self._tooltip_for(nid) if nid is not None else ""
+            if text:
+                QToolTip.showText(event.globalPos(), text, self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+
+    def _node_at(self, pos: QPointF) -> Optional[str]:
+        for nid, rect in self._node_rects.items():
+            if rect.contains(pos):
+                return nid
+        return None
+
+    def _tooltip_for(self, node_id: str) -> str:
+        """Return the attempt-history tooltip for *node_id* (cached)."""
+        node = self._trace.nodes.get(node_id)
+        if node is None:
+            return ""
+        cached = self._tooltip_cache.get(node_id)
+        if cached is not None:
+            return cached
+
+        lines = [f"{node.label} [{node.status.value}]"]
+        for i, att in enumerate(node.attempts):
+            status = "OK" if att.success else "FAIL"
+            lines.append(f"#{i + 1} {att.model_id}: {status} ({att.elapsed_s:.2f}s)")
+        text = "\n".join(lines)
+        self._tooltip_cache[node_id] = text
+        return text
 
     # ---- mouse interaction ----
 
@@ -306,6 +396,18 @@ class DAGVisualizer(QWidget):
         self._trace = ExecutionTrace()
         self._expanded = False
 
+        # role -> node ids in insertion order, for the trace object in
+        # ``_indexed_trace``.  Rebuilt lazily if ``_trace`` is swapped.
+        self._role_nodes: dict[str, list[str]] = {}
+        self._indexed_trace: Optional[ExecutionTrace] = self._trace
+
+        # Attempt updates mutate the trace immediately but repaint at most
+        # once per flush interval.
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_ATTEMPT_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._refresh)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -322,7 +424,7 @@ class DAGVisualizer(QWidget):
         header_layout.addWidget(self._toggle_btn)
 
         self._summary_label = QLabel("Execution trace")
-        self._summary_label.setStyleSheet("color: #616161; font-size: 11px;")
+        self._summary_label.setStyleSheet(_SUMMARY_STYLE)
         header_layout.addWidget(self._summary_label, 1)
 
         layout.addWidget(self._header)
@@ -342,13 +444,22 @@ class DAGVisualizer(QWidget):
 
     def reset(self) -> None:
         """Clear the trace and collapse."""
+        self._flush_timer.stop()
         self._trace = ExecutionTrace()
+        self._role_nodes = {}
+        self._indexed_trace = self._trace
         self._expanded = False
-        self._canvas.setVisible(False)
-        self._canvas.set_trace(self._trace)
-        self._toggle_btn.setText("\u25b6")
-        self._summary_label.setText("Execution trace")
-        self.setMaximumHeight(32)
+        # Batch the widget changes below into a single repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            self._canvas.setVisible(False)
+            self._canvas.set_trace(self._trace)
+            self._toggle_btn.setText("\u25b6")
+            self._summary_label.setText("Execution trace")
+            self.setMaximumHeight(32)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def add_node(self, data: dict) -> None:
         """Add a node from a dict emitted by InferenceWorker."""
@@ -364,7 +475,13 @@ class DAGVisualizer(QWidget):
             output_tokens=data.get("output_tokens", 0),
             result_preview=data.get("result_preview", ""),
         )
+        if self._indexed_trace is self._trace:
+            if node.id in self._trace.nodes:
+                self._indexed_trace = None  # replaced node: reindex lazily
+            else:
+                self._role_nodes.setdefault(node.role, []).append(node.id)
         self._trace.add_node(node)
+        self._canvas.invalidate_tooltip(node.id)
         self._refresh()
 
     def update_node(self, node_id: str, updates: dict) -> None:
@@ -373,23 +490,22 @@ class DAGVisualizer(QWidget):
         if node is None:
             return
 
-        if "status" in updates:
-            node.status = NodeStatus(updates["status"])
-        if "model_id" in updates:
-            node.model_id = updates["model_id"]
-        if "elapsed_s" in updates:
-            node.elapsed_s = updates["elapsed_s"]
-        if "input_tokens" in updates:
-            node.input_tokens = updates["input_tokens"]
-        if "output_tokens" in updates:
-            node.output_tokens = updates["output_tokens"]
-        if "result_preview" in updates:
-            node.result_preview = updates["result_preview"]
-        if "attempts" in updates:
+        # One dict probe per field: .get with a sentinel instead of
+        # ``key in updates`` followed by ``updates[key]``.
+        status = updates.get("status", _MISSING)
+        if status is not _MISSING:
+            node.status = NodeStatus(status)
+        for field_name in _SIMPLE_NODE_FIELDS:
+            value = updates.get(field_name, _MISSING)
+            if value is not _MISSING:
+                setattr(node, field_name, value)
+        attempts = updates.get("attempts", _MISSING)
+        if attempts is not _MISSING:
             node.attempts = [
                 ModelAttempt(**a) if isinstance(a, dict) else a
-                for a in updates["attempts"]
+                for a in attempts
             ]
+        self._canvas.invalidate_tooltip(node_id)
         self._refresh()
 
     # ------------------------------------------------------------------
@@ -400,27 +516,37 @@ class DAGVisualizer(QWidget):
         self, role: str, model_id: str, success: bool, elapsed: float
     ) -> None:
         """Record a model attempt on the most recent RUNNING node for *role*."""
+        node_ids = self._node_ids_for_role(role)
+        if not node_ids:
+            return  # role not present in this trace
+
+        # Walk only this role's nodes, newest first: prefer a RUNNING
+        # node, else fall back to the newest one.
+        nodes = self._trace.nodes
         target: TraceNode | None = None
-        for node in reversed(list(self._trace.nodes.values())):
-            if node.role == role and node.status == NodeStatus.RUNNING:
+        fallback: TraceNode | None = None
+        for nid in reversed(node_ids):
+            node = nodes[nid]
+            if node.status == NodeStatus.RUNNING:
                 target = node
                 break
+            if fallback is None:
+                fallback = node
         if target is None:
-            for node in reversed(list(self._trace.nodes.values())):
-                if node.role == role:
-                    target = node
-                    break
+            target = fallback
         if target is None:
             return
 
         target.attempts.append(
             ModelAttempt(model_id=model_id, success=success, elapsed_s=elapsed)
         )
+        self._canvas.invalidate_tooltip(target.id)
         if success:
             target.model_id = model_id
             target.elapsed_s = elapsed
             target.status = NodeStatus.SUCCESS
-        self._refresh()
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def on_intent_detected(self, intent: str) -> None:
         """Mark classify node done; skip reasoning if SIMPLE_CODE."""
@@ -436,12 +562,21 @@ class DAGVisualizer(QWidget):
                     and node.status == NodeStatus.PENDING
                 ):
                     node.status = NodeStatus.SKIPPED
+                    self._canvas.invalidate_tooltip(node.id)
         self._refresh()
 
     # ==================================================================
     # Internal
     # ==================================================================
 
+    def _node_ids_for_role(self, role: str) -> Optional[list[str]]:
+        if self._indexed_trace is not self._trace:
+            self._role_nodes = {}
+            for node in self._trace.nodes.values():
+                self._role_nodes.setdefault(node.role, []).append(node.id)
+            self._indexed_trace = self._trace
+        return self._role_nodes.get(role)
+
     def _toggle_expanded(self) -> None:
         self._expanded = not self._expanded
         self._canvas.setVisible(self._expanded)
@@ -449,6 +584,7 @@ class DAGVisualizer(QWidget):
         self.setMaximumHeight(232 if self._expanded else 32)
 
     def _refresh(self) -> None:
+        self._flush_timer.stop()
         self._canvas.set_trace(self._trace)
         self._summary_label.setText(
             self._trace.summary() or "Execution trace"
@@ -624,10 +624,21 @@ class ModelsPanel(QWidget):
         self._bg_thread: Optional[QThread] = None
         self._bg_worker: Optional[QObject] = None
 
+        # Refreshes requested while hidden are deferred to showEvent.
+        self._dirty_models = False
+        self._dirty_catalog = False
+
         self._build_ui()
         self._refresh_models()
         self._refresh_catalog()
 
+    def showEvent(self, event) -> None:  # noqa: N802
+        super().showEvent(event)
+        if self._dirty_models:
+            self._do_refresh_models()
+        if self._dirty_catalog:
+            self._do_refresh_catalog()
+
     # ==================================================================
     # UI construction
     # ==================================================================
@@ -909,7 +920,15 @@ class ModelsPanel(QWidget):
     # ==================================================================
 
     def _refresh_models(self) -> None:
+        """Reload models now, or on next show if the panel is hidden."""
+        if not self.isVisible():
+            self._dirty_models = True
+            return
+        self._do_refresh_models()
+
+    def _do_refresh_models(self) -> None:
         """Reload all models from the API and rebuild cards."""
+        self._dirty_models = False
         # Clear existing cards
         for card in self._cards:
             self._cards_layout.removeWidget(card)
@@ -1306,7 +1325,15 @@ class ModelsPanel(QWidget):
     # ==================================================================
 
     def _refresh_catalog(self) -> None:
+        """Rediscover providers now, or on next show if the panel is hidden."""
+        if not self.isVisible():
+            self._dirty_catalog = True
+            return
+        self._do_refresh_catalog()
+
+    def _do_refresh_catalog(self) -> None:
         """Discover catalog providers in background."""
+        self._dirty_catalog = False
         self._cleanup_bg_thread()
 
         worker = _CatalogRefreshWorker(self._api)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from PySide6.QtCore import QObject, QThread, Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QComboBox,
@@ -34,6 +34,10 @@ _SEVERITY_FILTERS = ["All", "High", "Medium", "Low"]
 
 _SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2}
 
+# Delay before rendering the detail panel, so arrowing through the event
+# log only renders the final selection.
+_DETAIL_DEBOUNCE_MS = 60
+
 _SEVERITY_COLORS = {
     "high": "#dc3545",
     "medium": "#fd7e14",
@@ -70,22 +74,33 @@ def _max_severity(severities: list[str]) -> str:
 # ------------------------------------------------------------------
 
 
-class _PrivacyWorker(QObject):
-    """Queries PrivacyStore off the main thread."""
+class _PrivacySignals(QObject):
+    """Long-lived signal carrier shared by every ``_PrivacyWorker`` run."""
 
     finished = Signal(dict)
     error = Signal(str)
 
+
+class _PrivacyWorker(QRunnable):
+    """Queries PrivacyStore on a pooled thread.
+
+    Runs on ``QThreadPool.globalInstance()`` so refreshes reuse an idle
+    pool thread instead of creating and tearing down a ``QThread`` each
+    time.  Results are reported through the tab-owned *signals* object.
+    """
+
     def __init__(
         self,
         store: PrivacyStore,
         time_range: str,
         severity_filter: str,
+        signals: _PrivacySignals,
     ) -> None:
         super().__init__()
         self._store = store
         self._time_range = time_range
         self._severity_filter = severity_filter
+        self._signals = signals
 
     def run(self) -> None:
         try:
@@ -114,6 +129,7 @@ class _PrivacyWorker(QObject):
             # Pattern breakdown.
             pattern_data: dict[str, dict] = {}
             for ev in events:
+                ev_ts = ev.get("ts_epoch_ms", 0)
                 for i, name in enumerate(ev["pattern_names"]):
                     sev = (
                         ev["severities"][i]
@@ -122,10 +138,17 @@ class _PrivacyWorker(QObject):
                     )
                     bucket = pattern_data.setdefault(
                         name,
-                        {"count": 0, "most_recent": "", "severity": sev},
+                        {
+                            "count": 0,
+                            "most_recent": "",
+                            "severity": sev,
+                            "_ts_epoch_ms": -1,
+                        },
                     )
                     bucket["count"] += 1
-                    if ev["timestamp"] > bucket["most_recent"]:
+                    # Compare on the integer epoch; keep the ISO string for display.
+                    if ev_ts >= bucket["_ts_epoch_ms"]:
+                        bucket["_ts_epoch_ms"] = ev_ts
                         bucket["most_recent"] = ev["timestamp"]
                     # Keep highest severity seen for this pattern.
                     if _SEVERITY_RANK.get(sev, 0) > _SEVERITY_RANK.get(
@@ -134,7 +157,15 @@ class _PrivacyWorker(QObject):
                         bucket["severity"] = sev
 
             pattern_rows = sorted(
-                [{"name": k, **v} for k, v in pattern_data.items()],
+                [
+                    {
+                        "name": k,
+                        "count": v["count"],
+                        "most_recent": v["most_recent"],
+                        "severity": v["severity"],
+                    }
+                    for k, v in pattern_data.items()
+                ],
                 key=lambda r: r["count"],
                 reverse=True,
             )
@@ -144,7 +175,7 @@ class _PrivacyWorker(QObject):
                 events, key=lambda e: e["timestamp"], reverse=True
             )
 
-            self.finished.emit(
+            self._signals.finished.emit(
                 {
                     "total": len(events),
                     "high": high_count,
@@ -156,7 +187,7 @@ class _PrivacyWorker(QObject):
             )
 
         except Exception as exc:
-            self.error.emit(str(exc))
+            self._signals.error.emit(str(exc))
 
 
 # ------------------------------------------------------------------
@@ -171,8 +202,16 @@ class PrivacyAuditTab(QWidget):
         super().__init__(parent)
 
         self._store: Optional[PrivacyStore] = None
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[_PrivacyWorker] = None
+        self._busy = False
+        self._signals = _PrivacySignals(self)
+        self._signals.finished.connect(self._apply_data)
+        self._signals.error.connect(self._on_worker_error)
+
+        self._pending_row: int = -1
+        self._detail_timer = QTimer(self)
+        self._detail_timer.setSingleShot(True)
+        self._detail_timer.setInterval(_DETAIL_DEBOUNCE_MS)
+        self._detail_timer.timeout.connect(self._render_selected_event)
 
         self._build_ui()
 
@@ -188,26 +227,18 @@ class PrivacyAuditTab(QWidget):
         """Kick off a background query with current filters."""
         if self._store is None:
             return
-        if self._thread is not None and self._thread.isRunning():
+        if self._busy:
             return
 
         time_range = self._range_combo.currentText()
         severity_filter = self._severity_combo.currentText()
 
-        self._worker = _PrivacyWorker(self._store, time_range, severity_filter)
-        self._thread = QThread()
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._apply_data)
-        self._worker.error.connect(self._on_worker_error)
-
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.error.connect(self._thread.quit)
-        self._thread.finished.connect(self._cleanup_thread)
-
+        worker = _PrivacyWorker(
+            self._store, time_range, severity_filter, self._signals
+        )
+        self._busy = True
         self._refresh_btn.setEnabled(False)
-        self._thread.start()
+        QThreadPool.globalInstance().start(worker)
 
     # ------------------------------------------------------------------
     # UI construction
@@ -358,6 +389,7 @@ class PrivacyAuditTab(QWidget):
             self._banner.setVisible(False)
 
         self._detail_label.setVisible(False)
+        self._busy = False
         self._refresh_btn.setEnabled(True)
 
     def _fill_pattern_table(self, rows: list[dict]) -> None:
@@ -414,7 +446,13 @@ class PrivacyAuditTab(QWidget):
     def _on_event_selected(
         self, row: int, _col: int, _prev_row: int, _prev_col: int
     ) -> None:
-        """Show match details when an event row is selected."""
+        """Schedule a detail render for the selected row (debounced)."""
+        self._pending_row = row
+        self._detail_timer.start()
+
+    def _render_selected_event(self) -> None:
+        """Show match details for the most recently selected event row."""
+        row = self._pending_row
         if row < 0:
             self._detail_label.setVisible(False)
             return
@@ -448,12 +486,5 @@ class PrivacyAuditTab(QWidget):
     # ------------------------------------------------------------------
 
     def _on_worker_error(self, message: str) -> None:
+        self._busy = False
         self._refresh_btn.setEnabled(True)
-
-    def _cleanup_thread(self) -> None:
-        if self._thread:
-            self._thread.deleteLater()
-            self._thread = None
-        if self._worker:
-            self._worker.deleteLater()
-            self._worker = None
@@ -1,53 +1,47 @@
 """Thread-safe controller for environment lifecycle operations.
 
-Wraps ``EnvironmentContext.start/stop/pause/resume/check_health`` in
-``QThread`` workers so the GUI remains responsive during potentially
-long-running operations (subprocess spawn, network health checks, etc.).
+Runs ``EnvironmentContext.start/stop/pause/resume/check_health`` as
+``QRunnable`` tasks on the global ``QThreadPool`` so the GUI remains
+responsive during potentially long-running operations (subprocess spawn,
+network health checks, etc.).
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from collections import deque
+from typing import Callable
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
 
 from aurarouter.gui.environment import EnvironmentContext, HealthStatus, ServiceState
 
 
 # ------------------------------------------------------------------
-# Generic one-shot worker
+# Pooled one-shot task
 # ------------------------------------------------------------------
 
-class _Worker(QObject):
-    finished = Signal()
-    error = Signal(str)
-
-    def __init__(self, fn):
-        super().__init__()
-        self._fn = fn
+class _Signals(QObject):
+    """Delivers ``_Task`` results back to the GUI thread."""
 
-    def run(self) -> None:
-        try:
-            self._fn()
-            self.finished.emit()
-        except Exception as exc:
-            self.error.emit(str(exc))
+    finished = Signal(object)
+    error = Signal(str)
 
 
-class _HealthWorker(QObject):
-    finished = Signal(object)  # HealthStatus
-    error = Signal(str)
+class _Task(QRunnable):
+    """Runs *fn* on a pool thread and reports through *signals*."""
 
-    def __init__(self, fn):
+    def __init__(self, fn, signals: _Signals):
         super().__init__()
         self._fn = fn
+        self._signals = signals
 
     def run(self) -> None:
         try:
             result = self._fn()
-            self.finished.emit(result)
         except Exception as exc:
-            self.error.emit(str(exc))
+            self._signals.error.emit(str(exc))
+            return
+        self._signals.finished.emit(result)
 
 
 # ------------------------------------------------------------------
@@ -70,11 +64,31 @@ class ServiceController(QObject):
     def __init__(self, context: EnvironmentContext, parent=None):
         super().__init__(parent)
         self._context = context
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[QObject] = None
 
-        # Forward context signals.
-        self._context.state_changed.connect(self.state_changed)
+        # Long-lived result bridges shared by every pooled task.  They are
+        # emitted from pool threads, hence the explicit QueuedConnection.
+        queued = Qt.ConnectionType.QueuedConnection
+        self._op_signals = _Signals(self)
+        self._op_signals.error.connect(self._on_error, queued)
+        self._health_signals = _Signals(self)
+        self._health_signals.finished.connect(self._on_health_done, queued)
+        self._health_signals.error.connect(self._on_error, queued)
+
+        # Operations run one at a time; requests made while one is in
+        # flight are queued and started from its completion signal, so
+        # the GUI thread never waits on a worker.
+        self._busy = False
+        self._pending: deque[tuple[Callable[[], object], _Signals]] = deque()
+        for signals in (self._op_signals, self._health_signals):
+            signals.finished.connect(self._on_task_done, queued)
+            signals.error.connect(self._on_task_done, queued)
+
+        # Forward context signals.  A signal-to-signal forward can be
+        # direct: receivers of ``state_changed`` still get their own
+        # thread-appropriate (auto) dispatch when it is re-emitted.
+        self._context.state_changed.connect(
+            self.state_changed, Qt.ConnectionType.DirectConnection
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -82,13 +96,14 @@ class ServiceController(QObject):
 
     def set_context(self, context: EnvironmentContext) -> None:
         """Replace the active context (e.g. after environment switch)."""
-        self._cleanup()
         try:
             self._context.state_changed.disconnect(self.state_changed)
         except RuntimeError:
             pass
         self._context = context
-        self._context.state_changed.connect(self.state_changed)
+        self._context.state_changed.connect(
+            self.state_changed, Qt.ConnectionType.DirectConnection
+        )
 
     def start_service(self) -> None:
         self._run_in_thread(self._context.start)
@@ -97,11 +112,7 @@ class ServiceController(QObject):
         self._run_in_thread(self._context.stop)
 
     def pause_service(self) -> None:
-        # Pause is lightweight — safe on main thread.
-        try:
-            self._context.pause()
-        except Exception as exc:
-            self.error.emit(str(exc))
+        self._run_in_thread(self._context.pause)
 
     def resume_service(self) -> None:
         self._run_in_thread(self._context.resume)
@@ -117,60 +128,25 @@ class ServiceController(QObject):
     # ------------------------------------------------------------------
 
     def _run_in_thread(self, fn) -> None:
-        self._cleanup()
-
-        worker = _Worker(fn)
-        thread = QThread()
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.finished.connect(thread.quit)
-        worker.error.connect(self._on_error)
-        worker.error.connect(thread.quit)
-        thread.finished.connect(lambda: self._on_thread_done(thread, worker))
-
-        self._thread = thread
-        self._worker = worker
-        thread.start()
+        self._submit(fn, self._op_signals)
 
     def _run_health_in_thread(self) -> None:
-        self._cleanup()
+        self._submit(self._context.check_health, self._health_signals)
 
-        worker = _HealthWorker(self._context.check_health)
-        thread = QThread()
-        worker.moveToThread(thread)
+    def _submit(self, fn: Callable[[], object], signals: _Signals) -> None:
+        if self._busy:
+            self._pending.append((fn, signals))
+            return
+        self._busy = True
+        QThreadPool.globalInstance().start(_Task(fn, signals))
 
-        thread.started.connect(worker.run)
-        worker.finished.connect(self._on_health_done)
-        worker.finished.connect(thread.quit)
-        worker.error.connect(self._on_error)
-        worker.error.connect(thread.quit)
-        thread.finished.connect(lambda: self._on_thread_done(thread, worker))
-
-        self._thread = thread
-        self._worker = worker
-        thread.start()
+    def _on_task_done(self, *_args) -> None:
+        self._busy = False
+        if self._pending:
+            self._submit(*self._pending.popleft())
 
     def _on_health_done(self, status: HealthStatus) -> None:
         self.health_result.emit(status)
 
     def _on_error(self, message: str) -> None:
         self.error.emit(message)
-
-    def _on_thread_done(self, thread: QThread, worker: QObject) -> None:
-        thread.deleteLater()
-        worker.deleteLater()
-        if self._thread is thread:
-            self._thread = None
-            self._worker = None
-
-    def _cleanup(self) -> None:
-        if self._thread is not None and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait(3000)
-        if self._thread is not None:
-            self._thread.deleteLater()
-            self._thread = None
-        if self._worker is not None:
-            self._worker.deleteLater()
-            self._worker = None
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import html
+
 from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QPainter, QPalette
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
-    QFrame,
     QHBoxLayout,
     QLabel,
     QProgressBar,
@@ -17,19 +19,34 @@ from PySide6.QtWidgets import (
 
 from aurarouter.gui.environment import HealthStatus, ServiceState
 
-# Mapping ServiceState → (colour, display text)
+# Mapping ServiceState → (state label stylesheet, display text), prebuilt
+# so applying a state is a lookup plus two setter calls.
 _STATE_DISPLAY: dict[str, tuple[str, str]] = {
-    ServiceState.STOPPED.value: ("#d32f2f", "Stopped"),
-    ServiceState.STARTING.value: ("#9e9e9e", "Starting..."),
-    ServiceState.LOADING_MODEL.value: ("#1565c0", "Loading model..."),
-    ServiceState.RUNNING.value: ("#388e3c", "Running"),
-    ServiceState.PAUSING.value: ("#9e9e9e", "Pausing..."),
-    ServiceState.PAUSED.value: ("#f9a825", "Paused"),
-    ServiceState.STOPPING.value: ("#9e9e9e", "Stopping..."),
-    ServiceState.ERROR.value: ("#d32f2f", "Error"),
+    ServiceState.STOPPED.value: ("color: #d32f2f; font-weight: bold;", "  Stopped"),
+    ServiceState.STARTING.value: ("color: #9e9e9e; font-weight: bold;", "  Starting..."),
+    ServiceState.LOADING_MODEL.value: ("color: #1565c0; font-weight: bold;", "  Loading model..."),
+    ServiceState.RUNNING.value: ("color: #388e3c; font-weight: bold;", "  Running"),
+    ServiceState.PAUSING.value: ("color: #9e9e9e; font-weight: bold;", "  Pausing..."),
+    ServiceState.PAUSED.value: ("color: #f9a825; font-weight: bold;", "  Paused"),
+    ServiceState.STOPPING.value: ("color: #9e9e9e; font-weight: bold;", "  Stopping..."),
+    ServiceState.ERROR.value: ("color: #d32f2f; font-weight: bold;", "  Error"),
 }
 
 
+# Extra layout gap reserved for each painted vertical separator.
+_SEPARATOR_GAP = 8
+
+
+class _ClickableLabel(QLabel):
+    """QLabel that emits ``clicked`` on mouse press."""
+
+    clicked = Signal()
+
+    def mousePressEvent(self, event) -> None:  # noqa: N802
+        self.clicked.emit()
+        super().mousePressEvent(event)
+
+
 class ServiceToolbar(QWidget):
     """Horizontal toolbar: environment selector + Start/Pause/Stop + health."""
 
@@ -43,6 +60,11 @@ class ServiceToolbar(QWidget):
     def __init__(self, auragrid_available: bool = False, parent=None):
         super().__init__(parent)
         self._current_state = ServiceState.STOPPED
+        # Last values pushed to the widgets, so repeated identical
+        # updates skip the Qt setters (each one restyles + repaints).
+        self._applied_state: ServiceState | None = None
+        self._applied_health_text = ""
+        self._applied_health_style = ""
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(6, 4, 6, 4)
@@ -50,18 +72,16 @@ class ServiceToolbar(QWidget):
         # ---- Environment selector ----
         layout.addWidget(QLabel("Environment:"))
         self._env_combo = QComboBox()
-        self._env_combo.addItem("Local")
+        self._env_index: dict[str, int] = {}
+        self._add_environment("Local")
         if auragrid_available:
-            self._env_combo.addItem("AuraGrid")
+            self._add_environment("AuraGrid")
         self._env_combo.currentTextChanged.connect(self._on_env_changed)
         self._env_combo.setMinimumWidth(110)
         layout.addWidget(self._env_combo)
 
-        # Separator
-        sep1 = QFrame()
-        sep1.setFrameShape(QFrame.Shape.VLine)
-        sep1.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(sep1)
+        # Separator (drawn in paintEvent)
+        layout.addSpacing(_SEPARATOR_GAP)
 
         # ---- State indicator ----
         self._state_label = QLabel()
@@ -77,9 +97,13 @@ class ServiceToolbar(QWidget):
         layout.addWidget(self._loading_progress)
 
         # ---- Control buttons ----
+        # Button → toolbar signal forwards are GUI-thread only, so they
+        # use DirectConnection to skip the per-emit thread check.
         self._start_btn = QPushButton("Start")
         self._start_btn.setFixedWidth(70)
-        self._start_btn.clicked.connect(self.start_clicked)
+        self._start_btn.clicked.connect(
+            self.start_clicked, Qt.ConnectionType.DirectConnection
+        )
         layout.addWidget(self._start_btn)
 
         self._pause_btn = QPushButton("Pause")
@@ -89,32 +113,36 @@ class ServiceToolbar(QWidget):
 
         self._stop_btn = QPushButton("Stop")
         self._stop_btn.setFixedWidth(70)
-        self._stop_btn.clicked.connect(self.stop_clicked)
+        self._stop_btn.clicked.connect(
+            self.stop_clicked, Qt.ConnectionType.DirectConnection
+        )
         layout.addWidget(self._stop_btn)
 
-        # Separator
-        sep2 = QFrame()
-        sep2.setFrameShape(QFrame.Shape.VLine)
-        sep2.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(sep2)
+        # Separator (drawn in paintEvent)
+        layout.addSpacing(_SEPARATOR_GAP)
 
         # ---- Health indicator (clickable for dashboard popup) ----
         self._last_health: HealthStatus | None = None
-        self._health_label = QLabel("Health: --")
+        self._health_dialog: _HealthDashboardDialog | None = None
+        self._health_dialog_key: tuple | None = None
+        self._health_label = _ClickableLabel("Health: --")
         self._health_label.setStyleSheet("color: gray;")
         self._health_label.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._health_label.mousePressEvent = lambda _: self._show_health_dashboard()
+        self._health_label.clicked.connect(self._show_health_dashboard)
         layout.addWidget(self._health_label)
 
         health_btn = QPushButton("Check")
         health_btn.setFixedWidth(56)
-        health_btn.clicked.connect(self.health_clicked)
+        health_btn.clicked.connect(
+            self.health_clicked, Qt.ConnectionType.DirectConnection
+        )
         layout.addWidget(health_btn)
 
         layout.addStretch()
 
-        # Apply initial button states.
-        self._apply_state(ServiceState.STOPPED)
+        # Apply initial button states (even though not yet shown).
+        self._pending_apply = False
+        self._render_state(ServiceState.STOPPED)
 
     # ------------------------------------------------------------------
     # Public
@@ -132,19 +160,21 @@ class ServiceToolbar(QWidget):
         """Update the health indicator."""
         self._last_health = status
         if status.healthy:
-            self._health_label.setText("Health: OK")
-            self._health_label.setStyleSheet(
-                "color: #388e3c; font-weight: bold; text-decoration: underline;"
-            )
+            text = "Health: OK"
+            style = "color: #388e3c; font-weight: bold; text-decoration: underline;"
         else:
-            self._health_label.setText(f"Health: {status.message[:40]}")
-            self._health_label.setStyleSheet(
-                "color: #d32f2f; font-weight: bold; text-decoration: underline;"
-            )
+            text = f"Health: {status.message[:40]}"
+            style = "color: #d32f2f; font-weight: bold; text-decoration: underline;"
+        if text != self._applied_health_text:
+            self._health_label.setText(text)
+            self._applied_health_text = text
+        if style != self._applied_health_style:
+            self._health_label.setStyleSheet(style)
+            self._applied_health_style = style
 
     def set_environment(self, env_name: str) -> None:
         """Programmatically set the environment selector."""
-        idx = self._env_combo.findText(env_name)
+        idx = self._env_index.get(env_name, -1)
         if idx >= 0:
             self._env_combo.setCurrentIndex(idx)
 
@@ -184,15 +214,49 @@ class ServiceToolbar(QWidget):
     # Internal
     # ------------------------------------------------------------------
 
+    def _add_environment(self, env_name: str) -> None:
+        self._env_index[env_name] = self._env_combo.count()
+        self._env_combo.addItem(env_name)
+
     def _apply_state(self, state: ServiceState) -> None:
         self._current_state = state
-        colour, label = _STATE_DISPLAY.get(
-            state.value, ("#9e9e9e", state.value)
-        )
-        self._state_label.setText(f"  {label}")
-        self._state_label.setStyleSheet(
-            f"color: {colour}; font-weight: bold;"
+        # Hidden toolbars only record the state; showEvent renders it.
+        if not self.isVisible():
+            self._pending_apply = True
+            return
+        self._pending_apply = False
+        self._render_state(state)
+
+    def showEvent(self, event) -> None:  # noqa: N802
+        super().showEvent(event)
+        if self._pending_apply:
+            self._apply_state(self._current_state)
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        super().paintEvent(event)
+        # Vertical separators centred in the gaps after the environment
+        # selector and after the Stop button.
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(QPalette.ColorRole.Mid))
+        top = 4
+        bottom = self.height() - 5
+        for left, right in (
+            (self._env_combo, self._state_label),
+            (self._stop_btn, self._health_label),
+        ):
+            x = (left.geometry().right() + right.geometry().left()) // 2
+            painter.drawLine(x, top, x, bottom)
+        painter.end()
+
+    def _render_state(self, state: ServiceState) -> None:
+        if state == self._applied_state:
+            return
+        self._applied_state = state
+        style, text = _STATE_DISPLAY.get(
+            state.value, ("color: #9e9e9e; font-weight: bold;", f"  {state.value}")
         )
+        self._state_label.setText(text)
+        self._state_label.setStyleSheet(style)
 
         # Show indeterminate progress bar during model loading.
         self._loading_progress.setVisible(state == ServiceState.LOADING_MODEL)
@@ -225,10 +289,26 @@ class ServiceToolbar(QWidget):
         self.environment_changed.emit(text)
 
     def _show_health_dashboard(self) -> None:
-        """Open a popup showing per-model health details."""
-        dlg = _HealthDashboardDialog(self._last_health, parent=self)
-        dlg.check_all_clicked.connect(self.health_clicked)
-        dlg.exec()
+        """Open a popup showing per-model health details.
+
+        The dialog is cached and only rebuilt when the health content
+        differs from what it was built for.
+        """
+        key = _health_key(self._last_health)
+        if self._health_dialog is None or key != self._health_dialog_key:
+            if self._health_dialog is not None:
+                self._health_dialog.deleteLater()
+            self._health_dialog = _HealthDashboardDialog(self._last_health, parent=self)
+            self._health_dialog.check_all_clicked.connect(self.health_clicked)
+            self._health_dialog_key = key
+        self._health_dialog.exec()
+
+
+def _health_key(status: HealthStatus | None) -> tuple | None:
+    """Content key identifying what a health dashboard would display."""
+    if status is None:
+        return None
+    return (status.healthy, status.message, tuple(status.details.items()))
 
 
 class _HealthDashboardDialog(QDialog):
@@ -253,13 +333,20 @@ class _HealthDashboardDialog(QDialog):
             )
             layout.addWidget(overall)
 
-            # Per-model details.
+            # Per-model details, rendered as one rich-text label rather
+            # than one widget per model.
             if status.details:
+                rows = []
                 for model_id, ok in status.details.items():
                     dot = "\u2705" if ok else "\u274c"
-                    row = QLabel(f"  {dot}  {model_id}")
-                    row.setStyleSheet(f"color: {'#388e3c' if ok else '#d32f2f'};")
-                    layout.addWidget(row)
+                    colour = "#388e3c" if ok else "#d32f2f"
+                    rows.append(
+                        f'<span style="color: {colour};">&nbsp;&nbsp;{dot}'
+                        f"&nbsp;&nbsp;{html.escape(model_id)}</span>"
+                    )
+                self._details_label = QLabel("<br>".join(rows))
+                self._details_label.setTextFormat(Qt.TextFormat.RichText)
+                layout.addWidget(self._details_label)
             else:
                 layout.addWidget(QLabel("  (no model details available)"))
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from PySide6.QtCore import QObject, QThread, QTimer, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -49,129 +50,384 @@ def _time_range_bounds(label: str) -> tuple[Optional[str], Optional[str]]:
         start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
     else:  # All Time
         return None, None
-    return start.isoformat(), None
+    # A closed upper bound lets SQLite range-scan the timestamp index.
+    return start.isoformat(), now.isoformat()
+
+
+# Cache granularity per range: bounds are widened to these boundaries so
+# repeated refreshes within one bucket produce an identical cache key.
+_BUCKET_SECONDS = {
+    "Last Hour": 30,
+    "Today": 300,
+    "This Week": 3600,
+    "This Month": 3600,
+}
+
+
+def _bucketed_bounds(label: str) -> tuple[Optional[str], Optional[str]]:
+    """Like :func:`_time_range_bounds`, snapped outward to the range's bucket."""
+    start, end = _time_range_bounds(label)
+    size = _BUCKET_SECONDS.get(label)
+    if start is None or end is None or size is None:
+        return start, end
+    lo = datetime.fromisoformat(start).timestamp()
+    hi = datetime.fromisoformat(end).timestamp()
+    lo = lo // size * size
+    hi = -(-hi // size) * size
+    return (
+        datetime.fromtimestamp(lo, timezone.utc).isoformat(),
+        datetime.fromtimestamp(hi, timezone.utc).isoformat(),
+    )
+
+
+# A refresh with the same bucket key as the last completed one is dropped
+# if it arrives within this many seconds (rapid clicks / range cycling).
+_DUPLICATE_WINDOW_S = 5.0
+
+# Ranges whose start is fixed (until the next day/week/month boundary), so
+# their aggregates can be carried forward and topped up with new rows only.
+# "Last Hour" slides and is recomputed (through the cache) instead.
+_INCREMENTAL_RANGES = frozenset({"Today", "This Week", "This Month", "All Time"})
+
+# Sliding-range payloads a tab keeps for reuse; the oldest is dropped first.
+_MEMO_SIZE = 8
+
+_BREAKDOWNS = ("provider_model", "intent", "role")
+
+
+def _new_state(label: str, start: Optional[str], purge_generation: int) -> dict:
+    """Empty running aggregate for *label* starting at *start*."""
+    state: dict = {
+        "label": label,
+        "start": start,
+        "watermark": 0,
+        "purge_generation": purge_generation,
+    }
+    for name in _BREAKDOWNS:
+        state[name] = {}
+    return state
+
+
+class _Agg:
+    """Running request/token/latency sums for one breakdown group."""
+
+    __slots__ = ("requests", "input_tokens", "output_tokens", "total_elapsed")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.total_elapsed = 0.0
+
+
+def _accumulate(
+    store: UsageStore,
+    sums: dict,
+    start: Optional[str],
+    end: Optional[str] = None,
+    after_id: Optional[int] = None,
+    upto_id: Optional[int] = None,
+) -> None:
+    """Add grouped request/token/latency sums into *sums*' ``_Agg`` buckets.
+
+    One query grouped by every breakdown column feeds all three breakdowns
+    in a single sweep over the (small) grouped result.
+    """
+    provider_model = sums["provider_model"]
+    intents = sums["intent"]
+    roles = sums["role"]
+    for prov, model, intent, role, requests, inp, out, elapsed in store.aggregate(
+        ("provider", "model_id", "intent", "role"),
+        start=start, end=end, after_id=after_id, upto_id=upto_id,
+    ):
+        _bump(provider_model, (prov, model), requests, inp, out, elapsed)
+        _bump(intents, intent, requests, inp, out, elapsed)
+        _bump(roles, role, requests, inp, out, elapsed)
+
+
+def _bump(
+    groups: dict, key, requests: int, inp: int, out: int, elapsed: float
+) -> None:
+    """Add one grouped row's sums into ``groups[key]``."""
+    agg = groups.get(key)
+    if agg is None:
+        agg = groups[key] = _Agg()
+    agg.requests += requests
+    agg.input_tokens += inp
+    agg.output_tokens += out
+    agg.total_elapsed += elapsed
+
+
+def _count_rows(label: str, groups: dict) -> list[dict]:
+    """Sorted request/token rows for a single-column breakdown."""
+    return [
+        {
+            label: key,
+            "requests": agg.requests,
+            "input_tokens": agg.input_tokens,
+            "output_tokens": agg.output_tokens,
+        }
+        for key, agg in sorted(groups.items())
+    ]
+
+
+def _config_stamp(config: Optional[ConfigLoader]) -> tuple:
+    """Value that changes whenever *config* is edited or replaced."""
+    if config is None:
+        return ()
+    return (config.revision, id(config.config))
+
+
+class _TierCache:
+    """Hosting tier per (provider, model), rebuilt when the config changes."""
+
+    def __init__(self, config: Optional[ConfigLoader]) -> None:
+        self.config = config
+        self._stamp: Optional[tuple] = None
+        self._tiers: dict[tuple[str, str], str] = {}
+
+    def get(self, provider: str, model: str) -> str:
+        stamp = _config_stamp(self.config)
+        if stamp != self._stamp:
+            self._tiers = {}
+            self._stamp = stamp
+        tier = self._tiers.get((provider, model))
+        if tier is None:
+            tier_explicit = None
+            if self.config is not None:
+                tier_explicit = self.config.get_model_hosting_tier(model)
+            tier = self._tiers[(provider, model)] = resolve_hosting_tier(
+                tier_explicit, provider
+            )
+        return tier
+
+
+def _build_payload(
+    sums: dict,
+    engine: CostEngine,
+    tiers: _TierCache,
+) -> dict:
+    """Turn grouped sums into the dashboard payload.
+
+    Cost is linear in the token counts, so it is computed once per
+    (provider, model) group rather than once per record.
+    """
+    provider_rows = []
+    total_requests = 0
+    total_input = 0
+    total_output = 0
+    total_cost = 0.0
+    for (prov, model), agg in sorted(sums["provider_model"].items()):
+        requests = agg.requests
+        inp = agg.input_tokens
+        out = agg.output_tokens
+        in_rate, out_rate = engine.get_rates(prov, model)
+        cost = inp * in_rate + out * out_rate
+        total_requests += requests
+        total_input += inp
+        total_output += out
+        total_cost += cost
+        tier = tiers.get(prov, model)
+        provider_rows.append(
+            {
+                "provider": prov,
+                "model": model,
+                "requests": requests,
+                "input_tokens": inp,
+                "output_tokens": out,
+                "cost": cost,
+                "avg_latency": agg.total_elapsed / requests if requests else 0.0,
+                "tier": tier,
+            }
+        )
+
+    # --- Intent / role breakdowns ---
+    intent_rows = _count_rows("intent", sums["intent"])
+    role_rows = _count_rows("role", sums["role"])
+
+    # Display text is formatted here, off the GUI thread, so applying the
+    # payload only has to set strings and construct table items.
+    provider_cells = [
+        (
+            row["provider"],
+            row["model"],
+            row["tier"],
+            str(row["requests"]),
+            format_tokens(row["input_tokens"]),
+            format_tokens(row["output_tokens"]),
+            format_cost(row["cost"]),
+            format_duration(row["avg_latency"]),
+        )
+        for row in provider_rows
+    ]
+    intent_cells = [
+        (row["intent"], str(row["requests"]),
+         format_tokens(row["input_tokens"]), format_tokens(row["output_tokens"]))
+        for row in intent_rows
+    ]
+    role_cells = [
+        (row["role"], str(row["requests"]),
+         format_tokens(row["input_tokens"]), format_tokens(row["output_tokens"]))
+        for row in role_rows
+    ]
+
+    return {
+        "total_requests": total_requests,
+        "input_tokens": total_input,
+        "output_tokens": total_output,
+        "total_cost": total_cost,
+        "provider_rows": provider_rows,
+        "intent_rows": intent_rows,
+        "role_rows": role_rows,
+        "summary_text": (
+            format_tokens(total_requests),
+            format_tokens(total_input),
+            format_tokens(total_output),
+            format_cost(total_cost),
+        ),
+        "provider_cells": provider_cells,
+        "intent_cells": intent_cells,
+        "role_cells": role_cells,
+    }
+
+
+def _data_stamp(store: UsageStore) -> tuple[int, int]:
+    """Value that changes when rows are written, by this or any process.
+
+    ``store.revision`` only counts writes made through this process's
+    store, while the server subprocess writes to the same database.
+    """
+    return (store.last_id(), store.purge_generation)
+
+
+def _compute_traffic(
+    store: UsageStore,
+    engine: CostEngine,
+    tiers: _TierCache,
+    start: Optional[str],
+    end: Optional[str],
+) -> dict:
+    """Build the dashboard payload for ``[start, end]`` from scratch."""
+    sums = _new_state("", start, 0)
+    _accumulate(store, sums, start, end)
+    return _build_payload(sums, engine, tiers)
+
+
+def _update_incremental(
+    store: UsageStore,
+    engine: CostEngine,
+    tiers: _TierCache,
+    label: str,
+    prior: Optional[dict],
+) -> dict:
+    """Fold rows added since *prior*'s watermark into its running sums.
+
+    The watermark is the highest row id already aggregated, so rows are
+    picked up even when their timestamps arrive out of order.  The state
+    is rebuilt when the range start has moved on or rows were purged.
+    Returns the payload with the updated state under ``"state"``.
+    """
+    start, _end = _time_range_bounds(label)
+    generation = store.purge_generation
+    if (
+        prior is None
+        or prior["start"] != start
+        or prior["purge_generation"] != generation
+    ):
+        state = _new_state(label, start, generation)
+    else:
+        state = prior
+
+    upto = store.last_id()
+    if upto > state["watermark"]:
+        _accumulate(
+            store, state, start, after_id=state["watermark"], upto_id=upto
+        )
+        state["watermark"] = upto
+
+    payload = _build_payload(state, engine, tiers)
+    payload["state"] = state
+    return payload
 
 
 # ------------------------------------------------------------------
 # Background worker
 # ------------------------------------------------------------------
 
-class _TrafficWorker(QObject):
-    """Queries UsageStore / CostEngine off the main thread."""
+class _TrafficSignals(QObject):
+    """Long-lived signal carrier shared by every ``_TrafficWorker`` run."""
+
+    # Payload dict with all computed data, and the source generation the
+    # worker was started with.
+    finished = Signal(object, int)
+    error = Signal(str, int)
+
 
-    finished = Signal(dict)  # payload with all computed data
-    error = Signal(str)
+class _TrafficWorker(QRunnable):
+    """Queries UsageStore / CostEngine on a pooled thread.
+
+    Runs on ``QThreadPool.globalInstance()`` so refreshes and auto-refresh
+    ticks reuse an idle pool thread.  Results are reported through the
+    tab-owned *signals* object.
+    """
 
     def __init__(
         self,
         store: UsageStore,
         engine: CostEngine,
         time_range: str,
+        signals: _TrafficSignals,
         config: Optional[ConfigLoader] = None,
+        prior_state: Optional[dict] = None,
+        memo: Optional[dict] = None,
+        tiers: Optional[_TierCache] = None,
+        generation: int = 0,
     ) -> None:
         super().__init__()
         self._store = store
         self._engine = engine
         self._time_range = time_range
+        self._signals = signals
         self._config = config
+        self._prior_state = prior_state
+        self._memo = memo
+        self._generation = generation
+        self._tiers = tiers if tiers is not None else _TierCache(config)
 
     def run(self) -> None:
         try:
-            start, end = _time_range_bounds(self._time_range)
-
-            records = self._store.query(start=start, end=end)
-            totals = self._store.total_tokens(start=start, end=end)
-            total_cost = self._engine.total_spend(start=start, end=end)
-
-            # --- Provider × Model breakdown ---
-            provider_model: dict[tuple[str, str], dict] = {}
-            for r in records:
-                key = (r.provider, r.model_id)
-                bucket = provider_model.setdefault(
-                    key,
-                    {
-                        "requests": 0,
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                        "cost": 0.0,
-                        "total_elapsed": 0.0,
-                    },
-                )
-                bucket["requests"] += 1
-                bucket["input_tokens"] += r.input_tokens
-                bucket["output_tokens"] += r.output_tokens
-                bucket["cost"] += self._engine.calculate_cost(
-                    r.input_tokens, r.output_tokens, r.model_id, r.provider
+            if self._time_range in _INCREMENTAL_RANGES:
+                payload = _update_incremental(
+                    self._store, self._engine, self._tiers,
+                    self._time_range, self._prior_state,
                 )
-                bucket["total_elapsed"] += r.elapsed_s
-
-            provider_rows = []
-            for (prov, model), stats in sorted(provider_model.items()):
-                avg_latency = (
-                    stats["total_elapsed"] / stats["requests"]
-                    if stats["requests"]
-                    else 0.0
-                )
-                # Resolve hosting tier from config if available.
-                tier_explicit = None
-                if self._config is not None:
-                    tier_explicit = self._config.get_model_hosting_tier(model)
-                tier = resolve_hosting_tier(tier_explicit, prov)
-                provider_rows.append(
-                    {
-                        "provider": prov,
-                        "model": model,
-                        "requests": stats["requests"],
-                        "input_tokens": stats["input_tokens"],
-                        "output_tokens": stats["output_tokens"],
-                        "cost": stats["cost"],
-                        "avg_latency": avg_latency,
-                        "tier": tier,
-                    }
-                )
-
-            # --- Intent breakdown ---
-            intent_map: dict[str, dict] = {}
-            for r in records:
-                bucket = intent_map.setdefault(
-                    r.intent, {"requests": 0, "input_tokens": 0, "output_tokens": 0}
-                )
-                bucket["requests"] += 1
-                bucket["input_tokens"] += r.input_tokens
-                bucket["output_tokens"] += r.output_tokens
-
-            intent_rows = [
-                {"intent": k, **v} for k, v in sorted(intent_map.items())
-            ]
-
-            # --- Role breakdown ---
-            role_map: dict[str, dict] = {}
-            for r in records:
-                bucket = role_map.setdefault(
-                    r.role, {"requests": 0, "input_tokens": 0, "output_tokens": 0}
-                )
-                bucket["requests"] += 1
-                bucket["input_tokens"] += r.input_tokens
-                bucket["output_tokens"] += r.output_tokens
-
-            role_rows = [
-                {"role": k, **v} for k, v in sorted(role_map.items())
-            ]
-
-            self.finished.emit(
-                {
-                    "total_requests": len(records),
-                    "input_tokens": totals["input_tokens"],
-                    "output_tokens": totals["output_tokens"],
-                    "total_cost": total_cost,
-                    "provider_rows": provider_rows,
-                    "intent_rows": intent_rows,
-                    "role_rows": role_rows,
-                }
-            )
+            else:
+                payload = self._bucketed_payload()
+            self._signals.finished.emit(payload, self._generation)
 
         except Exception as exc:
-            self.error.emit(str(exc))
+            self._signals.error.emit(str(exc), self._generation)
+
+    def _bucketed_payload(self) -> dict:
+        """Payload for a sliding range, reused from *memo* when unchanged.
+
+        The memo key is the bucketed bounds plus the store's data stamp and
+        the config revision, so auto-refresh ticks inside one bucket skip the
+        aggregation queries until new usage is recorded or the config is
+        edited.
+        """
+        start, end = _bucketed_bounds(self._time_range)
+        key = (start, end, _data_stamp(self._store), _config_stamp(self._config))
+        memo = self._memo if self._memo is not None else {}
+        payload = memo.get(key)
+        if payload is None:
+            payload = _compute_traffic(
+                self._store, self._engine, self._tiers, start, end,
+            )
+            memo[key] = payload
+            while len(memo) > _MEMO_SIZE:
+                del memo[next(iter(memo))]
+        return payload
 
 
 # ------------------------------------------------------------------
@@ -187,8 +443,23 @@ class TokenTrafficTab(QWidget):
         self._store: Optional[UsageStore] = None
         self._engine: Optional[CostEngine] = None
         self._config: Optional[ConfigLoader] = None
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[_TrafficWorker] = None
+        self._busy = False
+        self._dirty = False
+        # Bumped by set_data_sources; results from workers started with an
+        # older value belong to the previous sources and are dropped.
+        self._generation = 0
+        self._pending_bucket_key: Optional[tuple] = None
+        self._last_bucket_key: Optional[tuple] = None
+        self._last_completed = 0.0
+        # Running aggregates per incremental range label, carried between
+        # refreshes so only newly recorded rows are queried.
+        self._agg_state: dict[str, dict] = {}
+        # Sliding-range payloads keyed on bucketed bounds and revisions.
+        self._traffic_memo: dict[tuple, dict] = {}
+        self._tiers = _TierCache(None)
+        self._signals = _TrafficSignals(self)
+        self._signals.finished.connect(self._apply_data)
+        self._signals.error.connect(self._on_worker_error)
 
         self._build_ui()
 
@@ -197,6 +468,11 @@ class TokenTrafficTab(QWidget):
         self._auto_timer.setInterval(30_000)
         self._auto_timer.timeout.connect(self._on_auto_tick)
 
+    def showEvent(self, event) -> None:  # noqa: N802
+        super().showEvent(event)
+        if self._dirty:
+            self.refresh()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -211,31 +487,51 @@ class TokenTrafficTab(QWidget):
         self._store = usage_store
         self._engine = cost_engine
         self._config = config
+        self._agg_state.clear()
+        # A fresh dict, so a worker still running on the old sources
+        # cannot store into the new memo.
+        self._traffic_memo = {}
+        self._tiers = _TierCache(config)
+        self._last_bucket_key = None
+        self._generation += 1
 
     def refresh(self) -> None:
         """Kick off a background query with the current time-range filter."""
         if self._store is None or self._engine is None:
             return
 
+        # Hidden tabs just remember to refresh on the next showEvent.
+        if not self.isVisible():
+            self._dirty = True
+            return
+
         # Don't stack concurrent refreshes.
-        if self._thread is not None and self._thread.isRunning():
+        if self._busy:
             return
+        self._dirty = False
 
         time_range = self._range_combo.currentText()
-        self._worker = _TrafficWorker(self._store, self._engine, time_range, self._config)
-        self._thread = QThread()
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._apply_data)
-        self._worker.error.connect(self._on_worker_error)
-
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.error.connect(self._thread.quit)
-        self._thread.finished.connect(self._cleanup_thread)
 
+        # Drop a refresh that would recompute exactly what was just shown:
+        # same range, same cache bucket, no new usage recorded.
+        key = (
+            time_range, _bucketed_bounds(time_range), _data_stamp(self._store),
+            _config_stamp(self._config),
+        )
+        if (
+            key == self._last_bucket_key
+            and time.monotonic() - self._last_completed < _DUPLICATE_WINDOW_S
+        ):
+            return
+        self._pending_bucket_key = key
+        worker = _TrafficWorker(
+            self._store, self._engine, time_range, self._signals, self._config,
+            self._agg_state.get(time_range), self._traffic_memo, self._tiers,
+            self._generation,
+        )
+        self._busy = True
         self._refresh_btn.setEnabled(False)
-        self._thread.start()
+        QThreadPool.globalInstance().start(worker)
 
     # ------------------------------------------------------------------
     # UI construction
@@ -331,64 +627,45 @@ class TokenTrafficTab(QWidget):
     # Data application (runs on main thread via signal)
     # ------------------------------------------------------------------
 
-    def _apply_data(self, data: dict) -> None:
-        # Summary cards.
-        self._lbl_requests.setText(format_tokens(data["total_requests"]))
-        self._lbl_input.setText(format_tokens(data["input_tokens"]))
-        self._lbl_output.setText(format_tokens(data["output_tokens"]))
-        self._lbl_cost.setText(format_cost(data["total_cost"]))
-
-        # Provider table.
-        self._fill_provider_table(data["provider_rows"])
-
-        # Intent table.
-        self._fill_simple_table(
-            self._intent_table,
-            data["intent_rows"],
-            ["intent", "requests", "input_tokens", "output_tokens"],
-        )
-
-        # Role table.
-        self._fill_simple_table(
-            self._role_table,
-            data["role_rows"],
-            ["role", "requests", "input_tokens", "output_tokens"],
-        )
+    def _apply_data(self, data: dict, generation: int) -> None:
+        if generation != self._generation:
+            self._drop_stale_result()
+            return
+        state = data.get("state")
+        if state is not None:
+            self._agg_state[state["label"]] = state
 
+        # Summary cards.
+        requests, inp, out, cost = data["summary_text"]
+        self._lbl_requests.setText(requests)
+        self._lbl_input.setText(inp)
+        self._lbl_output.setText(out)
+        self._lbl_cost.setText(cost)
+
+        # Breakdown tables (cell text is pre-formatted by the worker).
+        self._fill_table(self._provider_table, data["provider_cells"])
+        self._fill_table(self._intent_table, data["intent_cells"])
+        self._fill_table(self._role_table, data["role_cells"])
+
+        self._last_bucket_key = self._pending_bucket_key
+        self._last_completed = time.monotonic()
+        self._busy = False
         self._refresh_btn.setEnabled(True)
 
-    def _fill_provider_table(self, rows: list[dict]) -> None:
-        t = self._provider_table
-        t.setRowCount(0)
-        for row_data in rows:
-            r = t.rowCount()
-            t.insertRow(r)
-            t.setItem(r, 0, QTableWidgetItem(row_data["provider"]))
-            t.setItem(r, 1, QTableWidgetItem(row_data["model"]))
-            t.setItem(r, 2, QTableWidgetItem(row_data.get("tier", "")))
-            t.setItem(r, 3, QTableWidgetItem(str(row_data["requests"])))
-            t.setItem(r, 4, QTableWidgetItem(format_tokens(row_data["input_tokens"])))
-            t.setItem(r, 5, QTableWidgetItem(format_tokens(row_data["output_tokens"])))
-            t.setItem(r, 6, QTableWidgetItem(format_cost(row_data["cost"])))
-            t.setItem(r, 7, QTableWidgetItem(format_duration(row_data["avg_latency"])))
-
-    def _fill_simple_table(
-        self,
-        table: QTableWidget,
-        rows: list[dict],
-        keys: list[str],
-    ) -> None:
-        table.setRowCount(0)
-        for row_data in rows:
-            r = table.rowCount()
-            table.insertRow(r)
-            for col, key in enumerate(keys):
-                val = row_data[key]
-                if key in ("input_tokens", "output_tokens"):
-                    text = format_tokens(val)
-                else:
-                    text = str(val)
-                table.setItem(r, col, QTableWidgetItem(text))
+    @staticmethod
+    def _fill_table(table: QTableWidget, cells: list[tuple[str, ...]]) -> None:
+        """Replace *table*'s contents with one batch of pre-formatted rows."""
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.clearContents()
+            table.setRowCount(len(cells))
+            for r, row in enumerate(cells):
+                for c, text in enumerate(row):
+                    table.setItem(r, c, QTableWidgetItem(text))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------
     # Auto-refresh
@@ -401,21 +678,22 @@ class TokenTrafficTab(QWidget):
             self._auto_timer.stop()
 
     def _on_auto_tick(self) -> None:
-        """Only refresh when the tab is actually visible."""
-        if self.isVisible():
-            self.refresh()
+        """Refresh now if visible; otherwise ``refresh`` defers to showEvent."""
+        self.refresh()
 
     # ------------------------------------------------------------------
     # Worker lifecycle
     # ------------------------------------------------------------------
 
-    def _on_worker_error(self, message: str) -> None:
+    def _on_worker_error(self, message: str, generation: int) -> None:
+        if generation != self._generation:
+            self._drop_stale_result()
+            return
+        self._busy = False
         self._refresh_btn.setEnabled(True)
 
-    def _cleanup_thread(self) -> None:
-        if self._thread:
-            self._thread.deleteLater()
-            self._thread = None
-        if self._worker:
-            self._worker.deleteLater()
-            self._worker = None
+    def _drop_stale_result(self) -> None:
+        """Discard a result computed from replaced data sources."""
+        self._busy = False
+        self._refresh_btn.setEnabled(True)
+        self.refresh()
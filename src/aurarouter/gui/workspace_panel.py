@@ -266,6 +266,7 @@ class WorkspaceWorker(QObject):
 
     def _run_pipeline(self) -> None:
         from aurarouter.routing import (
+            PLAN_CONTEXT_WINDOW,
             analyze_intent,
             generate_correction_plan,
             generate_plan,
@@ -332,6 +333,10 @@ class WorkspaceWorker(QObject):
 
             # --- Execute steps ----------------------------------------------
             parts: list[str] = []
+            step_head = (
+                f"LANG: {self._output_format}\n"
+                f"CONTEXT: {self._context}\n"
+            )
             for i, step in enumerate(plan):
                 if self._cancelled:
                     return
@@ -344,10 +349,8 @@ class WorkspaceWorker(QObject):
                 self.step_started.emit(i, step)
 
                 prompt = (
-                    f"GOAL: {step}\n"
-                    f"LANG: {self._output_format}\n"
-                    f"CONTEXT: {self._context}\n"
-                    f"PREVIOUS_OUTPUT: {parts}\n"
+                    f"GOAL: {step}\n{step_head}"
+                    f"PREVIOUS_OUTPUT: {parts[-PLAN_CONTEXT_WINDOW:]}\n"
                     "Return ONLY the requested output."
                 )
                 gen_result = fabric.execute(
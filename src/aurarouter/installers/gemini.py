@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from aurarouter.installers.registry import BaseInstaller
+from aurarouter.installers.registry import _HOME, BaseInstaller
 
 
 class GeminiInstaller(BaseInstaller):
@@ -15,7 +15,7 @@ class GeminiInstaller(BaseInstaller):
         return "aurarouter"
 
     def config_candidates(self) -> list[Path]:
-        home = Path.home()
+        home = _HOME
         return [
             home / ".gemini" / "settings.json",
             home / ".geminichat" / "settings.json",
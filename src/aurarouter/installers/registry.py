@@ -1,18 +1,86 @@
+import functools
 import json
 import os
 import sys
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 from aurarouter._logging import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = get_logger("AuraRouter.Installer")
 
+# Module invocation shared by every installer's launch command.
+_BASE_ARGS = ("-m", "aurarouter")
+
+# Resolved once; installers build every candidate path from it.
+_HOME = Path.home()
+
+
+def _json_loads(raw: bytes) -> dict:
+    """Parse a client config, via orjson when installed.
+
+    ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so
+    callers catch the stdlib type either way.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: dict) -> bytes:
+    """Serialize a client config with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def _atomic_write_bytes(target: Path, payload: bytes) -> None:
+    """Write *payload* to a temp file beside *target*, then rename over it.
+
+    Readers see either the old config or the complete new one, never a
+    truncated file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(target.parent), suffix=".json.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, str(target))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _first_existing(candidates: tuple[Path, ...]) -> Optional[Path]:
+    """Return the first path in *candidates* that exists on disk.
+
+    Memoized per candidate tuple; ``BaseInstaller.install`` clears the
+    cache after writing a config so later lookups see the new file.
+    """
+    for p in candidates:
+        if p.exists():
+            return p
+    return None
+
 
 class BaseInstaller(ABC):
     """Abstract base for MCP client installers."""
 
+    # Additional CLI args to pass when launching this router variant.
+    EXTRA_ARGS: ClassVar[tuple[str, ...]] = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -33,26 +101,18 @@ class BaseInstaller(ABC):
     def default_config_path(self) -> Path:
         """Fallback path when no candidate is found on disk."""
         candidates = self.config_candidates()
-        return candidates[0] if candidates else Path.home() / ".mcp" / "settings.json"
-
-    def extra_args(self) -> list[str]:
-        """Additional CLI args to pass when launching this router variant."""
-        return []
+        return candidates[0] if candidates else _HOME / ".mcp" / "settings.json"
 
     # ------------------------------------------------------------------
     def detect_config_path(self) -> Optional[Path]:
         """Find the first existing config file from the candidate list."""
-        for p in self.config_candidates():
-            if p.exists():
-                return p
-        return None
+        return _first_existing(tuple(self.config_candidates()))
 
     def build_payload(self) -> dict:
         """Build the mcpServers entry for this installer."""
-        python = sys.executable
         return {
-            "command": python,
-            "args": ["-m", "aurarouter"] + self.extra_args(),
+            "command": sys.executable,
+            "args": [*_BASE_ARGS, *self.EXTRA_ARGS],
             "env": {"PYTHONUNBUFFERED": "1"},
         }
 
@@ -83,12 +143,13 @@ class BaseInstaller(ABC):
 
         try:
             data: dict = {}
-            if target.exists():
+            try:
+                raw = target.read_bytes()
+            except FileNotFoundError:
+                raw = b""
+            if raw.strip():
                 try:
-                    with open(target, "r") as f:
-                        content = f.read().strip()
-                        if content:
-                            data = json.loads(content)
+                    data = _json_loads(raw)
                 except json.JSONDecodeError:
                     print("   File contains invalid JSON. Backing up and starting fresh.")
                     target.rename(target.with_suffix(".json.bak"))
@@ -96,8 +157,8 @@ class BaseInstaller(ABC):
             data.setdefault("mcpServers", {})
             data["mcpServers"][self.server_name] = self.build_payload()
 
-            with open(target, "w") as f:
-                json.dump(data, f, indent=2)
+            _atomic_write_bytes(target, _json_dumps(data))
+            _first_existing.cache_clear()
 
             print(f"\n   SUCCESS: AuraRouter ({self.name}) registered.")
             print("   Restart your CLI session to pick up the change.")
@@ -9,12 +9,21 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
+import selectors
 import socket
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger("AuraRouter.IPC")
 
 _IPC_DIR = Path.home() / ".auracore" / "aurarouter"
@@ -25,12 +34,85 @@ if sys.platform == "win32":
 else:
     IPC_ADDRESS = str(_IPC_DIR / "aurarouter.sock")
 
+_RECV_SIZE = 65536
+_MAX_WORKERS = 16
+
+
+def _encode_line(message: dict) -> bytes:
+    """Serialize one newline-terminated message, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            message, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+
+# Parameterless requests sent on every liveness check, encoded once.
+_PARAMLESS_REQUESTS: dict[str, bytes] = {
+    "health": _encode_line({"method": "health", "id": 1}),
+}
+
+
+@lru_cache(maxsize=4)
+def _port_from_file(path: Path, mtime_ns: int) -> int:
+    """Parse a server port file; cached until the file's mtime changes."""
+    return int(path.read_text(encoding="utf-8").strip())
+
+
+def _discover_port(default: int = 19470) -> int:
+    """Return the port the local server advertised, or *default*.
+
+    Costs one ``stat`` per call; the file is only re-read when a server
+    (re)start rewrites it.
+    """
+    port_file = _IPC_DIR / "aurarouter.port"
+    try:
+        mtime_ns = port_file.stat().st_mtime_ns
+    except OSError:
+        return default
+    return _port_from_file(port_file, mtime_ns)
+
+
+def _recv_line_into(sock: socket.socket, buf: bytearray) -> int:
+    """Read from *sock* into *buf* until a newline or EOF.
+
+    Uses ``recv_into`` so no intermediate ``bytes`` objects are created.
+    *buf* grows in ``_RECV_SIZE`` steps if the message does not fit.
+    Returns the number of bytes received.
+    """
+    used = 0
+    while True:
+        if used == len(buf):
+            buf.extend(bytes(_RECV_SIZE))
+        with memoryview(buf)[used:] as view:
+            n = sock.recv_into(view)
+        if not n:
+            break
+        used += n
+        if buf.find(b"\n", used - n, used) != -1:
+            break
+    return used
+
+
+def _decode_line(data: bytes | bytearray | memoryview) -> dict:
+    """Parse one received message.
+
+    Both parsers accept UTF-8 bytes as-is and ignore the surrounding
+    whitespace, trailing newline included.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
 
 class IPCServer:
     """JSON-RPC server over named pipe (Windows) or Unix socket.
 
     Register handlers, then call ``start()`` to begin accepting connections
-    in a background daemon thread.
+    in a background daemon thread.  Accepted connections are handled on a
+    bounded worker pool rather than a thread apiece.
 
     Usage::
 
@@ -49,6 +131,12 @@ class IPCServer:
         self._handlers: dict[str, Callable[..., Any]] = {}
         self._server_socket: Optional[socket.socket] = None
         self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Free list of receive buffers, at most one per worker.
+        self._bufpool: queue.LifoQueue[bytearray] = queue.LifoQueue(_MAX_WORKERS)
+        # (reader, writer) socket pair; a byte written by stop() wakes the
+        # accept loop immediately instead of waiting on a poll timeout.
+        self._wakeup: Optional[tuple[socket.socket, socket.socket]] = None
         self._running = False
         self._ready_event = threading.Event()
 
@@ -79,6 +167,10 @@ class IPCServer:
             _IPC_DIR.mkdir(parents=True, exist_ok=True)
 
         self._ready_event.clear()
+        self._pool = ThreadPoolExecutor(
+            max_workers=_MAX_WORKERS, thread_name_prefix="AuraRouter-IPC-W"
+        )
+        self._wakeup = socket.socketpair()
         self._running = True
         self._thread = threading.Thread(
             target=self._serve_loop, name="AuraRouter-IPC", daemon=True
@@ -94,7 +186,7 @@ class IPCServer:
     def stop(self) -> None:
         """Stop the IPC server."""
         self._running = False
-        # Close the server socket to unblock accept().
+        self._wake()
         if self._server_socket is not None:
             try:
                 self._server_socket.close()
@@ -102,8 +194,23 @@ class IPCServer:
                 pass
         if self._thread is not None:
             self._thread.join(timeout=3)
+        if self._wakeup is not None:
+            for sock in self._wakeup:
+                sock.close()
+            self._wakeup = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         logger.info("IPC server stopped")
 
+    def _wake(self) -> None:
+        """Break the accept loop out of ``select()``."""
+        if self._wakeup is not None:
+            try:
+                self._wakeup[1].send(b"\0")
+            except OSError:
+                pass
+
     def _serve_loop(self) -> None:
         """Accept connections and handle requests."""
         try:
@@ -118,23 +225,10 @@ class IPCServer:
     def _serve_unix(self) -> None:
         """Serve on a Unix domain socket."""
         self._server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        self._server_socket.settimeout(1.0)
         self._server_socket.bind(self._address)
         self._server_socket.listen(5)
         self._ready_event.set()
-
-        while self._running:
-            try:
-                conn, _ = self._server_socket.accept()
-            except socket.timeout:
-                continue
-            except OSError:
-                break
-            threading.Thread(
-                target=self._handle_connection,
-                args=(conn,),
-                daemon=True,
-            ).start()
+        self._accept_loop()
 
     def _serve_win32(self) -> None:
         """Serve on a TCP loopback socket (Windows named pipes require
@@ -143,7 +237,6 @@ class IPCServer:
         """
         self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._server_socket.settimeout(1.0)
         # Bind to localhost. Port 0 lets the OS assign an ephemeral port.
         self._server_socket.bind(("127.0.0.1", self._port))
         self._server_socket.listen(5)
@@ -155,18 +248,8 @@ class IPCServer:
         _IPC_DIR.mkdir(parents=True, exist_ok=True)
         port_file.write_text(str(self._bound_port), encoding="utf-8")
 
-        while self._running:
-            try:
-                conn, _ = self._server_socket.accept()
-            except socket.timeout:
-                continue
-            except OSError:
-                break
-            threading.Thread(
-                target=self._handle_connection,
-                args=(conn,),
-                daemon=True,
-            ).start()
+        # Replies are single small writes; don't let Nagle hold them.
+        self._accept_loop(nodelay=True)
 
         # Clean up port file.
         try:
@@ -174,23 +257,62 @@ class IPCServer:
         except OSError:
             pass
 
+    def _accept_loop(self, nodelay: bool = False) -> None:
+        """Hand accepted connections to the worker pool until stopped.
+
+        Blocks in ``select()`` on the listener and the wakeup socket, so
+        an idle server uses no CPU and ``stop()`` takes effect at once.
+        """
+        listener = self._server_socket
+        listener.setblocking(False)
+        with selectors.DefaultSelector() as sel:
+            sel.register(listener, selectors.EVENT_READ)
+            sel.register(self._wakeup[0], selectors.EVENT_READ)
+            while self._running:
+                for key, _ in sel.select():
+                    if key.fileobj is not listener:
+                        return
+                    try:
+                        conn, _ = listener.accept()
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        return
+                    if nodelay:
+                        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    try:
+                        future = self._pool.submit(self._handle_connection, conn)
+                    except RuntimeError:  # pool already shut down by stop()
+                        conn.close()
+                        return
+                    # stop() cancels connections still queued; close them
+                    # so their clients see EOF instead of hanging.
+                    future.add_done_callback(
+                        lambda f, c=conn: c.close() if f.cancelled() else None
+                    )
+
     def _handle_connection(self, conn: socket.socket) -> None:
         """Handle a single client connection (one request/response)."""
         try:
             conn.settimeout(10.0)
-            data = b""
-            while True:
-                chunk = conn.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if b"\n" in data:
-                    break
-
-            if not data:
-                return
-
-            request = json.loads(data.decode("utf-8").strip())
+            try:
+                buf = self._bufpool.get_nowait()
+            except queue.Empty:
+                buf = bytearray(_RECV_SIZE)
+            try:
+                used = _recv_line_into(conn, buf)
+                if not used:
+                    return
+                with memoryview(buf)[:used] as view:
+                    request = _decode_line(view)
+            finally:
+                # Buffers grown for an oversized message are not kept.
+                if len(buf) == _RECV_SIZE:
+                    try:
+                        self._bufpool.put_nowait(buf)
+                    except queue.Full:
+                        pass
+
             method = request.get("method", "")
             req_id = request.get("id")
             params = request.get("params", {})
@@ -211,7 +333,7 @@ class IPCServer:
                         "error": {"code": -32000, "message": str(exc)},
                     }
 
-            conn.sendall((json.dumps(response) + "\n").encode("utf-8"))
+            conn.sendall(_encode_line(response))
         except Exception:
             logger.debug("IPC connection error", exc_info=True)
         finally:
@@ -255,11 +377,12 @@ class IPCClient:
         Raises ``ConnectionError`` if the server is not reachable.
         Raises ``RuntimeError`` if the server returns an error response.
         """
-        request = {"method": method, "id": 1}
         if params:
-            request["params"] = params
-
-        payload = (json.dumps(request) + "\n").encode("utf-8")
+            payload = _encode_line({"method": method, "id": 1, "params": params})
+        else:
+            payload = _PARAMLESS_REQUESTS.get(method) or _encode_line(
+                {"method": method, "id": 1}
+            )
 
         try:
             sock = self._connect(timeout)
@@ -271,21 +394,15 @@ class IPCClient:
             sock.sendall(payload)
 
             # Read response.
-            data = b""
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if b"\n" in data:
-                    break
-
-            if not data:
+            buf = bytearray(_RECV_SIZE)
+            used = _recv_line_into(sock, buf)
+            if not used:
                 raise ConnectionError("Empty response from IPC server")
 
-            response = json.loads(data.decode("utf-8").strip())
-            if "error" in response:
-                err = response["error"]
+            with memoryview(buf)[:used] as view:
+                response = _decode_line(view)
+            err = response.get("error")
+            if err is not None:
                 raise RuntimeError(f"IPC error: {err.get('message', err)}")
 
             return response.get("result")
@@ -302,12 +419,9 @@ class IPCClient:
             if self._port_override is not None:
                 port = self._port_override
             else:
-                port_file = _IPC_DIR / "aurarouter.port"
-                if port_file.is_file():
-                    port = int(port_file.read_text(encoding="utf-8").strip())
-                else:
-                    port = 19470
+                port = _discover_port()
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             sock.settimeout(timeout)
             sock.connect(("127.0.0.1", port))
             return sock
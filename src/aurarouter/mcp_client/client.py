@@ -6,15 +6,34 @@ Tool discovery via ``tools/list``, tool invocation via ``tools/call``.
 
 from __future__ import annotations
 
-import uuid
+import asyncio
+import itertools
+import json
+from collections.abc import Sequence
 from typing import Any
 
 import httpx
 
+try:
+    import h2  # enables httpx's HTTP/2 transport
+except ImportError:
+    h2 = None  # type: ignore
+
 from aurarouter._logging import get_logger
 
 logger = get_logger("AuraRouter.McpClient")
 
+# Connection pool bounds for the per-client persistent HTTP clients.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=16, keepalive_expiry=60.0
+)
+
+# ``tools/list`` takes no arguments, so its request body is encoded once.
+_TOOLS_LIST_BODY = json.dumps(
+    {"jsonrpc": "2.0", "id": "tools-list", "method": "tools/list"}
+).encode("utf-8")
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class GridMcpClient:
     """Client for an external MCP-compatible server.
@@ -23,6 +42,14 @@ class GridMcpClient:
     ``POST /mcp/message`` endpoint. Discovers tools via ``tools/list``
     and invokes them via ``tools/call``.
 
+    A single ``httpx.Client`` is created on first use and reused for every
+    request, so repeated calls share pooled keep-alive connections, and
+    concurrent calls are multiplexed over HTTP/2 when ``h2`` is installed
+    (``aurarouter[http2]``) and the server negotiates it.  Call
+    :meth:`close` (or use the client as a context manager) to release it.
+    :meth:`aconnect` and :meth:`acall_tool` are async equivalents over a
+    separate ``httpx.AsyncClient``, released with :meth:`aclose`.
+
     Args:
         base_url: Root URL of the MCP server (e.g. ``"http://localhost:8080"``).
         name: Optional human-readable name for this client.
@@ -40,9 +67,54 @@ class GridMcpClient:
         self._timeout = timeout
         self._tools: list[dict] = []
         self._models: list[dict] = []
-        self._capabilities: set[str] = set()
+        self._capabilities: frozenset[str] = frozenset()
         self._connected = False
         self._last_response_headers: dict[str, str] = {}
+        self._http: httpx.Client | None = None
+        self._ahttp: httpx.AsyncClient | None = None
+        # JSON-RPC ids only need to be unique per client; next() on a
+        # count is atomic under the GIL, so no lock is needed.
+        self._request_ids = itertools.count(1)
+
+    def __enter__(self) -> GridMcpClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections.  Safe to call repeatedly.
+
+        The client can still be used afterwards; a fresh connection pool
+        is opened on the next request.
+        """
+        http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP connections.  Safe to call repeatedly.
+
+        An ``httpx.AsyncClient`` is bound to the event loop it first ran
+        on, so close it before that loop ends if the client outlives it.
+        """
+        ahttp, self._ahttp = self._ahttp, None
+        if ahttp is not None:
+            await ahttp.aclose()
+
+    def _client(self) -> httpx.Client:
+        if self._http is None:
+            self._http = httpx.Client(
+                timeout=self._timeout, limits=_HTTP_LIMITS, http2=h2 is not None
+            )
+        return self._http
+
+    def _aclient(self) -> httpx.AsyncClient:
+        if self._ahttp is None:
+            self._ahttp = httpx.AsyncClient(
+                timeout=self._timeout, limits=_HTTP_LIMITS, http2=h2 is not None
+            )
+        return self._ahttp
 
     @property
     def name(self) -> str:
@@ -65,12 +137,36 @@ class GridMcpClient:
         return f"{self._base_url}/mcp/message"
 
     def _jsonrpc_request(self, method: str, params: dict | None = None) -> dict:
-        return {
-            "jsonrpc": "2.0",
-            "id": uuid.uuid4().hex,
-            "method": method,
-            "params": params or {},
-        }
+        # JSON-RPC 2.0 allows "params" to be omitted when there are none.
+        request = {"jsonrpc": "2.0", "id": next(self._request_ids), "method": method}
+        if params:
+            request["params"] = params
+        return request
+
+    def _apply_tools_list(self, rpc_response: dict) -> bool:
+        """Store the tools from a ``tools/list`` response."""
+        err = rpc_response.get("error")
+        if err is not None:
+            logger.error("[%s] MCP tools/list error: %s", self._name, err)
+            return False
+
+        result = rpc_response.get("result", {})
+        self._tools = result.get("tools", [])
+        self._connected = True
+
+        # Derive capabilities from tool names; frozen so it can be shared
+        # with callers without copying.
+        self._capabilities = frozenset(
+            tool["name"] for tool in self._tools if "name" in tool
+        )
+
+        logger.info(
+            "[%s] Connected: %d tools, %d models",
+            self._name,
+            len(self._tools),
+            len(self._models),
+        )
+        return True
 
     def connect(self) -> bool:
         """Discover tools and models from the remote MCP server.
@@ -80,43 +176,71 @@ class GridMcpClient:
         Connection failures are logged but never raised.
         """
         try:
-            with httpx.Client(timeout=self._timeout) as client:
-                # Tool discovery via JSON-RPC 2.0
-                rpc_request = self._jsonrpc_request("tools/list")
-                resp = client.post(self._rpc_url(), json=rpc_request)
-                resp.raise_for_status()
-                rpc_response = resp.json()
-
-                if "error" in rpc_response:
-                    logger.error(
-                        "[%s] MCP tools/list error: %s",
-                        self._name,
-                        rpc_response["error"],
-                    )
-                    return False
-
-                result = rpc_response.get("result", {})
-                self._tools = result.get("tools", [])
-                self._connected = True
-
-                # Derive capabilities from tool names
-                self._capabilities = {
-                    tool.get("name", "") for tool in self._tools
-                }
-
-                logger.info(
-                    "[%s] Connected: %d tools, %d models",
-                    self._name,
-                    len(self._tools),
-                    len(self._models),
-                )
-                return True
+            resp = self._client().post(
+                self._rpc_url(), content=_TOOLS_LIST_BODY, headers=_JSON_HEADERS
+            )
+            resp.raise_for_status()
+            return self._apply_tools_list(resp.json())
+        except Exception as exc:
+            self._connected = False
+            logger.warning("[%s] Connection failed: %s", self._name, exc)
+            return False
 
+    async def aconnect(self) -> bool:
+        """Async variant of :meth:`connect` over ``httpx.AsyncClient``."""
+        try:
+            resp = await self._aclient().post(
+                self._rpc_url(), content=_TOOLS_LIST_BODY, headers=_JSON_HEADERS
+            )
+            resp.raise_for_status()
+            return self._apply_tools_list(resp.json())
         except Exception as exc:
             self._connected = False
             logger.warning("[%s] Connection failed: %s", self._name, exc)
             return False
 
+    @classmethod
+    async def aconnect_batch(cls, clients: Sequence[GridMcpClient]) -> list[bool]:
+        """Run ``tools/list`` for clients sharing one ``base_url`` in one POST.
+
+        Sends a JSON-RPC 2.0 batch through the first client and hands each
+        reply to its client by request id.  If the server rejects batches,
+        falls back to concurrent :meth:`aconnect` calls.  Returns one
+        connected flag per client, in order.
+        """
+        if len(clients) == 1:
+            return [await clients[0].aconnect()]
+
+        lead = clients[0]
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "tools/list"}
+            for i in range(len(clients))
+        ]
+        try:
+            resp = await lead._aclient().post(lead._rpc_url(), json=batch)
+            resp.raise_for_status()
+            replies = resp.json()
+            if not isinstance(replies, list):
+                raise ValueError("server did not return a batch response")
+        except Exception as exc:
+            logger.debug(
+                "[%s] Batched tools/list failed (%s); connecting individually",
+                lead._name, exc,
+            )
+            return list(await asyncio.gather(*(c.aconnect() for c in clients)))
+
+        by_id = {r.get("id"): r for r in replies if isinstance(r, dict)}
+        results: list[bool] = []
+        for i, client in enumerate(clients):
+            reply = by_id.get(i)
+            if reply is None:
+                client._connected = False
+                logger.warning("[%s] No reply in tools/list batch", client._name)
+                results.append(False)
+            else:
+                results.append(client._apply_tools_list(reply))
+        return results
+
     def get_tools(self) -> list[dict]:
         """Return discovered tools."""
         return self._tools
@@ -148,10 +272,34 @@ class GridMcpClient:
             self._models = []
         return self._models
 
-    def get_capabilities(self) -> set[str]:
+    def get_capabilities(self) -> frozenset[str]:
         """Return advertised capabilities (derived from tool names)."""
         return self._capabilities
 
+    def _tool_call_request(self, tool_name: str, arguments: dict) -> dict:
+        if not self._connected:
+            raise ConnectionError(
+                f"[{self._name}] Not connected. Call connect() first."
+            )
+        return self._jsonrpc_request(
+            "tools/call",
+            {"name": tool_name, "arguments": arguments},
+        )
+
+    def _tool_result(self, tool_name: str, resp: httpx.Response) -> Any:
+        resp.raise_for_status()
+        self._last_response_headers = dict(resp.headers)
+        rpc_response = resp.json()
+
+        err = rpc_response.get("error")
+        if err is not None:
+            raise RuntimeError(
+                f"MCP tool call '{tool_name}' failed: "
+                f"[{err.get('code')}] {err.get('message')}"
+            )
+
+        return rpc_response.get("result")
+
     def call_tool(self, tool_name: str, headers: dict[str, str] | None = None, **kwargs: Any) -> Any:
         """Invoke a remote MCP tool via JSON-RPC 2.0.
 
@@ -168,26 +316,18 @@ class GridMcpClient:
             httpx.HTTPStatusError: On HTTP-level failures.
             RuntimeError: On JSON-RPC error responses.
         """
-        if not self._connected:
-            raise ConnectionError(
-                f"[{self._name}] Not connected. Call connect() first."
-            )
-
-        rpc_request = self._jsonrpc_request(
-            "tools/call",
-            {"name": tool_name, "arguments": kwargs},
+        rpc_request = self._tool_call_request(tool_name, kwargs)
+        resp = self._client().post(
+            self._rpc_url(), json=rpc_request, headers=headers or {}
         )
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.post(self._rpc_url(), json=rpc_request, headers=headers or {})
-            resp.raise_for_status()
-            self._last_response_headers = dict(resp.headers)
-            rpc_response = resp.json()
-
-        if "error" in rpc_response:
-            err = rpc_response["error"]
-            raise RuntimeError(
-                f"MCP tool call '{tool_name}' failed: "
-                f"[{err.get('code')}] {err.get('message')}"
-            )
-
-        return rpc_response.get("result")
+        return self._tool_result(tool_name, resp)
+
+    async def acall_tool(
+        self, tool_name: str, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> Any:
+        """Async variant of :meth:`call_tool`; raises the same errors."""
+        rpc_request = self._tool_call_request(tool_name, kwargs)
+        resp = await self._aclient().post(
+            self._rpc_url(), json=rpc_request, headers=headers or {}
+        )
+        return self._tool_result(tool_name, resp)
@@ -2,48 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import TYPE_CHECKING
 
 from aurarouter._logging import get_logger
+from aurarouter.mcp_client.client import GridMcpClient
 
 if TYPE_CHECKING:
     from aurarouter.config import ConfigLoader
-    from aurarouter.mcp_client.client import GridMcpClient
 
 logger = get_logger("AuraRouter.McpRegistry")
 
+# Seconds an aggregated remote tool list is reused before being rebuilt.
+_TOOLS_TTL = 5.0
+
 
 class McpClientRegistry:
     """Registry of connected external MCP clients.
 
     Provides centralised management of :class:`GridMcpClient` instances
     and aggregated access to their tools and models.
+
+    Writers update the client dict under a lock and publish an immutable
+    ``(name, client)`` tuple; readers iterate that snapshot without
+    locking, so routing lookups never race ``register``/``unregister``.
     """
 
     def __init__(self) -> None:
+        self._lock = threading.Lock()
         self._clients: dict[str, GridMcpClient] = {}
+        self._entries: tuple[tuple[str, GridMcpClient], ...] = ()
+        self._tools_cache: list[dict] | None = None
+        self._tools_cache_ts = 0.0
 
     def register(self, name: str, client: GridMcpClient) -> None:
         """Register a client under the given name."""
-        self._clients[name] = client
+        with self._lock:
+            self._clients[name] = client
+            self._entries = tuple(self._clients.items())
+            self._tools_cache = None
         logger.info(f"Registered MCP client: {name}")
 
     def unregister(self, name: str) -> bool:
-        """Remove a client. Returns ``True`` if it existed."""
-        if name in self._clients:
-            del self._clients[name]
+        """Remove and close a client. Returns ``True`` if it existed."""
+        with self._lock:
+            client = self._clients.pop(name, None)
+            if client is not None:
+                self._entries = tuple(self._clients.items())
+                self._tools_cache = None
+        if client is not None:
+            client.close()
             logger.info(f"Unregistered MCP client: {name}")
             return True
         return False
 
     def get_clients(self) -> dict[str, GridMcpClient]:
         """Return all registered clients."""
-        return dict(self._clients)
+        return dict(self._entries)
 
     def get_clients_with_capability(self, cap: str) -> list[GridMcpClient]:
         """Return clients that advertise the given capability."""
         return [
-            c for c in self._clients.values()
+            c for _, c in self._entries
             if c.connected and cap in c.get_capabilities()
         ]
 
@@ -51,17 +73,74 @@ class McpClientRegistry:
         """Aggregate tools from all connected clients.
 
         Each tool dict is enriched with a ``_source_client`` key
-        identifying which client it came from.
+        identifying which client it came from.  The aggregate is rebuilt
+        at most every few seconds, and sooner after the client set changes
+        or :meth:`arefresh_all` runs.  Callers get their own list, but the
+        tool dicts in it are shared.
         """
-        tools: list[dict] = []
-        for name, client in self._clients.items():
-            if not client.connected:
-                continue
-            for tool in client.get_tools():
-                enriched = dict(tool)
-                enriched.setdefault("_source_client", name)
-                tools.append(enriched)
-        return tools
+        now = time.monotonic()
+        if (
+            self._tools_cache is None
+            or now - self._tools_cache_ts >= _TOOLS_TTL
+        ):
+            self._tools_cache = [
+                {"_source_client": name, **tool}
+                for name, client in self._entries
+                if client.connected
+                for tool in client.get_tools()
+            ]
+            self._tools_cache_ts = now
+        return list(self._tools_cache)
+
+    async def arefresh_all(self) -> dict[str, bool]:
+        """Re-run ``tools/list`` on every client concurrently.
+
+        Clients that share a ``base_url`` are refreshed with one JSON-RPC
+        batch request (see :meth:`GridMcpClient.aconnect_batch`).  Returns
+        a mapping of client name to whether it connected.  A group that
+        raises is reported as ``False`` rather than failing the refresh.
+        """
+        groups: dict[str, list[tuple[str, GridMcpClient]]] = {}
+        for name, client in self._entries:
+            groups.setdefault(client.base_url, []).append((name, client))
+        results = await asyncio.gather(
+            *(
+                GridMcpClient.aconnect_batch([c for _, c in group])
+                for group in groups.values()
+            ),
+            return_exceptions=True,
+        )
+        self._tools_cache = None
+        status: dict[str, bool] = {}
+        for group, flags in zip(groups.values(), results):
+            if isinstance(flags, BaseException):
+                flags = [False] * len(group)
+            for (name, _), ok in zip(group, flags):
+                status[name] = ok is True
+        return status
+
+    async def aget_all_remote_tools(self) -> list[dict]:
+        """Refresh all clients concurrently, then aggregate their tools."""
+        await self.arefresh_all()
+        return self.get_all_remote_tools()
+
+    def refresh_all(self) -> dict[str, bool]:
+        """Blocking wrapper around :meth:`arefresh_all` for sync callers.
+
+        Runs on a private event loop, closing each client's async HTTP
+        pool before the loop exits.  Must not be called from a running
+        event loop.
+        """
+        async def _run() -> dict[str, bool]:
+            try:
+                return await self.arefresh_all()
+            finally:
+                await asyncio.gather(
+                    *(c.aclose() for _, c in self._entries),
+                    return_exceptions=True,
+                )
+
+        return asyncio.run(_run())
 
     def sync_models(
         self,
@@ -81,11 +160,16 @@ class McpClientRegistry:
         Returns the number of models added.
         """
         added = 0
-        for name, client in self._clients.items():
+        # One snapshot of configured ids instead of copying a model config
+        # per candidate.
+        existing = set(config.get_all_model_ids())
+        for name, client in self._entries:
             if not client.connected:
                 continue
             if model_discovery_tool:
                 client.discover_models(model_discovery_tool)
+            endpoint = client.base_url
+            grid_tag = f"grid:{name}"
             for model_info in client.get_models():
                 model_id = model_info.get("id") or model_info.get("name", "")
                 if not model_id:
@@ -95,16 +179,17 @@ class McpClientRegistry:
                 remote_id = f"{name}/{model_id}"
 
                 # Skip if already configured
-                if config.get_model_config(remote_id):
+                if remote_id in existing:
                     continue
 
                 model_cfg = {
                     "provider": model_info.get("provider", "openapi"),
-                    "endpoint": client.base_url,
+                    "endpoint": endpoint,
                     "model_name": model_id,
-                    "tags": ["remote", f"grid:{name}"],
+                    "tags": ["remote", grid_tag],
                 }
                 config.set_model(remote_id, model_cfg)
+                existing.add(remote_id)
                 logger.info(f"Auto-registered remote model: {remote_id}")
                 added += 1
 
@@ -8,28 +8,152 @@ decoration and registration happens in server.py.
 from __future__ import annotations
 
 import json
+import re
+import threading
+import time
 from dataclasses import asdict
-from typing import TYPE_CHECKING
+from pathlib import Path
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable
 
 from aurarouter._logging import get_logger
+from aurarouter.plan_checkpoint import PlanCheckpoint
 from aurarouter.routing import (
+    PlanStep,
     analyze_intent,
     generate_correction_plan,
     generate_plan,
+    plan_step_budget,
+    plan_waves,
     review_output,
+    sequential_dependencies,
 )
+from aurarouter.tokens import count_tokens
+from aurarouter.worker_pool import bounded_map, run_coroutine
 
 if TYPE_CHECKING:
     from aurarouter.analyzer_protocol import AnalysisResult, RoutingContext
     from aurarouter.config import ConfigLoader
     from aurarouter.fabric import ComputeFabric
+    from aurarouter.response_cache import ResponseCache
     from aurarouter.savings.triage import TriageRouter
+    from aurarouter.semantic_cache import SemanticCache
     from aurarouter.sessions.manager import SessionManager
     from aurarouter.mcp_client.registry import McpClientRegistry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = get_logger("AuraRouter.MCPTools")
 
 
+def _json_dumps(data: Any) -> str:
+    """Serialize a tool's JSON reply with two-space indentation.
+
+    Uses orjson when installed, falling back to the stdlib for values
+    orjson rejects (such as integers wider than 64 bits).  Both paths emit
+    non-ASCII text unescaped and reject dates and dataclasses, so a reply
+    does not depend on whether orjson is present.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# ---------------------------------------------------------------------------
+# Response cache helper (shared by the single-call tool paths)
+# ---------------------------------------------------------------------------
+
+def _execute_cached(
+    fabric: ComputeFabric,
+    cache: ResponseCache | None,
+    namespace: str,
+    role: str,
+    prompt: str,
+    **execute_kwargs: Any,
+) -> str | None:
+    """Run *prompt* on *role*, answering from *cache* when possible.
+
+    Returns the response text, or ``None`` when every model failed.
+    Failures are never cached.
+    """
+    if cache is not None:
+        hit = cache.lookup(namespace, prompt)
+        if hit is not None:
+            logger.info("[cache] Hit for %s", namespace)
+            return hit
+    result = fabric.execute(role, prompt, **execute_kwargs)
+    text = result.text if result else None
+    if cache is not None and text:
+        cache.store(namespace, prompt, text)
+    return text
+
+
+_UNFINISHED_STEP = re.compile(
+    r"^# (?:Correction )?Step \d+ (?:Failed|Skipped)", re.MULTILINE
+)
+
+
+def _semantic_cached(
+    semantic_cache: SemanticCache | None,
+    namespace: str,
+    key: str,
+    produce: Callable[[], str],
+) -> str:
+    """Return the answer cached for a request like *key*, else ``produce()``.
+
+    Only complete answers are stored: errors and plans with failed or
+    skipped steps are not.
+    """
+    if semantic_cache is None:
+        return produce()
+    hit = semantic_cache.lookup(namespace, key)
+    if hit is not None:
+        logger.info("[semantic-cache] Hit for %s", namespace)
+        return hit
+    output = produce()
+    if (
+        output
+        and not output.lstrip().upper().startswith("ERROR")
+        and not _UNFINISHED_STEP.search(output)
+    ):
+        semantic_cache.store(namespace, key, output)
+    return output
+
+
+# ---------------------------------------------------------------------------
+# Triage helper (shared by route_task and generate_code)
+# ---------------------------------------------------------------------------
+
+def _triage_role(
+    triage_router: TriageRouter | None,
+    complexity: int,
+    role: str,
+    log_prefix: str,
+) -> str:
+    """Return the triage router's role for *complexity*, else *role*.
+
+    Single place where "triage disabled" is handled, so the tool bodies
+    take one path whether or not a router is configured.
+    """
+    if triage_router is None:
+        return role
+    selected = triage_router.select_role(complexity)
+    logger.info("[%s] Triage selected role: %s", log_prefix, selected)
+    return selected
+
+
 # ---------------------------------------------------------------------------
 # Review loop helper (shared by route_task and generate_code)
 # ---------------------------------------------------------------------------
@@ -68,16 +192,27 @@ def _apply_review_loop(
         # Generate and execute correction plan
         correction_steps = generate_correction_plan(fabric, task, output, review)
         logger.info("[review] Correction plan: %d steps", len(correction_steps))
-        corrected: list[str] = []
-        for i, step in enumerate(correction_steps):
-            step_prompt = (
-                f"GOAL: {step}\nCONTEXT: {context}\n"
-                f"PREVIOUS_OUTPUT:\n{output}\n"
-                f"REVIEWER_FEEDBACK: {review.feedback}"
-            )
-            chunk_result = fabric.execute(role, step_prompt)
-            chunk = chunk_result.text if chunk_result else ""
-            corrected.append(chunk or f"\n# Correction Step {i + 1} Failed.")
+        # Every correction step shares the context, output and feedback, so
+        # they lead the prompt and, when possible, are sent once for all steps.
+        head = (
+            f"CONTEXT: {context}\n"
+            f"PREVIOUS_OUTPUT:\n{output}\n"
+            f"REVIEWER_FEEDBACK: {review.feedback}\n"
+        )
+        corrected = None
+        if 1 < len(correction_steps) <= fabric.get_plan_batch_size():
+            corrected = fabric.execute_batch(role, head, correction_steps)
+        if corrected is None:
+            # The steps are independent, so their calls overlap.
+            def correct(step: str) -> str:
+                chunk_result = fabric.execute(role, f"{head}GOAL: {step}")
+                return chunk_result.text if chunk_result else ""
+
+            corrected = [""] * len(correction_steps)
+            for i, chunk in bounded_map(
+                correct, correction_steps, fabric.get_max_plan_concurrency(),
+            ):
+                corrected[i] = chunk or f"\n# Correction Step {i + 1} Failed."
         output = "\n".join(corrected)
 
     return output
@@ -229,6 +364,243 @@ async def _call_remote_analyzer(
     return None
 
 
+# ---------------------------------------------------------------------------
+# Prompt and plan execution helpers (shared by route_task and generate_code)
+# ---------------------------------------------------------------------------
+
+def _task_prompt(
+    task: str,
+    context: str = "",
+    format: str = "text",
+    respond_only: bool = False,
+) -> str:
+    """Build a single-call ``TASK:`` prompt in one join."""
+    lines = [f"TASK: {task}"]
+    if context:
+        lines.append(f"CONTEXT: {context}")
+    if format != "text":
+        lines.append(f"FORMAT: {format}")
+    if respond_only:
+        lines.append("RESPOND WITH OUTPUT ONLY.")
+    return "\n".join(lines)
+
+
+def _plan_prompts(
+    head: str, previous_label: str,
+) -> tuple[Callable[[str, list[str]], str], Callable[[list[str]], str]]:
+    """Return the step-prompt and batch-prefix builders for a plan.
+
+    *head* holds the text shared by every step (instruction, LANG/FORMAT,
+    CONTEXT) and is built once per plan.  It comes first and the step
+    goal last, so providers with prompt-prefix caching can reuse it.
+    """
+    def batch_prefix(previous: list[str]) -> str:
+        return f"{head}{previous_label}: {previous}"
+
+    def step_prompt(goal: str, previous: list[str]) -> str:
+        return f"{head}{previous_label}: {previous}\nGOAL: {goal}"
+
+    return step_prompt, batch_prefix
+
+
+def _route_plan_prompts(
+    context: str, format: str,
+) -> tuple[Callable[[str, list[str]], str], Callable[[list[str]], str]]:
+    """Plan prompt builders for route_task."""
+    lines = ["Return ONLY the requested output."]
+    if format != "text":
+        lines.append(f"FORMAT: {format}")
+    lines.append(f"CONTEXT: {context}\n")
+    return _plan_prompts("\n".join(lines), "PREVIOUS_OUTPUT")
+
+
+def _open_checkpoint(
+    fabric: ComputeFabric,
+    checkpoint_path: Path | str | None,
+    namespace: str,
+    task: str,
+    context: str,
+) -> PlanCheckpoint | None:
+    """Return the plan checkpoint to use, or ``None`` when checkpointing is off.
+
+    An explicit *checkpoint_path* always enables it; otherwise
+    ``execution.plan_checkpoints`` selects a file derived from the task.
+    """
+    if checkpoint_path is not None:
+        return PlanCheckpoint(Path(checkpoint_path).expanduser())
+    if fabric.get_plan_checkpoints():
+        return PlanCheckpoint.for_task(namespace, task, context)
+    return None
+
+
+def _checkpointed_plan(
+    checkpoint: PlanCheckpoint | None, make_plan: Callable[[], list], log_prefix: str,
+) -> list:
+    """Return the plan recorded in *checkpoint*, or make and record a new one."""
+    if checkpoint is None:
+        return make_plan()
+    plan = checkpoint.plan
+    if plan is not None:
+        logger.info(
+            "[%s] Resuming plan from %s (%d of %d steps done).",
+            log_prefix, checkpoint.path, len(checkpoint.completed), len(plan),
+        )
+        return plan
+    return checkpoint.start(make_plan())
+
+
+#: Seconds before the first retry of a failed plan step; doubles per retry.
+_STEP_RETRY_DELAY = 0.5
+
+
+def _execute_plan(
+    fabric: ComputeFabric,
+    role: str,
+    plan: list,
+    build_prompt: Callable[[str, list[str]], str],
+    log_prefix: str,
+    build_batch_prefix: Callable[[list[str]], str] | None = None,
+    checkpoint: PlanCheckpoint | None = None,
+    **execute_kwargs: Any,
+) -> list[str]:
+    """Execute plan steps in dependency order and return the output parts.
+
+    *plan* items are :class:`PlanStep` objects or plain strings; a string
+    step depends on the last ``PLAN_CONTEXT_WINDOW`` steps, which keeps a
+    plain plan strictly sequential without resending every earlier output.
+    Steps whose dependencies are complete form a wave: a wave's calls are
+    all submitted before any result is awaited, bounded by
+    ``execution.max_plan_concurrency``.  *build_prompt* receives a step
+    goal and the output parts of the steps it depends on.
+
+    With *build_batch_prefix*, up to ``execution.plan_batch_size`` steps of
+    a wave share one prompt via :meth:`ComputeFabric.execute_batch`; the
+    prefix is built from the parts those steps depend on.  A batch whose
+    reply cannot be split falls back to one call per step.
+
+    A failed step is retried ``execution.plan_step_retries`` times with
+    exponential backoff.  No further waves start once
+    ``execution.max_consecutive_step_failures`` steps in a row have failed
+    or the prompts sent exceed ``execution.plan_token_budget`` tokens; the
+    remaining steps are reported as skipped.
+
+    With *checkpoint*, steps it records as completed are not run again,
+    unless a step they depend on has to run, and each newly completed step
+    is recorded.  The checkpoint is discarded once every step has
+    succeeded; after a failure it is kept for a retry until it expires.
+    """
+    steps = [
+        s if isinstance(s, PlanStep) else PlanStep(str(s), sequential_dependencies(i))
+        for i, s in enumerate(plan)
+    ]
+    waves = plan_waves(steps)
+
+    parts: list[str] = [""] * len(steps)
+    # A recorded step is reused only if every step it builds on is, too.
+    recorded = checkpoint.completed if checkpoint is not None else {}
+    resumed: set[int] = set()
+    for i, step in enumerate(steps):
+        if i in recorded and all(d in resumed for d in step.depends_on):
+            parts[i] = recorded[i]
+            resumed.add(i)
+    batch_size = fabric.get_plan_batch_size() if build_batch_prefix else 1
+    retries = fabric.get_plan_step_retries()
+    max_failures = fabric.get_max_consecutive_step_failures()
+    token_budget = fabric.get_plan_token_budget()
+    failed: set[int] = set()
+    tokens_lock = threading.Lock()
+    tokens_spent = 0
+
+    def spend(prompt: str) -> None:
+        nonlocal tokens_spent
+        tokens = count_tokens(prompt)
+        with tokens_lock:
+            tokens_spent += tokens
+
+    def format_part(i: int, text: str) -> str:
+        if text:
+            part = f"\n# --- Step {i + 1}: {steps[i].goal} ---\n{text}"
+            if checkpoint is not None:
+                checkpoint.record(i, part)
+            return part
+        failed.add(i)
+        return f"\n# Step {i + 1} Failed."
+
+    def run(i: int) -> str:
+        step = steps[i]
+        logger.info("[%s] Step %d: %s", log_prefix, i + 1, step.goal)
+        prompt = build_prompt(step.goal, [parts[d] for d in step.depends_on])
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = _STEP_RETRY_DELAY * 2 ** (attempt - 1)
+                logger.info(
+                    "[%s] Step %d failed; retrying in %.1fs.", log_prefix, i + 1, delay,
+                )
+                time.sleep(delay)
+            spend(prompt)
+            result = fabric.execute(role, prompt, **execute_kwargs)
+            if result and result.text:
+                return format_part(i, result.text)
+        return format_part(i, "")
+
+    def run_batch(chunk: list[int]) -> list[str] | None:
+        for i in chunk:
+            logger.info("[%s] Step %d (batched): %s", log_prefix, i + 1, steps[i].goal)
+        deps = sorted({d for i in chunk for d in steps[i].depends_on})
+        prefix = build_batch_prefix([parts[d] for d in deps])
+        queries = [steps[i].goal for i in chunk]
+        spend(prefix + "".join(queries))
+        answers = fabric.execute_batch(role, prefix, queries, **execute_kwargs)
+        if answers is None:
+            logger.info("[%s] Batch reply unusable; running steps singly.", log_prefix)
+            return None
+        return [format_part(i, text) for i, text in zip(chunk, answers)]
+
+    def fan_out(fn: Callable, items: list) -> list:
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        results: list = [None] * len(items)
+        for k, result in bounded_map(fn, items, fabric.get_max_plan_concurrency()):
+            results[k] = result
+        return results
+
+    streak = 0
+    abort_reason = ""
+    for lv, wave in enumerate(waves):
+        wave = [i for i in wave if i not in resumed]
+        if abort_reason:
+            for i in wave:
+                parts[i] = f"\n# Step {i + 1} Skipped: {abort_reason}."
+            continue
+        pending = list(wave)
+        if batch_size > 1 and len(pending) > 1:
+            chunks = [
+                pending[k:k + batch_size]
+                for k in range(0, len(pending), batch_size)
+            ]
+            pending = [i for chunk in chunks if len(chunk) == 1 for i in chunk]
+            chunks = [chunk for chunk in chunks if len(chunk) > 1]
+            for chunk, done in zip(chunks, fan_out(run_batch, chunks)):
+                if done is None:
+                    pending.extend(chunk)
+                else:
+                    for i, text in zip(chunk, done):
+                        parts[i] = text
+        for i, text in zip(pending, fan_out(run, pending)):
+            parts[i] = text
+        for i in wave:
+            streak = streak + 1 if i in failed else 0
+            if max_failures and streak >= max_failures and not abort_reason:
+                abort_reason = f"plan aborted after {streak} consecutive failed steps"
+        if not abort_reason and token_budget and tokens_spent >= token_budget:
+            abort_reason = f"plan token budget of {token_budget} reached"
+        if abort_reason and lv < len(waves) - 1:
+            logger.warning("[%s] Stopping plan: %s.", log_prefix, abort_reason)
+    if checkpoint is not None and not failed and not abort_reason:
+        checkpoint.discard()
+    return parts
+
+
 # ---------------------------------------------------------------------------
 # route_task
 # ---------------------------------------------------------------------------
@@ -243,6 +615,9 @@ def route_task(
     config: ConfigLoader | None = None,
     options: dict | None = None,
     intent: str | None = None,
+    cache: ResponseCache | None = None,
+    semantic_cache: SemanticCache | None = None,
+    checkpoint_path: Path | str | None = None,
 ) -> str:
     """Route a task to local or specialized AI models with automatic fallback.
 
@@ -254,8 +629,27 @@ def route_task(
     When *options* contains ``routing_hints`` (a list of language/domain
     strings), the federated broker is invoked to collect bids from all
     registered analyzers before falling back to the built-in pipeline.
+
+    When *cache* is given, direct (single-call) answers for plain-text
+    requests are served from and stored in it.  When *semantic_cache* is
+    given, a plain-text request without options that resembles an earlier
+    one is answered from it before any model is called.
+
+    Planned tasks record their progress in *checkpoint_path*, or in a file
+    derived from the task when ``execution.plan_checkpoints`` is enabled,
+    so that rerunning an interrupted task skips the steps already done.
     """
+    if semantic_cache is not None and format == "text" and not options and intent is None:
+        return _semantic_cached(
+            semantic_cache, "route_task", f"{task}\n{context}",
+            lambda: route_task(
+                fabric, triage_router, task=task, context=context,
+                config=config, cache=cache, checkpoint_path=checkpoint_path,
+            ),
+        )
     options = options or {}
+    if format != "text":
+        cache = None  # structured output must follow the current schema
 
     # --- Federated broker path: when routing hints are present ---
     routing_hints = options.get("routing_hints")
@@ -275,9 +669,7 @@ def route_task(
             if loop and loop.is_running():
                 # Already inside an async context (e.g. AuraGrid MAS) —
                 # cannot call run_until_complete.  Use a new thread instead.
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                    bids = pool.submit(asyncio.run, _coro_bids).result()
+                bids = run_coroutine(_coro_bids)
             else:
                 bids = asyncio.run(_coro_bids)
 
@@ -316,10 +708,7 @@ def route_task(
                 # Use the highest-confidence bid's role for execution
                 top = broker_result.merged_plan[0]
                 role = top.get("role", "coding")
-                full_prompt = f"TASK: {task}"
-                if context:
-                    full_prompt += f"\nCONTEXT: {context}"
-                result = fabric.execute(role, full_prompt)
+                result = fabric.execute(role, _task_prompt(task, context))
                 if result and result.text:
                     return result.text
                 # Fall through on execution failure
@@ -350,9 +739,7 @@ def route_task(
                         _loop = None
 
                     if _loop and _loop.is_running():
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                            result = pool.submit(asyncio.run, _coro).result()
+                        result = run_coroutine(_coro)
                     else:
                         result = asyncio.run(_coro)
                     if result and result.get("ranked_models"):
@@ -394,8 +781,10 @@ def route_task(
                     _resolved = intent_registry.resolve_role(analysis.intent)
                     if _resolved:
                         _role_from_analysis = _resolved
-                if triage_router is not None:
-                    _role_from_analysis = triage_router.select_role(analysis.complexity_score)
+                _role_from_analysis = _triage_role(
+                    triage_router, analysis.complexity_score, _role_from_analysis,
+                    "route_task/pipeline",
+                )
 
                 # Build routing context (will be updated with simulated_cost_avoided below)
                 routing_ctx = pipeline.build_routing_context(analysis, selected_route=_role_from_analysis)
@@ -421,10 +810,7 @@ def route_task(
                         _role_from_analysis, analysis.complexity_score, analysis.confidence, simulated_cost,
                     )
 
-                    full_prompt = f"TASK: {task}"
-                    if context:
-                        full_prompt += f"\nCONTEXT: {context}"
-                    full_prompt += "\nRESPOND WITH OUTPUT ONLY."
+                    full_prompt = _task_prompt(task, context, respond_only=True)
 
                     result = fabric.execute(
                         _role_from_analysis, full_prompt,
@@ -439,30 +825,30 @@ def route_task(
                 classified_intent = analysis.intent
                 complexity = analysis.complexity_score
                 role = _role_from_analysis
-                full_prompt = f"TASK: {task}"
-                if context:
-                    full_prompt += f"\nCONTEXT: {context}"
-                if format != "text":
-                    full_prompt += f"\nFORMAT: {format}"
-
-                if classified_intent in ("SIMPLE_CODE", "DIRECT"):
-                    full_prompt += "\nRESPOND WITH OUTPUT ONLY."
-                    result = fabric.execute(role, full_prompt, routing_context=routing_ctx)
-                    output = result.text if result else "Error: All models failed."
+                budget = plan_step_budget(complexity)
+                if classified_intent in ("SIMPLE_CODE", "DIRECT") or budget == 0:
+                    full_prompt = _task_prompt(task, context, format, respond_only=True)
+                    output = _execute_cached(
+                        fabric, cache, role, role, full_prompt, routing_context=routing_ctx,
+                    ) or "Error: All models failed."
                 else:
                     logger.info("[route_task/pipeline] Complex task. Generating plan...")
-                    plan = generate_plan(fabric, task, context)
-                    parts: list[str] = []
-                    for i, step in enumerate(plan):
-                        step_prompt = (
-                            f"GOAL: {step}\nCONTEXT: {context}\n"
-                            f"PREVIOUS_OUTPUT: {parts}\nReturn ONLY the requested output."
-                        )
-                        if format != "text":
-                            step_prompt += f"\nFORMAT: {format}"
-                        step_result = fabric.execute(role, step_prompt, routing_context=routing_ctx)
-                        step_text = step_result.text if step_result else ""
-                        parts.append(f"\n# --- Step {i+1}: {step} ---\n{step_text}" if step_text else f"\n# Step {i+1} Failed.")
+                    checkpoint = _open_checkpoint(
+                        fabric, checkpoint_path, "route_task", task, context,
+                    )
+                    plan = _checkpointed_plan(
+                        checkpoint,
+                        lambda: generate_plan(
+                            fabric, task, context, with_dependencies=True,
+                            max_steps=budget,
+                        ),
+                        "route_task/pipeline",
+                    )
+                    step_prompt, batch_prefix = _route_plan_prompts(context, format)
+                    parts = _execute_plan(
+                        fabric, role, plan, step_prompt, "route_task/pipeline",
+                        batch_prefix, checkpoint, routing_context=routing_ctx,
+                    )
                     output = "\n".join(parts)
 
                 output = _apply_review_loop(fabric, task, context, output, role)
@@ -501,43 +887,34 @@ def route_task(
         registry_role = intent_registry.resolve_role(classified_intent)
         if registry_role is not None:
             role = registry_role
-    if triage_router is not None:
-        role = triage_router.select_role(complexity)
-        logger.info("[route_task] Triage selected role: %s", role)
-
-    full_prompt = f"TASK: {task}"
-    if context:
-        full_prompt += f"\nCONTEXT: {context}"
-    if format != "text":
-        full_prompt += f"\nFORMAT: {format}"
-
-    if classified_intent in ("SIMPLE_CODE", "DIRECT"):
-        full_prompt += "\nRESPOND WITH OUTPUT ONLY."
-        result = fabric.execute(role, full_prompt)
-        output = result.text if result else "Error: All models failed."
+    role = _triage_role(triage_router, complexity, role, "route_task")
+
+    budget = plan_step_budget(complexity)
+    if classified_intent in ("SIMPLE_CODE", "DIRECT") or budget == 0:
+        full_prompt = _task_prompt(task, context, format, respond_only=True)
+        output = (
+            _execute_cached(fabric, cache, role, role, full_prompt)
+            or "Error: All models failed."
+        )
     else:
         # Complex path
         logger.info("[route_task] Complex task detected. Generating plan...")
-        plan = generate_plan(fabric, task, context)
+        checkpoint = _open_checkpoint(
+            fabric, checkpoint_path, "route_task", task, context,
+        )
+        plan = _checkpointed_plan(
+            checkpoint,
+            lambda: generate_plan(
+                fabric, task, context, with_dependencies=True, max_steps=budget,
+            ),
+            "route_task",
+        )
         logger.info("[route_task] Plan: %d steps", len(plan))
 
-        parts: list[str] = []
-        for i, step in enumerate(plan):
-            logger.info("[route_task] Step %d: %s", i + 1, step)
-            step_prompt = (
-                f"GOAL: {step}\n"
-                f"CONTEXT: {context}\n"
-                f"PREVIOUS_OUTPUT: {parts}\n"
-                "Return ONLY the requested output."
-            )
-            if format != "text":
-                step_prompt += f"\nFORMAT: {format}"
-            step_result = fabric.execute(role, step_prompt)
-            step_text = step_result.text if step_result else ""
-            if step_text:
-                parts.append(f"\n# --- Step {i + 1}: {step} ---\n{step_text}")
-            else:
-                parts.append(f"\n# Step {i + 1} Failed.")
+        step_prompt, batch_prefix = _route_plan_prompts(context, format)
+        parts = _execute_plan(
+            fabric, role, plan, step_prompt, "route_task", batch_prefix, checkpoint,
+        )
         output = "\n".join(parts)
 
     # --- Review loop (closed-loop execution) ---
@@ -555,8 +932,20 @@ def local_inference(
     *,
     prompt: str,
     context: str = "",
+    cache: ResponseCache | None = None,
+    semantic_cache: SemanticCache | None = None,
+    reuse_routed_answers: bool = False,
 ) -> str:
-    """Execute a prompt on local/private AI models without cloud API calls."""
+    """Execute a prompt on local/private AI models without cloud API calls.
+
+    Answers are cached apart from other tools' answers, so by default a
+    response produced by a cloud model is never returned here.
+    *semantic_cache* also answers prompts that resemble an earlier one.
+
+    With *reuse_routed_answers*, a matching answer that ``route_task``
+    stored in *semantic_cache* is returned as well.  That answer may come
+    from a cloud model, but the prompt itself still never leaves the host.
+    """
     full_prompt = prompt
     if context:
         full_prompt = f"{prompt}\n\nCONTEXT:\n{context}"
@@ -567,8 +956,19 @@ def local_inference(
     if not local_chain:
         return "Error: No local models configured. Add Ollama or llama.cpp models to the 'coding' role."
 
-    result = fabric.execute("coding", full_prompt, chain_override=local_chain)
-    return result.text if result else "Error: All local models failed to generate a response."
+    if semantic_cache is not None and reuse_routed_answers:
+        routed = semantic_cache.lookup("route_task", f"{prompt}\n{context}")
+        if routed is not None:
+            logger.info("[semantic-cache] Serving local_inference from a route_task answer")
+            return routed
+
+    return _semantic_cached(
+        semantic_cache, "local_inference", full_prompt,
+        lambda: _execute_cached(
+            fabric, cache, "local_inference", "coding", full_prompt,
+            chain_override=local_chain,
+        ) or "Error: All local models failed to generate a response.",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -582,49 +982,71 @@ def generate_code(
     task_description: str,
     file_context: str = "",
     language: str = "python",
+    cache: ResponseCache | None = None,
+    semantic_cache: SemanticCache | None = None,
+    checkpoint_path: Path | str | None = None,
 ) -> str:
-    """Multi-step code generation with automatic planning."""
+    """Multi-step code generation with automatic planning.
+
+    When *cache* is given, simple single-call generations are served from
+    and stored in it.  When *semantic_cache* is given, a request that
+    resembles an earlier one for the same language is answered from it.
+    Plan progress is checkpointed as in :func:`route_task`.
+    """
+    if semantic_cache is not None:
+        return _semantic_cached(
+            semantic_cache, f"generate_code:{language}",
+            f"{task_description}\n{file_context}",
+            lambda: generate_code(
+                fabric, triage_router, task_description=task_description,
+                file_context=file_context, language=language, cache=cache,
+                checkpoint_path=checkpoint_path,
+            ),
+        )
     triage = analyze_intent(fabric, task_description)
     intent = triage.intent
     complexity = triage.complexity
     logger.info("[generate_code] Intent: %s  Complexity: %d", intent, complexity)
 
-    coding_role = "coding"
-    if triage_router is not None:
-        coding_role = triage_router.select_role(complexity)
-        logger.info("[generate_code] Triage selected role: %s", coding_role)
+    coding_role = _triage_role(triage_router, complexity, "coding", "generate_code")
 
-    if intent == "SIMPLE_CODE":
+    budget = plan_step_budget(complexity)
+    if intent == "SIMPLE_CODE" or budget == 0:
         prompt = (
             f"TASK: {task_description}\n"
             f"LANG: {language}\n"
             f"CONTEXT: {file_context}\n"
             "CODE ONLY."
         )
-        result = fabric.execute(coding_role, prompt)
-        output = result.text if result else "Error: Generation failed."
+        output = (
+            _execute_cached(fabric, cache, coding_role, coding_role, prompt)
+            or "Error: Generation failed."
+        )
     else:
         # Complex path
         logger.info("[generate_code] Complexity detected. Generating plan...")
-        plan = generate_plan(fabric, task_description, file_context)
+        checkpoint = _open_checkpoint(
+            fabric, checkpoint_path, f"generate_code:{language}",
+            task_description, file_context,
+        )
+        plan = _checkpointed_plan(
+            checkpoint,
+            lambda: generate_plan(
+                fabric, task_description, file_context, with_dependencies=True,
+                max_steps=budget,
+            ),
+            "generate_code",
+        )
         logger.info("[generate_code] Plan: %d steps", len(plan))
 
-        parts: list[str] = []
-        for i, step in enumerate(plan):
-            logger.info("[generate_code] Step %d: %s", i + 1, step)
-            prompt = (
-                f"GOAL: {step}\n"
-                f"LANG: {language}\n"
-                f"CONTEXT: {file_context}\n"
-                f"PREVIOUS_CODE: {parts}\n"
-                "Return ONLY valid code."
-            )
-            code_result = fabric.execute(coding_role, prompt)
-            code_text = code_result.text if code_result else ""
-            if code_text:
-                parts.append(f"\n# --- Step {i + 1}: {step} ---\n{code_text}")
-            else:
-                parts.append(f"\n# Step {i + 1} Failed.")
+        step_prompt, batch_prefix = _plan_prompts(
+            f"Return ONLY valid code.\nLANG: {language}\nCONTEXT: {file_context}\n",
+            "PREVIOUS_CODE",
+        )
+        parts = _execute_plan(
+            fabric, coding_role, plan, step_prompt, "generate_code", batch_prefix,
+            checkpoint,
+        )
         output = "\n".join(parts)
 
     # --- Review loop (closed-loop execution) ---
@@ -639,34 +1061,92 @@ def generate_code(
 # compare_models
 # ---------------------------------------------------------------------------
 
+def _format_comparison(r: dict) -> str:
+    """Format one :meth:`ComputeFabric.execute_all` result for display."""
+    status = "SUCCESS" if r["success"] else "FAILED"
+    header = (
+        f"=== {r['model_id']} ({r['provider']}) [{status}] "
+        f"({r['elapsed_s']}s, {r['input_tokens']}in/{r['output_tokens']}out) ==="
+    )
+    return f"{header}\n{r['text']}\n"
+
+
+def _parse_model_ids(
+    fabric: ComputeFabric, models: str,
+) -> tuple[list[str] | None, list[str]]:
+    """Split the *models* CSV into configured and unknown model IDs.
+
+    The configured list is ``None`` when *models* is blank, meaning the
+    whole ``coding`` chain.
+    """
+    if not models.strip():
+        return None, []
+    known = fabric.known_model_ids()
+    valid: list[str] = []
+    unknown: list[str] = []
+    for m in models.split(","):
+        m = m.strip()
+        if m:
+            (valid if m in known else unknown).append(m)
+    if unknown:
+        logger.warning("[compare_models] Ignoring unknown model IDs: %s", ", ".join(unknown))
+    return valid, unknown
+
+
+def _unknown_models_error(unknown: list[str]) -> str:
+    return f"Error: None of the requested models are configured: {', '.join(unknown)}."
+
+
 def compare_models(
     fabric: ComputeFabric,
     *,
     prompt: str,
     models: str = "",
+    max_concurrency: int = 8,
 ) -> str:
-    """Run a prompt across multiple models and return all responses."""
-    model_ids = None
-    if models.strip():
-        model_ids = [m.strip() for m in models.split(",") if m.strip()]
+    """Run a prompt across multiple models and return all responses.
 
-    results = fabric.execute_all("coding", prompt, model_ids=model_ids)
+    The models are queried concurrently, at most *max_concurrency* at a
+    time; responses are listed in the order the models were given.
+    Unknown model IDs are skipped; if none of the IDs is configured an
+    error is returned without querying any model.
+    """
+    model_ids, unknown = _parse_model_ids(fabric, models)
+    if model_ids == [] and unknown:
+        return _unknown_models_error(unknown)
+
+    results = fabric.execute_all(
+        "coding", prompt, model_ids=model_ids, max_concurrency=max_concurrency,
+    )
 
     if not results:
         return "Error: No models available for comparison."
 
-    output_parts: list[str] = []
-    for r in results:
-        status = "SUCCESS" if r["success"] else "FAILED"
-        header = (
-            f"=== {r['model_id']} ({r['provider']}) [{status}] "
-            f"({r['elapsed_s']}s, {r['input_tokens']}in/{r['output_tokens']}out) ==="
-        )
-        output_parts.append(header)
-        output_parts.append(r["text"])
-        output_parts.append("")
+    return "\n".join(_format_comparison(r) for r in results)
 
-    return "\n".join(output_parts)
+
+def iter_compare_models(
+    fabric: ComputeFabric,
+    *,
+    prompt: str,
+    models: str = "",
+    max_concurrency: int = 8,
+) -> Iterator[str]:
+    """Yield one formatted response block per model as each one finishes.
+
+    Streaming counterpart of :func:`compare_models`: blocks arrive in
+    completion order, so the fastest model is visible first.  Yields
+    nothing when no models are available, and a single error line when
+    none of the requested model IDs is configured.
+    """
+    model_ids, unknown = _parse_model_ids(fabric, models)
+    if model_ids == [] and unknown:
+        yield _unknown_models_error(unknown)
+        return
+    for r in fabric.iter_all(
+        "coding", prompt, model_ids=model_ids, max_concurrency=max_concurrency,
+    ):
+        yield _format_comparison(r)
 
 
 # ---------------------------------------------------------------------------
@@ -676,19 +1156,17 @@ def compare_models(
 def list_models(fabric: ComputeFabric) -> str:
     """List all configured model IDs with their provider and endpoint info."""
     config = fabric.config
-    models_info: list[dict] = []
-
+    models = []
     for model_id in config.get_all_model_ids():
         cfg = config.get_model_config(model_id)
-        models_info.append({
+        models.append({
             "model_id": model_id,
             "provider": cfg.get("provider", ""),
             "endpoint": cfg.get("endpoint", ""),
             "model_name": cfg.get("model_name", ""),
             "tags": cfg.get("tags", []),
         })
-
-    return json.dumps(models_info, indent=2)
+    return _json_dumps(models)
 
 
 # ---------------------------------------------------------------------------
@@ -711,9 +1189,9 @@ def list_assets() -> str:
 
         storage = FileModelStorage()
         entries = storage.list_models()
-        return json.dumps(entries, indent=2)
+        return _json_dumps(entries)
     except Exception as exc:
-        logger.error(f"[list_assets] Failed to list assets: {exc}")
+        logger.error("[list_assets] Failed to list assets: %s", exc)
         return json.dumps({"error": str(exc)})
 
 
@@ -782,7 +1260,7 @@ def register_asset(
             from aurarouter.tuning import extract_gguf_metadata
             metadata = extract_gguf_metadata(str(p))
         except Exception as exc:
-            logger.debug(f"[register_asset] GGUF metadata extraction failed: {exc}")
+            logger.debug("[register_asset] GGUF metadata extraction failed: %s", exc)
 
         # 5. Create model config
         model_config: dict = {
@@ -831,7 +1309,7 @@ def register_asset(
             "hosting_tier": model_config.get("hosting_tier"),
         })
     except Exception as exc:
-        logger.error(f"[register_asset] Failed to register asset: {exc}")
+        logger.error("[register_asset] Failed to register asset: %s", exc)
         return json.dumps({"error": str(exc)})
 
 
@@ -950,7 +1428,7 @@ def register_remote_asset(
             "node_id": node_id or None,
         })
     except Exception as exc:
-        logger.error(f"[register_remote_asset] Failed to register remote asset: {exc}")
+        logger.error("[register_remote_asset] Failed to register remote asset: %s", exc)
         return json.dumps({"error": str(exc)})
 
 
@@ -1024,7 +1502,7 @@ def unregister_asset(
             "file_deleted": file_deleted,
         })
     except Exception as exc:
-        logger.error(f"[unregister_asset] Failed to unregister asset: {exc}")
+        logger.error("[unregister_asset] Failed to unregister asset: %s", exc)
         return json.dumps({"error": str(exc)})
 
 
@@ -1087,7 +1565,7 @@ def register_session_tools(mcp, fabric: ComputeFabric, session_manager: SessionM
             try:
                 perms_dict = json.loads(permissions)
             except json.JSONDecodeError:
-                logger.warning(f"Invalid permissions JSON: {permissions}")
+                logger.warning("Invalid permissions JSON: %s", permissions)
 
         result = session_manager.send_message(
             session, message, fabric, role=role, permissions=perms_dict
@@ -1168,13 +1646,13 @@ def register_grid_tools(
                 "tool_count": len(client.get_tools()),
                 "model_count": len(client.get_models()),
             })
-        return json.dumps(services, indent=2)
+        return _json_dumps(services)
 
     @mcp.tool()
     def list_remote_tools() -> str:
         """List all tools available from connected grid services."""
         tools = registry.get_all_remote_tools()
-        return json.dumps(tools, indent=2)
+        return _json_dumps(tools)
 
     @mcp.tool()
     def call_remote_tool(service_name: str, tool_name: str, arguments: str = "{}") -> str:
@@ -1199,7 +1677,7 @@ def register_grid_tools(
 
         try:
             result = client.call_tool(tool_name, **kwargs)
-            return json.dumps(result, indent=2)
+            return _json_dumps(result)
         except Exception as exc:
             return json.dumps({"error": str(exc)})
 
@@ -1223,7 +1701,7 @@ def catalog_list_artifacts(config: "ConfigLoader", kind: str | None = None) -> s
             entry = dict(data)
             entry["artifact_id"] = aid
             artifacts.append(entry)
-    return json.dumps(artifacts, indent=2)
+    return _json_dumps(artifacts)
 
 
 def catalog_get_artifact(config: "ConfigLoader", artifact_id: str) -> str:
@@ -1233,7 +1711,7 @@ def catalog_get_artifact(config: "ConfigLoader", artifact_id: str) -> str:
         return json.dumps({"error": f"Artifact '{artifact_id}' not found"})
     result = dict(data)
     result["artifact_id"] = artifact_id
-    return json.dumps(result, indent=2)
+    return _json_dumps(result)
 
 
 def catalog_register_artifact(
@@ -1324,10 +1802,10 @@ def list_intents(config: "ConfigLoader") -> str:
             "description": defn.description,
         })
 
-    return json.dumps({
+    return _json_dumps({
         "active_analyzer": active_analyzer,
         "intents": intents_list,
-    }, indent=2)
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -1355,11 +1833,11 @@ def sovereignty_status(fabric: "ComputeFabric") -> str:
             if mid not in local_models:
                 local_models.append(mid)
 
-    return json.dumps({
+    return _json_dumps({
         "enabled": enabled,
         "custom_patterns": len(custom_patterns),
         "local_models": local_models,
-    }, indent=2)
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -1377,11 +1855,11 @@ def rag_status(fabric: "ComputeFabric") -> str:
     }
     """
     config = fabric.config
-    return json.dumps({
+    return _json_dumps({
         "enabled": config.is_rag_enrichment_enabled(),
         "xlm_endpoint": config.get_xlm_endpoint(),
         "xlm_augmentation_enabled": config.is_xlm_augmentation_enabled(),
-    }, indent=2)
+    })
 
 # ---------------------------------------------------------------------------
 # TG7: Speculative decoding tools
@@ -1426,19 +1904,17 @@ def speculative_execute(
         try:
             perms_dict = json.loads(permissions)
         except json.JSONDecodeError:
-            logger.warning(f"Invalid permissions JSON in speculative_execute: {permissions}")
+            logger.warning("Invalid permissions JSON in speculative_execute: %s", permissions)
 
     try:
         loop = asyncio.get_event_loop()
         if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                result = pool.submit(
-                    asyncio.run,
-                    orchestrator.execute_speculative(
-                        task, context or None, permissions=perms_dict
-                    ),
-                ).result(timeout=float(sys_cfg.get("speculative_timeout", 60.0)))
+            result = run_coroutine(
+                orchestrator.execute_speculative(
+                    task, context or None, permissions=perms_dict
+                ),
+                float(sys_cfg.get("speculative_timeout", 60.0)),
+            )
         else:
             result = asyncio.run(
                 orchestrator.execute_speculative(
@@ -1451,7 +1927,7 @@ def speculative_execute(
 
     if result is None:
         return json.dumps({"error": "speculative execution failed, no result"})
-    return json.dumps(result, indent=2)
+    return _json_dumps(result)
 
 
 def speculative_status(fabric: "ComputeFabric") -> str:
@@ -1479,12 +1955,12 @@ def speculative_status(fabric: "ComputeFabric") -> str:
         )
         sessions = [s.to_dict() for s in orchestrator.get_active_sessions()]
 
-    return json.dumps({
+    return _json_dumps({
         "enabled": enabled,
         "complexity_threshold": int(sys_cfg.get("speculative_complexity_threshold", 7)),
         "confidence_threshold": float(sys_cfg.get("notional_confidence_threshold", 0.85)),
         "active_sessions": sessions,
-    }, indent=2)
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -1536,23 +2012,21 @@ def monologue_execute(
         try:
             perms_dict = json.loads(permissions)
         except json.JSONDecodeError:
-            logger.warning(f"Invalid permissions JSON in monologue_execute: {permissions}")
+            logger.warning("Invalid permissions JSON in monologue_execute: %s", permissions)
 
     try:
         loop = asyncio.get_event_loop()
         if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                result = pool.submit(
-                    asyncio.run,
-                    orchestrator.reason(
-                        task, context or None,
-                        max_iterations=max_iterations,
-                        convergence_threshold=convergence_threshold,
-                        mas_relevancy_threshold=mas_relevancy_threshold,
-                        permissions=perms_dict,
-                    ),
-                ).result(timeout=300.0)
+            result = run_coroutine(
+                orchestrator.reason(
+                    task, context or None,
+                    max_iterations=max_iterations,
+                    convergence_threshold=convergence_threshold,
+                    mas_relevancy_threshold=mas_relevancy_threshold,
+                    permissions=perms_dict,
+                ),
+                300.0,
+            )
         else:
             result = asyncio.run(
                 orchestrator.reason(
@@ -1569,7 +2043,7 @@ def monologue_execute(
 
     if result is None:
         return json.dumps({"error": "monologue execution produced no result"})
-    return json.dumps(result.to_dict(), indent=2)
+    return _json_dumps(result.to_dict())
 
 
 def monologue_status(fabric: "ComputeFabric") -> str:
@@ -1592,13 +2066,13 @@ def monologue_status(fabric: "ComputeFabric") -> str:
         )
         sessions = [s.to_dict() for s in orchestrator.get_active_sessions()]
 
-    return json.dumps({
+    return _json_dumps({
         "enabled": enabled,
         "max_iterations": int(sys_cfg.get("monologue_max_iterations", 5)),
         "convergence_threshold": float(sys_cfg.get("monologue_convergence_threshold", 0.85)),
         "mas_relevancy_threshold": float(sys_cfg.get("monologue_mas_threshold", 0.4)),
         "active_sessions": sessions,
-    }, indent=2)
+    })
 
 
 def monologue_trace(
@@ -1620,9 +2094,9 @@ def monologue_trace(
     """
     # In a stateless MCP context, sessions don't persist across calls.
     # Return a structured error indicating the limitation.
-    return json.dumps({
+    return _json_dumps({
         "session_id": session_id,
         "error": "session_not_found",
         "message": "Monologue sessions are transient within a single execution. "
                    "Use monologue_execute to run a new session.",
-    }, indent=2)
\ No newline at end of file
+    })
\ No newline at end of file
@@ -81,6 +81,21 @@ class FileModelStorage:
         """
         return list(self._registry)
 
+    def list_models_for_display(self) -> list[dict]:
+        """Return registered models with pre-formatted display strings.
+
+        Same entries as :meth:`list_models`, each copied and extended with
+        ``size_mb_str`` (whole megabytes) and ``downloaded_date``
+        (``YYYY-MM-DD``).
+        """
+        rows: list[dict] = []
+        for entry in self._registry:
+            row = dict(entry)
+            row["size_mb_str"] = f"{entry.get('size_bytes', 0) / (1 << 20):.0f}"
+            row["downloaded_date"] = entry.get("downloaded_at", "")[:10]
+            rows.append(row)
+        return rows
+
     def has_model(self, filename: str) -> bool:
         """Check if a model exists (in registry AND on filesystem)."""
         for entry in self._registry:
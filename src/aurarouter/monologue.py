@@ -247,7 +247,7 @@ class MonologueOrchestrator:
 
         # Local permissions check (Task 2.2)
         if permissions:
-            logger.debug(f"Monologue execution using local permissions: {permissions}")
+            logger.debug("Monologue execution using local permissions: %s", permissions)
 
         session_id = uuid.uuid4().hex[:16]
         start_time = time.monotonic()
@@ -0,0 +1,156 @@
+"""On-disk checkpoints that let an interrupted plan resume.
+
+A checkpoint is a JSONL file.  The first line records the plan, so a
+rerun follows the same steps instead of asking the planner again.  Each
+later line records the output of one completed step.  Lines are flushed
+and fsynced as they are written, and a torn final line left by a crash is
+ignored when the file is read back.
+
+A checkpoint is deleted once its plan succeeds.  One left behind by a
+plan that failed or aborted is kept so a retry can resume it, until it
+has gone :attr:`PlanCheckpoint.MAX_AGE` seconds without being written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from aurarouter._logging import get_logger
+from aurarouter.routing import PlanStep, sequential_dependencies
+
+logger = get_logger("AuraRouter.PlanCheckpoint")
+
+
+class PlanCheckpoint:
+    """Append-only record of a plan and its completed step outputs."""
+
+    DEFAULT_DIR = Path.home() / ".auracore" / "aurarouter" / "checkpoints"
+    MAX_AGE = 24 * 60 * 60
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._plan: Optional[list[PlanStep]] = None
+        self._completed: dict[int, str] = {}
+        self._read()
+
+    @classmethod
+    def for_task(
+        cls, namespace: str, task: str, context: str = "",
+        directory: Optional[Path] = None,
+    ) -> "PlanCheckpoint":
+        """Return the checkpoint for *task* under *directory*.
+
+        Stale checkpoints left in *directory* by other tasks are removed.
+        """
+        directory = Path(directory or cls.DEFAULT_DIR)
+        cls.prune(directory)
+        digest = hashlib.sha1(
+            f"{namespace}\0{task}\0{context}".encode("utf-8")
+        ).hexdigest()[:12]
+        return cls(directory / f"{digest}.jsonl")
+
+    @classmethod
+    def prune(cls, directory: Path) -> None:
+        """Delete checkpoints in *directory* older than :attr:`MAX_AGE`."""
+        cutoff = time.time() - cls.MAX_AGE
+        try:
+            paths = list(Path(directory).glob("*.jsonl"))
+        except OSError:
+            return
+        for path in paths:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def _read(self) -> None:
+        try:
+            if self.path.stat().st_mtime < time.time() - self.MAX_AGE:
+                logger.info("Discarding stale plan checkpoint %s", self.path)
+                self.path.unlink()
+                return
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            logger.warning("Cannot read plan checkpoint %s: %s", self.path, exc)
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            try:
+                if "plan" in record:
+                    # A later plan line replaces the earlier plan and its steps.
+                    self._plan = [
+                        PlanStep(str(s["goal"]), [int(d) for d in s["depends_on"]])
+                        for s in record["plan"]
+                    ]
+                    self._completed.clear()
+                elif "step" in record and "result" in record:
+                    self._completed[int(record["step"])] = str(record["result"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        if self._plan is None:
+            self._completed.clear()
+
+    def _append(self, record: dict) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    @property
+    def plan(self) -> Optional[list[PlanStep]]:
+        """The recorded plan, or ``None`` if none was recorded yet."""
+        return list(self._plan) if self._plan is not None else None
+
+    @property
+    def completed(self) -> dict[int, str]:
+        """Output parts of the completed steps, keyed by step index."""
+        return dict(self._completed)
+
+    def start(self, plan: list) -> list[PlanStep]:
+        """Record *plan* as a fresh plan and return it as :class:`PlanStep` items."""
+        steps = [
+            s if isinstance(s, PlanStep) else PlanStep(str(s), sequential_dependencies(i))
+            for i, s in enumerate(plan)
+        ]
+        self._append({"plan": [
+            {"goal": s.goal, "depends_on": s.depends_on} for s in steps
+        ]})
+        with self._lock:
+            self._plan = steps
+            self._completed.clear()
+        return list(steps)
+
+    def record(self, step: int, part: str) -> None:
+        """Durably record *part* as the output of *step*."""
+        self._append({"step": step, "result": part})
+        with self._lock:
+            self._completed[step] = part
+
+    def discard(self) -> None:
+        """Delete the checkpoint once the plan has finished."""
+        with self._lock:
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning("Cannot remove plan checkpoint %s: %s", self.path, exc)
+            self._plan = None
+            self._completed.clear()
@@ -25,6 +25,11 @@ class LlamaCppServerProvider(BaseProvider):
           parameters:
             temperature: 0.1
             n_predict: 2048
+
+    ``cache_prompt`` is sent with every request (default ``true``; set it
+    under ``parameters`` to override) so the server keeps the KV cache of
+    the previous prompt and only evaluates the part that changed.  Plan
+    steps and corrections put their shared context first to benefit.
     """
 
     def generate(self, prompt: str, json_mode: bool = False,
@@ -48,6 +53,7 @@ class LlamaCppServerProvider(BaseProvider):
             "top_k": params.get("top_k", 40),
             "repeat_penalty": params.get("repeat_penalty", 1.1),
             "n_predict": params.get("n_predict", 2048),
+            "cache_prompt": params.get("cache_prompt", True),
             "stream": False,
         }
 
@@ -90,6 +96,7 @@ class LlamaCppServerProvider(BaseProvider):
             "messages": all_messages,
             "temperature": params.get("temperature", 0.7),
             "n_predict": params.get("n_predict", 4096),
+            "cache_prompt": params.get("cache_prompt", True),
             "stream": False,
         }
         if json_mode:
@@ -133,6 +140,7 @@ class LlamaCppServerProvider(BaseProvider):
             "top_k": params.get("top_k", 40),
             "repeat_penalty": params.get("repeat_penalty", 1.1),
             "n_predict": params.get("n_predict", 2048),
+            "cache_prompt": params.get("cache_prompt", True),
             "stream": True,
         }
         if response_schema is not None:
@@ -177,6 +185,7 @@ class LlamaCppServerProvider(BaseProvider):
             "top_k": params.get("top_k", 40),
             "repeat_penalty": params.get("repeat_penalty", 1.1),
             "n_predict": params.get("n_predict", 2048),
+            "cache_prompt": params.get("cache_prompt", True),
             "stream": True,
         }
         if response_schema is not None:
@@ -224,6 +233,7 @@ class LlamaCppServerProvider(BaseProvider):
             "messages": all_messages,
             "temperature": params.get("temperature", 0.7),
             "n_predict": params.get("n_predict", 4096),
+            "cache_prompt": params.get("cache_prompt", True),
             "stream": True,
         }
         if json_mode:
@@ -57,7 +57,7 @@ class McpProvider(BaseProvider):
             name=f"mcp-provider:{self._model_name or endpoint}",
             timeout=self._timeout,
         )
-        self._remote_capabilities: set[str] = set()
+        self._remote_capabilities: frozenset[str] = frozenset()
         self._validated = False
 
     # ------------------------------------------------------------------
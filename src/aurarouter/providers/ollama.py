@@ -52,7 +52,7 @@ class OllamaProvider(BaseProvider):
                     )
                 except httpx.RequestError as e:
                     last_error = e
-                    logger.warning(f"Ollama endpoint {url} failed: {e}")
+                    logger.warning("Ollama endpoint %s failed: %s", url, e)
                     continue
 
         if last_error:
@@ -140,7 +140,7 @@ class OllamaProvider(BaseProvider):
                                 return
                 return
             except httpx.RequestError as e:
-                logger.warning(f"Ollama streaming endpoint {url} failed: {e}")
+                logger.warning("Ollama streaming endpoint %s failed: %s", url, e)
                 continue
 
     async def generate_stream(
@@ -180,7 +180,7 @@ class OllamaProvider(BaseProvider):
                 return
             except httpx.RequestError as e:
                 last_error = e
-                logger.warning(f"Ollama streaming endpoint {url} failed: {e}")
+                logger.warning("Ollama streaming endpoint %s failed: %s", url, e)
                 continue
 
         if last_error:
@@ -0,0 +1,64 @@
+"""In-memory cache of model responses keyed by prompt.
+
+Used by the MCP tools to skip re-running inference for prompts they have
+already answered.  Keys are a SHA-256 digest of a namespace (normally the
+role) and the prompt with runs of whitespace collapsed, so prompts that
+differ only in spacing or line breaks share an entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of response texts with an optional TTL."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 600.0):
+        self._max_entries = max(1, int(max_entries))
+        self._ttl = float(ttl_seconds)
+        self._lock = threading.Lock()
+        # key -> (stored_at, text)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def _key(namespace: str, prompt: str) -> str:
+        normalized = " ".join(prompt.split())
+        return hashlib.sha256(
+            f"{namespace}\0{normalized}".encode("utf-8")
+        ).hexdigest()
+
+    def lookup(self, namespace: str, prompt: str) -> Optional[str]:
+        """Return the cached response for *prompt*, or ``None``."""
+        key = self._key(namespace, prompt)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._ttl > 0 and time.monotonic() - entry[0] > self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def store(self, namespace: str, prompt: str, text: str) -> None:
+        """Cache *text* as the response to *prompt*, evicting the oldest entry."""
+        key = self._key(namespace, prompt)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+import threading
+import weakref
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from aurarouter._logging import get_logger
+from aurarouter.response_cache import ResponseCache
 from aurarouter.semantic_verbs import resolve_synonym
 
 if TYPE_CHECKING:
@@ -14,6 +17,22 @@ if TYPE_CHECKING:
 
 logger = get_logger("AuraRouter.Routing")
 
+# Classifier replies per fabric, so a task routed again within the TTL
+# (retries, IDE re-requests) skips the router call.
+_TRIAGE_CACHE_SIZE = 1024
+_TRIAGE_CACHE_TTL = 300.0
+_triage_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_triage_caches_lock = threading.Lock()
+
+
+def _triage_cache(fabric: ComputeFabric) -> ResponseCache:
+    with _triage_caches_lock:
+        cache = _triage_caches.get(fabric)
+        if cache is None:
+            cache = ResponseCache(_TRIAGE_CACHE_SIZE, _TRIAGE_CACHE_TTL)
+            _triage_caches[fabric] = cache
+        return cache
+
 
 @dataclass
 class TriageResult:
@@ -23,6 +42,20 @@ class TriageResult:
     complexity: int
 
 
+# How many immediately preceding steps a step builds on when the planner
+# did not say.  Older output still reaches it through those steps, and
+# the prompt stays a constant size instead of growing with plan length.
+PLAN_CONTEXT_WINDOW = 2
+
+
+@dataclass
+class PlanStep:
+    """A plan step and the 0-based indices of earlier steps it builds on."""
+
+    goal: str
+    depends_on: list[int]
+
+
 @dataclass
 class ReviewResult:
     """Structured verdict from the reviewer role."""
@@ -67,6 +100,9 @@ def analyze_intent(
     If *custom_verbs* is provided, the classifier prompt includes known
     roles and synonyms for context, and the returned intent is normalised
     via ``resolve_synonym``.
+
+    Parsed classifier replies are remembered per fabric for five minutes,
+    keyed on the full classifier prompt.
     """
     # Build available-roles context for the classifier.
     roles_hint = ""
@@ -93,10 +129,17 @@ def analyze_intent(
         "Where complexity is 1-10 (1=trivial, 10=very complex).\n"
         "Use DIRECT for simple questions, jokes, or single-turn tasks that don't require code or multi-step reasoning."
     )
-    res = fabric.execute("router", prompt, json_mode=True)
+    cache = _triage_cache(fabric)
+    text = cache.lookup("router", prompt)
+    cached = text is not None
+    if not cached:
+        res = fabric.execute("router", prompt, json_mode=True)
+        text = res.text if res else ""
     try:
-        data = json.loads(res.text if res else "")
+        data = json.loads(text)
         raw_intent = data.get("intent", "DIRECT")
+        if not cached:
+            cache.store("router", prompt, text)
 
         # Validate against registry or normalise through synonym resolution.
         if intent_registry:
@@ -117,27 +160,130 @@ def analyze_intent(
         return TriageResult(intent="DIRECT", complexity=1)
 
 
+# Complexity bands for planning: at or below the first, a non-simple
+# intent is still answered in one call; up to the second, plans are
+# asked to stay short.
+_PLAN_SKIP_MAX_COMPLEXITY = 3
+_SHORT_PLAN_MAX_COMPLEXITY = 6
+_SHORT_PLAN_STEPS = 3
+
+
+def plan_step_budget(complexity: int) -> int | None:
+    """Return how many plan steps a task of *complexity* warrants.
+
+    ``0`` means answer in a single call without planning; ``None`` means
+    no limit.  Scores that are not numbers (a malformed classifier reply)
+    get no limit.
+    """
+    try:
+        complexity = int(complexity)
+    except (TypeError, ValueError):
+        return None
+    if complexity <= _PLAN_SKIP_MAX_COMPLEXITY:
+        return 0
+    if complexity <= _SHORT_PLAN_MAX_COMPLEXITY:
+        return _SHORT_PLAN_STEPS
+    return None
+
+
 def generate_plan(
-    fabric: ComputeFabric, task: str, context: str
-) -> list[str]:
-    """Ask the reasoning role to produce an ordered list of atomic steps."""
+    fabric: ComputeFabric,
+    task: str,
+    context: str,
+    *,
+    with_dependencies: bool = False,
+    max_steps: int | None = None,
+) -> list[str] | list[PlanStep]:
+    """Ask the reasoning role to produce an ordered list of atomic steps.
+
+    With *with_dependencies* the planner also states which earlier steps
+    each step needs, and a list of :class:`PlanStep` is returned so that
+    independent steps can run concurrently.  Plain string items in that
+    reply are treated as depending on the preceding steps (see
+    :func:`sequential_dependencies`).
+
+    *max_steps* asks the planner to keep the plan to that many steps.
+    """
+    if with_dependencies:
+        shape = (
+            "Create a JSON list of atomic coding steps in execution order.\n"
+            'Each item is {"step": "<description>", "depends_on": [<numbers of '
+            "the earlier steps whose output it needs>]}. Use [] when a step "
+            "needs no earlier output.\n"
+            'Example: [{"step": "Create utils.py", "depends_on": []}, '
+            '{"step": "Create models.py", "depends_on": []}, '
+            '{"step": "Update main.py", "depends_on": [1, 2]}]\n'
+        )
+    else:
+        shape = (
+            "Create a strictly sequential JSON list of atomic coding steps.\n"
+            'Example: ["Create utils.py", "Implement class in utils.py", "Update main.py"]\n'
+        )
+    if max_steps:
+        shape += f"Use at most {max_steps} steps.\n"
     prompt = (
         "You are a Lead Software Architect.\n"
         f"TASK: {task}\n"
         f"CONTEXT: {context}\n\n"
-        "Create a strictly sequential JSON list of atomic coding steps.\n"
-        'Example: ["Create utils.py", "Implement class in utils.py", "Update main.py"]\n'
+        f"{shape}"
         "Return JSON List only."
     )
+    fallback: list = [PlanStep(task, [])] if with_dependencies else [task]
     res = fabric.execute("reasoning", prompt)
     if not res or not res.text:
-        return [task]
+        return fallback
 
     clean = res.text.replace("```json", "").replace("```", "").strip()
     try:
-        return json.loads(clean)
+        plan = json.loads(clean)
     except Exception:
-        return [task]
+        return fallback
+    if not with_dependencies:
+        return plan
+    if not isinstance(plan, list):
+        return fallback
+    return [_plan_step(i, item) for i, item in enumerate(plan)]
+
+
+def sequential_dependencies(index: int) -> list[int]:
+    """Return the implicit dependencies of step *index* in a sequential plan."""
+    return list(range(max(0, index - PLAN_CONTEXT_WINDOW), index))
+
+
+def plan_waves(steps: list[PlanStep]) -> list[list[int]]:
+    """Group step indices into waves whose steps can run concurrently.
+
+    Each step lands one wave after the latest of its dependencies, so a
+    wave only needs output from earlier waves.
+    """
+    waves: list[list[int]] = []
+    level: list[int] = []
+    for i, step in enumerate(steps):
+        level.append(1 + max((level[d] for d in step.depends_on), default=-1))
+        if level[i] == len(waves):
+            waves.append([])
+        waves[level[i]].append(i)
+    return waves
+
+
+def _plan_step(index: int, item: object) -> PlanStep:
+    """Normalise one planner item; 1-based step numbers become indices.
+
+    References to the step itself or to later steps are dropped, so the
+    dependency graph is always acyclic.
+    """
+    if isinstance(item, dict) and "step" in item:
+        raw = item.get("depends_on")
+        if isinstance(raw, list):
+            deps = sorted({
+                d - 1 for d in raw
+                if type(d) is int and 1 <= d <= index
+            })
+            return PlanStep(str(item["step"]), deps)
+        return PlanStep(str(item["step"]), sequential_dependencies(index))
+    return PlanStep(
+        item if isinstance(item, str) else str(item), sequential_dependencies(index),
+    )
 
 
 def review_output(
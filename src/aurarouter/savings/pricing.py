@@ -155,11 +155,21 @@ class CostEngine:
         provider: str,
     ) -> float:
         """Return the dollar cost for a single request."""
-        price = self._catalog.get_price(model_name, provider)
+        in_rate, out_rate = self.get_rates(provider, model_name)
+        return input_tokens * in_rate + output_tokens * out_rate
+
+    def get_rates(self, provider: str, model_id: str) -> tuple[float, float]:
+        """Return ``(input, output)`` dollar cost per single token.
+
+        Callers pricing many rows for the same model can resolve the rates
+        once and multiply inline instead of calling :meth:`calculate_cost`
+        (and taking the catalog lock) per row.
+        """
+        price = self._catalog.get_price(model_id, provider)
         return (
-            input_tokens * price.input_per_million
-            + output_tokens * price.output_per_million
-        ) / 1_000_000
+            price.input_per_million / 1_000_000,
+            price.output_per_million / 1_000_000,
+        )
 
     # ── Shadow cost ──────────────────────────────────────────────────
 
@@ -191,17 +201,64 @@ class CostEngine:
 
     # ── Aggregate spend ──────────────────────────────────────────────
 
+    def window_stats(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> dict:
+        """Totals, spend and per-model tokens for a range in one query.
+
+        Everything is derived from a single ``(provider, model_id)``
+        grouped aggregate.  Cost is linear in token counts, so pricing the
+        group sums once equals summing per-record costs.
+
+        Returns ``{"total_requests", "input_tokens", "output_tokens",
+        "total_tokens", "total_cost", "spend_by_provider", "by_model"}``;
+        *by_model* matches :meth:`UsageStore.aggregate_tokens` output.
+        """
+        requests = inp_total = out_total = 0
+        total_cost = 0.0
+        spend: dict[str, float] = {}
+        by_model: dict[str, list[int]] = {}
+        for prov, model, n, inp, out, _elapsed in self._store.aggregate(
+            ("provider", "model_id"), start=start, end=end
+        ):
+            in_rate, out_rate = self.get_rates(prov, model)
+            cost = inp * in_rate + out * out_rate
+            requests += n
+            inp_total += inp
+            out_total += out
+            total_cost += cost
+            spend[prov] = spend.get(prov, 0.0) + cost
+            tokens = by_model.setdefault(model, [0, 0])
+            tokens[0] += inp
+            tokens[1] += out
+
+        return {
+            "total_requests": requests,
+            "input_tokens": inp_total,
+            "output_tokens": out_total,
+            "total_tokens": inp_total + out_total,
+            "total_cost": total_cost,
+            "spend_by_provider": spend,
+            "by_model": [
+                {
+                    "model_id": model,
+                    "input_tokens": inp,
+                    "output_tokens": out,
+                    "total_tokens": inp + out,
+                }
+                for model, (inp, out) in sorted(by_model.items())
+            ],
+        }
+
     def total_spend(
         self,
         start: Optional[str] = None,
         end: Optional[str] = None,
     ) -> float:
         """Sum dollar cost of all recorded usage in the date range."""
-        records = self._store.query(start=start, end=end)
-        return sum(
-            self.calculate_cost(r.input_tokens, r.output_tokens, r.model_id, r.provider)
-            for r in records
-        )
+        return self.window_stats(start, end)["total_cost"]
 
     def spend_by_provider(
         self,
@@ -209,14 +266,7 @@ class CostEngine:
         end: Optional[str] = None,
     ) -> dict[str, float]:
         """Per-provider dollar spend in the date range."""
-        records = self._store.query(start=start, end=end)
-        breakdown: dict[str, float] = {}
-        for r in records:
-            cost = self.calculate_cost(
-                r.input_tokens, r.output_tokens, r.model_id, r.provider
-            )
-            breakdown[r.provider] = breakdown.get(r.provider, 0.0) + cost
-        return breakdown
+        return self.window_stats(start, end)["spend_by_provider"]
 
     # ── Projections ──────────────────────────────────────────────────
 
@@ -273,7 +273,9 @@ class PrivacyStore:
         where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
         sql = (
             "SELECT id, timestamp, model_id, provider, match_count, "
-            "severities, pattern_names, prompt_length, recommendation "
+            "severities, pattern_names, prompt_length, recommendation, "
+            "CAST(ROUND((julianday(timestamp) - 2440587.5) * 86400000) "
+            "AS INTEGER) "
             f"FROM privacy_events{where} ORDER BY timestamp"
         )
 
@@ -303,6 +305,8 @@ class PrivacyStore:
                     "pattern_names": json.loads(r[6]),
                     "prompt_length": r[7],
                     "recommendation": r[8],
+                    # Epoch milliseconds, for cheap integer comparisons.
+                    "ts_epoch_ms": r[9] or 0,
                 }
             )
         return results
@@ -27,6 +27,10 @@ class TriageRouter:
 
     Rules are evaluated in order; the first rule whose ``max_complexity``
     is >= the score wins.  If no rule matches, *default_role* is returned.
+
+    The role chosen for each score is remembered until the rules change
+    through :attr:`rules` assignment or :meth:`update_from_feedback`;
+    call :meth:`clear_cache` after editing rule objects in place.
     """
 
     def __init__(
@@ -34,11 +38,41 @@ class TriageRouter:
         rules: list[TriageRule] | None = None,
         default_role: str = "coding",
     ):
-        self.rules: list[TriageRule] = rules or []
+        self._role_by_score: dict[int, str] = {}
+        self.rules = rules or []
         self.default_role = default_role
 
+    @property
+    def rules(self) -> list[TriageRule]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: list[TriageRule]) -> None:
+        self._rules = rules
+        self._role_by_score.clear()
+
+    @property
+    def default_role(self) -> str:
+        return self._default_role
+
+    @default_role.setter
+    def default_role(self, role: str) -> None:
+        self._default_role = role
+        self._role_by_score.clear()
+
+    def clear_cache(self) -> None:
+        """Forget the remembered score-to-role choices."""
+        self._role_by_score.clear()
+
     def select_role(self, complexity_score: int) -> str:
         """Return the preferred role for *complexity_score*."""
+        role = self._role_by_score.get(complexity_score)
+        if role is None:
+            role = self._match_role(complexity_score)
+            self._role_by_score[complexity_score] = role
+        return role
+
+    def _match_role(self, complexity_score: int) -> str:
         for rule in self.rules:
             if complexity_score <= rule.max_complexity:
                 logger.info(
@@ -142,6 +176,8 @@ class TriageRouter:
 
             prev_max = rule.max_complexity
 
+        self._role_by_score.clear()
+
     @classmethod
     def from_config(cls, config: dict) -> TriageRouter:
         """Build a ``TriageRouter`` from the ``savings.triage`` config dict.
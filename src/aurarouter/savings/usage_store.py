@@ -5,7 +5,7 @@ from __future__ import annotations
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from aurarouter.savings.models import UsageRecord
 
@@ -29,6 +29,15 @@ CREATE TABLE IF NOT EXISTS usage (
 )
 """
 
+# Covers every column the time-windowed aggregates read, so range queries
+# (``timestamp >= ? AND timestamp <= ?``) grouped by provider/model, intent
+# or role are served from the index without touching the table.
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_usage_ts ON usage("
+    "timestamp, provider, model_id, intent, role, "
+    "input_tokens, output_tokens, elapsed_s)",
+)
+
 
 class UsageStore:
     """Thread-safe, connection-per-call SQLite store for usage records."""
@@ -38,6 +47,8 @@ class UsageStore:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
         self._conn: Optional[sqlite3.Connection] = None
+        self._revision = 0
+        self._purge_generation = 0
         self._init_db()
 
     # ------------------------------------------------------------------
@@ -61,6 +72,8 @@ class UsageStore:
                 conn.execute("ALTER TABLE usage ADD COLUMN simulated_cost_avoided REAL NOT NULL DEFAULT 0.0")
             if "complexity_score" not in columns:
                 conn.execute("ALTER TABLE usage ADD COLUMN complexity_score INTEGER NOT NULL DEFAULT 0")
+            for stmt in _CREATE_INDEXES:
+                conn.execute(stmt)
             conn.commit()
 
     def close(self) -> None:
@@ -74,6 +87,20 @@ class UsageStore:
     # Public API
     # ------------------------------------------------------------------
 
+    @property
+    def revision(self) -> int:
+        """Monotonic counter bumped on every write; use it to key caches."""
+        return self._revision
+
+    @property
+    def purge_generation(self) -> int:
+        """Counter bumped only when :meth:`purge_before` deletes rows.
+
+        Incremental aggregations keyed on :meth:`last_id` stay valid across
+        inserts but must be rebuilt once this changes.
+        """
+        return self._purge_generation
+
     def record(self, usage: UsageRecord, routing_context: Optional[Any] = None) -> None:
         """Insert a single usage record."""
         if routing_context is not None:
@@ -104,16 +131,22 @@ class UsageStore:
                 ),
             )
             conn.commit()
+            self._revision += 1
 
-    def query(
+    def iter_query(
         self,
         start: Optional[str] = None,
         end: Optional[str] = None,
         model_id: Optional[str] = None,
         provider: Optional[str] = None,
         role: Optional[str] = None,
-    ) -> list[UsageRecord]:
-        """Return matching records with optional filters."""
+        batch_size: int = 1000,
+    ) -> Iterator[UsageRecord]:
+        """Yield matching records in timestamp order, *batch_size* at a time.
+
+        Only one batch of rows is held in memory, so callers reducing a
+        long range in a single pass avoid materialising every record.
+        """
         clauses: list[str] = []
         params: list[object] = []
 
@@ -137,26 +170,46 @@ class UsageStore:
         sql = f"SELECT timestamp, model_id, provider, role, intent, input_tokens, output_tokens, elapsed_s, success, is_cloud, simulated_cost_avoided, complexity_score FROM usage{where} ORDER BY timestamp"
 
         with self._lock:
-            conn = self._connect()
-            rows = conn.execute(sql, params).fetchall()
+            cursor = self._connect().execute(sql, params)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for r in rows:
+                    yield UsageRecord(
+                        timestamp=r[0],
+                        model_id=r[1],
+                        provider=r[2],
+                        role=r[3],
+                        intent=r[4],
+                        input_tokens=r[5],
+                        output_tokens=r[6],
+                        elapsed_s=r[7],
+                        success=bool(r[8]),
+                        is_cloud=bool(r[9]),
+                        simulated_cost_avoided=float(r[10]),
+                        complexity_score=int(r[11]),
+                    )
+        finally:
+            cursor.close()
 
-        return [
-            UsageRecord(
-                timestamp=r[0],
-                model_id=r[1],
-                provider=r[2],
-                role=r[3],
-                intent=r[4],
-                input_tokens=r[5],
-                output_tokens=r[6],
-                elapsed_s=r[7],
-                success=bool(r[8]),
-                is_cloud=bool(r[9]),
-                simulated_cost_avoided=float(r[10]),
-                complexity_score=int(r[11]),
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        model_id: Optional[str] = None,
+        provider: Optional[str] = None,
+        role: Optional[str] = None,
+    ) -> list[UsageRecord]:
+        """Return matching records with optional filters."""
+        return list(
+            self.iter_query(
+                start=start, end=end, model_id=model_id,
+                provider=provider, role=role,
             )
-            for r in rows
-        ]
+        )
 
     def aggregate_tokens(
         self,
@@ -198,6 +251,60 @@ class UsageStore:
             for r in rows
         ]
 
+    def aggregate(
+        self,
+        group_by: tuple[str, ...] = ("provider", "model_id"),
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        after_id: Optional[int] = None,
+        upto_id: Optional[int] = None,
+    ) -> list[tuple]:
+        """Grouped request/token/latency sums computed in SQL.
+
+        *after_id* / *upto_id* restrict rows to ``after_id < id <= upto_id``
+        so callers can fold in only the rows added since a previous call.
+
+        Returns one tuple per group, ordered by the group columns::
+
+            (*group_values, requests, input_tokens, output_tokens, elapsed_s)
+        """
+        allowed = {"model_id", "provider", "role", "intent"}
+        if not group_by or not set(group_by) <= allowed:
+            raise ValueError(f"group_by columns must be in {allowed}")
+
+        clauses: list[str] = []
+        params: list[object] = []
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(end)
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(after_id)
+        if upto_id is not None:
+            clauses.append("id <= ?")
+            params.append(upto_id)
+
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        cols = ", ".join(group_by)
+        sql = (
+            f"SELECT {cols}, COUNT(*), SUM(input_tokens), SUM(output_tokens), "
+            f"SUM(elapsed_s) FROM usage{where} GROUP BY {cols} ORDER BY {cols}"
+        )
+
+        with self._lock:
+            conn = self._connect()
+            return conn.execute(sql, params).fetchall()
+
+    def last_id(self) -> int:
+        """Return the highest row id written so far (0 when empty)."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT COALESCE(MAX(id), 0) FROM usage").fetchone()
+        return row[0]
+
     def total_tokens(
         self,
         start: Optional[str] = None,
@@ -231,4 +338,7 @@ class UsageStore:
                 "DELETE FROM usage WHERE timestamp < ?", (timestamp,)
             )
             conn.commit()
+            if cur.rowcount:
+                self._revision += 1
+                self._purge_generation += 1
             return cur.rowcount
@@ -0,0 +1,104 @@
+"""Embedding-based cache of final tool answers.
+
+Where :class:`~aurarouter.response_cache.ResponseCache` only matches a
+prompt that is identical up to whitespace, this cache also answers
+prompts that are worded differently but mean the same thing.  It embeds
+the request and returns the stored answer of the most similar earlier
+request when their cosine similarity reaches a threshold.
+
+The embedding function is supplied by the caller.  The server uses the
+bundled all-MiniLM-L6-v2 ONNX encoder (see
+:meth:`~aurarouter.analyzers.onnx_vector.ONNXVectorAnalyzer.embed`).  Texts
+longer than the encoder's window are neither looked up nor stored,
+because two requests that differ only after the cut-off would embed
+identically.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger("AuraRouter.SemanticCache")
+
+
+class SemanticCache:
+    """Thread-safe nearest-neighbour cache of response texts.
+
+    Entries live in one matrix per namespace, and a lookup is a single
+    matrix-vector product.  Once *max_entries* is reached in a namespace,
+    the oldest entry is evicted.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], "np.ndarray | None"],
+        threshold: float = 0.9,
+        max_entries: int = 1024,
+        max_words: int = 128,
+    ):
+        self._embed = embed
+        self._threshold = float(threshold)
+        self._max_entries = max(1, int(max_entries))
+        self._max_words = int(max_words)
+        self._lock = threading.Lock()
+        # namespace -> (L2-normalised embeddings [n, dim], response texts)
+        self._entries: dict[str, tuple[np.ndarray, list[str]]] = {}
+
+    def _vector(self, text: str) -> "np.ndarray | None":
+        if len(text.split()) > self._max_words:
+            return None
+        vec = self._embed(text)
+        if vec is None:
+            return None
+        vec = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 0 else None
+
+    def lookup(self, namespace: str, text: str) -> Optional[str]:
+        """Return the answer stored for the closest match to *text*, or ``None``."""
+        vec = self._vector(text)
+        if vec is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(namespace)
+            if entry is None:
+                return None
+            matrix, responses = entry
+            scores = matrix @ vec
+            best = int(np.argmax(scores))
+            if scores[best] < self._threshold:
+                return None
+            logger.debug(
+                "Semantic cache hit in %s (similarity %.3f)", namespace, scores[best],
+            )
+            return responses[best]
+
+    def store(self, namespace: str, text: str, response: str) -> None:
+        """Remember *response* as the answer to *text*."""
+        vec = self._vector(text)
+        if vec is None:
+            return
+        with self._lock:
+            entry = self._entries.get(namespace)
+            if entry is None:
+                self._entries[namespace] = (vec[None, :], [response])
+                return
+            matrix, responses = entry
+            matrix = np.vstack([matrix, vec[None, :]])
+            responses = responses + [response]
+            if len(responses) > self._max_entries:
+                matrix, responses = matrix[1:], responses[1:]
+            self._entries[namespace] = (matrix, responses)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(responses) for _m, responses in self._entries.values())
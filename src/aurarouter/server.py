@@ -1,6 +1,7 @@
+import asyncio
 from pathlib import Path
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
@@ -12,6 +13,8 @@ from aurarouter.budget_sync import (
 )
 from aurarouter.config import ConfigLoader
 from aurarouter.fabric import ComputeFabric
+from aurarouter.response_cache import ResponseCache
+from aurarouter.semantic_cache import SemanticCache
 from aurarouter.registration import (
     RegistrationStore,
     discovery_status_fn as _discovery_status,
@@ -22,7 +25,7 @@ from aurarouter.mcp_tools import (
     catalog_list_artifacts as _catalog_list_artifacts,
     catalog_register_artifact as _catalog_register_artifact,
     catalog_remove_artifact as _catalog_remove_artifact,
-    compare_models as _compare_models,
+    iter_compare_models as _iter_compare_models,
     generate_code as _generate_code,
     get_active_analyzer as _get_active_analyzer,
     list_assets as _list_assets,
@@ -118,6 +121,40 @@ def _build_triage_router(config: ConfigLoader) -> TriageRouter | None:
     return TriageRouter.from_config(triage_cfg)
 
 
+def _build_response_cache(config: ConfigLoader) -> ResponseCache | None:
+    """Build the tool response cache from config, or None if not enabled."""
+    cache_cfg = config.get_response_cache_config()
+    if not cache_cfg.get("enabled", False):
+        return None
+    return ResponseCache(
+        max_entries=cache_cfg.get("max_entries", 256),
+        ttl_seconds=cache_cfg.get("ttl_seconds", 600.0),
+    )
+
+
+def _build_semantic_cache(config: ConfigLoader) -> SemanticCache | None:
+    """Build the embedding-based answer cache from config, or None.
+
+    Returns None when the cache is not enabled or the bundled sentence
+    encoder cannot be loaded.
+    """
+    cache_cfg = config.get_semantic_cache_config()
+    if not cache_cfg.get("enabled", False):
+        return None
+    from aurarouter.analyzers.onnx_vector import ONNXVectorAnalyzer
+    from aurarouter.intent_registry import IntentRegistry
+
+    encoder = ONNXVectorAnalyzer(IntentRegistry())
+    if encoder.embed("probe") is None:
+        logger.warning("Semantic cache disabled: sentence encoder unavailable.")
+        return None
+    return SemanticCache(
+        encoder.embed,
+        threshold=cache_cfg.get("threshold", 0.9),
+        max_entries=cache_cfg.get("max_entries", 1024),
+    )
+
+
 # Default enabled state for each MCP tool.
 _MCP_TOOL_DEFAULTS: dict[str, bool] = {
     "route_task": True,
@@ -149,6 +186,11 @@ def create_mcp_server(config: ConfigLoader) -> FastMCP:
     savings_kwargs = _build_savings_components(config)
     fabric = ComputeFabric(config, **savings_kwargs)
     triage_router = _build_triage_router(config)
+    response_cache = _build_response_cache(config)
+    semantic_cache = _build_semantic_cache(config)
+    reuse_routed_answers = bool(
+        config.get_semantic_cache_config().get("local_reuses_route_task", False)
+    )
 
     # --- Grid services (opt-in) ---
     registry = None
@@ -162,11 +204,15 @@ def create_mcp_server(config: ConfigLoader) -> FastMCP:
             name = ep.get("name", url)
             if not url:
                 continue
-            client = GridMcpClient(base_url=url, name=name)
-            connected = client.connect()
-            registry.register(name, client)
+            registry.register(name, GridMcpClient(base_url=url, name=name))
+
+        # Discover tools on all endpoints concurrently.
+        clients = registry.get_clients()
+        for name, connected in registry.refresh_all().items():
             if not connected:
-                logger.warning(f"Grid service '{name}' at {url} not reachable")
+                logger.warning(
+                    "Grid service '%s' at %s not reachable", name, clients[name].base_url,
+                )
 
         # Auto-sync discovered models into config
         if grid_cfg.get("auto_sync_models", True):
@@ -231,21 +277,32 @@ def create_mcp_server(config: ConfigLoader) -> FastMCP:
                     import json
                     perms_dict = json.loads(permissions)
                 except Exception:
-                    logger.warning(f"Invalid permissions JSON: {permissions}")
+                    logger.warning("Invalid permissions JSON: %s", permissions)
 
             return _route_task(
                 fabric, triage_router, task=task, context=context, format=format,
                 config=config, options={"permissions": perms_dict} if perms_dict else None,
+                cache=response_cache, semantic_cache=semantic_cache,
             )
 
     if _is_enabled("local_inference"):
+        local_slots = asyncio.Semaphore(config.get_max_local_concurrency())
+
         @mcp.tool()
-        def local_inference(prompt: str, context: str = "") -> str:
+        async def local_inference(prompt: str, context: str = "") -> str:
             """Execute a prompt on local/private AI models (Ollama, llama.cpp)
             without sending data to cloud APIs. Use for privacy-sensitive
             tasks, offline processing, or when data must not leave the local
             network."""
-            return _local_inference(fabric, prompt=prompt, context=context)
+            # Run off the event loop so concurrent calls reach the local
+            # backend together, where continuous batching can merge them.
+            async with local_slots:
+                return await asyncio.to_thread(
+                    _local_inference,
+                    fabric, prompt=prompt, context=context, cache=response_cache,
+                    semantic_cache=semantic_cache,
+                    reuse_routed_answers=reuse_routed_answers,
+                )
 
     if _is_enabled("generate_code"):
         @mcp.tool()
@@ -260,16 +317,33 @@ def create_mcp_server(config: ConfigLoader) -> FastMCP:
                 task_description=task_description,
                 file_context=file_context,
                 language=language,
+                cache=response_cache,
+                semantic_cache=semantic_cache,
             )
 
     if _is_enabled("compare_models"):
         @mcp.tool()
-        def compare_models(prompt: str, models: str = "") -> str:
+        async def compare_models(
+            prompt: str, models: str = "", ctx: Context | None = None,
+        ) -> str:
             """Run a prompt across multiple AI models and return all responses
             for comparison. Useful for evaluating model quality, testing
             prompts, or choosing the best response. Provide comma-separated
             model IDs, or leave empty to use all configured models."""
-            return _compare_models(fabric, prompt=prompt, models=models)
+            # Each response is also sent as a log message the moment its
+            # model finishes, so clients see the fastest model first.
+            blocks = _iter_compare_models(fabric, prompt=prompt, models=models)
+            parts: list[str] = []
+            while (block := await asyncio.to_thread(next, blocks, None)) is not None:
+                parts.append(block)
+                if ctx is not None:
+                    try:
+                        await ctx.info(block)
+                    except ValueError:  # called outside an MCP request
+                        ctx = None
+            if not parts:
+                return "Error: No models available for comparison."
+            return "\n".join(parts)
 
     if _is_enabled("list_models"):
         @mcp.tool()
@@ -385,6 +459,8 @@ def create_mcp_server(config: ConfigLoader) -> FastMCP:
                 task_description=task_description,
                 file_context=file_context,
                 language=language,
+                cache=response_cache,
+                semantic_cache=semantic_cache,
             )
 
     # --- Session management (opt-in) ---
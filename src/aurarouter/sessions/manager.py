@@ -398,7 +398,7 @@ class SessionManager:
                 # Archive trace (Task 1.4)
                 session.metadata["monologue_trace"] = [s.to_dict() for s in monologue_result.reasoning_trace]
             except Exception as e:
-                logger.error(f"Monologue execution failed: {e}")
+                logger.error("Monologue execution failed: %s", e)
                 result = GR(text=f"ERROR: Monologue failed: {e}")
                 
         elif execution_mode == "speculative":
@@ -419,7 +419,7 @@ class SessionManager:
                 if "session_id" in spec_result:
                     session.metadata["speculative_trace"] = spec_result
             except Exception as e:
-                logger.error(f"Speculative execution failed: {e}")
+                logger.error("Speculative execution failed: %s", e)
                 result = GR(text=f"ERROR: Speculative failed: {e}")
                 
         else:
@@ -66,7 +66,7 @@ def count_tokens(text: str, model_id: str = "") -> int:
             
             return len(encoding.encode(text))
         except Exception as e:
-            logger.debug(f"Tiktoken encoding failed for model {model_id}: {e}")
+            logger.debug("Tiktoken encoding failed for model %s: %s", model_id, e)
 
     # 3. Fallback heuristic
     words = len(text.split())
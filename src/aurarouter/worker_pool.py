@@ -0,0 +1,107 @@
+"""Process-wide thread pools for blocking model calls.
+
+Plan fan-out and model comparison need a few worker threads per request.
+Sharing one long-lived pool avoids starting and joining fresh threads on
+every call.  Per-call concurrency limits are enforced by
+:func:`bounded_map` rather than by the pool size.
+
+The shared pool only runs leaf work that never waits on the pool itself.
+Sync-to-async bridges (:func:`run_coroutine`) block until a whole
+coroutine finishes, which may in turn fan out onto the shared pool, so
+they run on a separate bridge pool; otherwise enough overlapping requests
+could leave every shared worker waiting on work queued behind it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterator
+
+_MAX_WORKERS = 32
+_MAX_BRIDGE_WORKERS = 16
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_bridge_executor: ThreadPoolExecutor | None = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared pool, creating it on first use or after shutdown."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="AuraRouter-Worker",
+            )
+        return _executor
+
+
+def _get_bridge_executor() -> ThreadPoolExecutor:
+    global _bridge_executor
+    with _lock:
+        if _bridge_executor is None:
+            _bridge_executor = ThreadPoolExecutor(
+                max_workers=_MAX_BRIDGE_WORKERS,
+                thread_name_prefix="AuraRouter-Bridge",
+            )
+        return _bridge_executor
+
+
+def shutdown_executor(wait: bool = False) -> None:
+    """Shut both pools down, cancelling work that has not started."""
+    global _executor, _bridge_executor
+    with _lock:
+        executors = (_executor, _bridge_executor)
+        _executor = _bridge_executor = None
+    for executor in executors:
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def run_coroutine(coro: Awaitable[Any], timeout: float | None = None) -> Any:
+    """Run *coro* in its own event loop on the bridge pool and return its result.
+
+    For synchronous callers already inside a running loop.  With *timeout*,
+    the coroutine is cancelled once that many seconds pass, raising
+    :class:`asyncio.TimeoutError`, so a timed-out job frees its worker.
+    """
+    if timeout is not None:
+        coro = asyncio.wait_for(coro, timeout)
+    return _get_bridge_executor().submit(asyncio.run, coro).result()
+
+
+def bounded_map(
+    fn: Callable[[Any], Any], items: list, limit: int,
+) -> Iterator[tuple[int, Any]]:
+    """Run *fn* over *items* on the shared pool, yielding as results finish.
+
+    Yields ``(index, result)`` pairs in completion order with at most
+    *limit* calls in flight.  Exceptions from *fn* propagate.  Closing the
+    iterator early cancels calls that have not started.
+    """
+    executor = get_executor()
+    items_iter = iter(enumerate(items))
+    finished: queue.SimpleQueue[Future] = queue.SimpleQueue()
+    running: dict[Future, int] = {}
+
+    def submit_next() -> None:
+        for index, item in items_iter:
+            future = executor.submit(fn, item)
+            running[future] = index
+            future.add_done_callback(finished.put)
+            return
+
+    try:
+        for _ in range(max(1, limit)):
+            submit_next()
+        while running:
+            future = finished.get()
+            index = running.pop(future)
+            submit_next()
+            yield index, future.result()
+    finally:
+        for future in running:
+            future.cancel()
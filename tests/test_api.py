@@ -319,12 +319,15 @@ class TestMonitoring:
 
     def test_get_traffic_with_stores(self, api_full):
         """get_traffic aggregates from usage store and cost engine."""
-        api_full._usage_store.total_tokens = MagicMock(
-            return_value={"input_tokens": 100, "output_tokens": 50, "total_tokens": 150}
-        )
-        api_full._usage_store.aggregate_tokens = MagicMock(return_value=[])
-        api_full._cost_engine.total_spend = MagicMock(return_value=0.05)
-        api_full._cost_engine.spend_by_provider = MagicMock(return_value={"ollama": 0.0})
+        api_full._cost_engine.window_stats = MagicMock(return_value={
+            "total_requests": 3,
+            "input_tokens": 100,
+            "output_tokens": 50,
+            "total_tokens": 150,
+            "total_cost": 0.05,
+            "spend_by_provider": {"ollama": 0.0},
+            "by_model": [],
+        })
         api_full._cost_engine.monthly_projection = MagicMock(return_value={})
 
         summary = api_full.get_traffic()
@@ -346,6 +346,36 @@ class TestServiceClasses:
         # Verify the main method is callable
         assert callable(service.intelligent_code_gen)
 
+    @pytest.mark.asyncio
+    async def test_intelligent_code_gen_runs_independent_steps_together(self):
+        """Steps without dependencies are in flight at the same time."""
+        import threading
+
+        from aurarouter.routing import PlanStep, TriageResult
+        from aurarouter.savings.models import GenerateResult
+
+        both_started = threading.Barrier(2, timeout=5)
+        prompts = []
+
+        def fake_execute(role, prompt):
+            prompts.append(prompt)
+            if "GOAL: c" not in prompt:
+                both_started.wait()
+            return GenerateResult(text=prompt.split("\n", 1)[0])
+
+        fabric = Mock()
+        fabric.execute.side_effect = fake_execute
+        plan = [PlanStep("a", []), PlanStep("b", []), PlanStep("c", [0, 1])]
+        with patch(
+            "aurarouter.auragrid.services.analyze_intent",
+            return_value=TriageResult("COMPLEX_REASONING", 8),
+        ), patch("aurarouter.auragrid.services.generate_plan", return_value=plan):
+            result = await UnifiedRouterService(fabric).intelligent_code_gen("t")
+
+        assert "# --- Step 1: a ---\nGOAL: a" in result
+        assert "# --- Step 3: c ---\nGOAL: c" in result
+        assert "Step 1: a" in prompts[-1] and "Step 2: b" in prompts[-1]
+
 
 class TestManifestBuilder:
     """Tests for ManifestBuilder."""
@@ -20,6 +20,7 @@ def _make_loader(config_data: dict) -> ConfigLoader:
     loader = ConfigLoader.__new__(ConfigLoader)
     loader.config = config_data
     loader._config_path = None
+    loader._revision = 0
     return loader
 
 
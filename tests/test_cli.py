@@ -125,7 +125,7 @@ class TestListModels:
 
     def test_list_models_empty(self, capsys):
         mock_storage = MagicMock()
-        mock_storage.list_models.return_value = []
+        mock_storage.list_models_for_display.return_value = []
         mock_storage.models_dir = "/fake/models"
 
         with patch(
@@ -139,8 +139,13 @@ class TestListModels:
 
     def test_list_models_with_entries(self, capsys):
         mock_storage = MagicMock()
-        mock_storage.list_models.return_value = [
-            {"filename": "model.gguf", "size_bytes": 1024 * 1024 * 100, "repo": "org/repo"},
+        mock_storage.list_models_for_display.return_value = [
+            {
+                "filename": "model.gguf",
+                "size_bytes": 1024 * 1024 * 100,
+                "size_mb_str": "100",
+                "repo": "org/repo",
+            },
         ]
         mock_storage.models_dir = "/fake/models"
 
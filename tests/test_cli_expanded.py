@@ -314,8 +314,13 @@ class TestBackwardCompat:
     def test_list_models_legacy(self):
         mock_storage = MagicMock()
         mock_storage.models_dir = "/fake/models"
-        mock_storage.list_models.return_value = [
-            {"filename": "test.gguf", "size_bytes": 1024 * 1024 * 100, "repo": "Qwen/test"},
+        mock_storage.list_models_for_display.return_value = [
+            {
+                "filename": "test.gguf",
+                "size_bytes": 1024 * 1024 * 100,
+                "size_mb_str": "100",
+                "repo": "Qwen/test",
+            },
         ]
         with patch("aurarouter.models.file_storage.FileModelStorage", return_value=mock_storage):
             output = _run_cli("list-models")
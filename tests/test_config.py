@@ -129,6 +129,35 @@ def test_get_all_roles(config):
     assert "coding" in roles
 
 
+@pytest.mark.parametrize("mutate", [
+    lambda c: c.set_model("m", {"provider": "ollama"}),
+    lambda c: c.set_role_chain("r", ["m"]),
+    lambda c: c.catalog_set("svc", {"kind": "service"}),
+    lambda c: c.add_catalog_manual_entry("p", "http://x"),
+    lambda c: c.set_active_analyzer("a"),
+    lambda c: c.set_mcp_tool_enabled("route_task", False),
+    lambda c: c.set_semantic_verb("coding", ["build"]),
+])
+def test_every_mutator_bumps_revision(mutate):
+    config = ConfigLoader(allow_missing=True)
+    assert config.revision == 0
+    mutate(config)
+    assert config.revision == 1
+
+
+def test_removals_bump_revision_only_when_found():
+    config = ConfigLoader(allow_missing=True)
+    config.catalog_set("svc", {"kind": "service"})
+    config.add_catalog_manual_entry("p", "http://x")
+    before = config.revision
+    assert config.catalog_remove("missing") is False
+    assert config.remove_catalog_manual_entry("missing") is False
+    assert config.revision == before
+    assert config.catalog_remove("svc") is True
+    assert config.remove_catalog_manual_entry("p") is True
+    assert config.revision == before + 2
+
+
 # ------------------------------------------------------------------
 # Persistence (save / round-trip)
 # ------------------------------------------------------------------
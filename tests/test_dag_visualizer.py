@@ -130,3 +130,135 @@ class TestDAGVisualizer:
         text = v._summary_label.text()
         assert "Classify" in text
         assert "Execute" in text
+
+    def test_on_model_tried_coalesces_repaint(self):
+        v = self._make()
+        v.add_node({
+            "id": "exec-0",
+            "label": "Execute",
+            "role": "coding",
+            "status": "running",
+        })
+        before = v._summary_label.text()
+        v.on_model_tried("coding", "model-a", False, 0.5)
+        v.on_model_tried("coding", "model-b", True, 1.2)
+        # Trace is updated immediately; the repaint is pending.
+        assert len(v._trace.nodes["exec-0"].attempts) == 2
+        assert v._flush_timer.isActive()
+        assert v._summary_label.text() == before
+
+        v._flush_timer.stop()
+        v._refresh()
+        assert "(1.2s)" in v._summary_label.text()
+
+    def test_on_model_tried_prefers_running_node(self):
+        v = self._make()
+        v.add_node({"id": "step-0", "label": "S0", "role": "coding", "status": "running"})
+        v.add_node({"id": "step-1", "label": "S1", "role": "coding", "status": "pending"})
+        v.on_model_tried("coding", "model-a", True, 0.4)
+        assert len(v._trace.nodes["step-0"].attempts) == 1
+        assert v._trace.nodes["step-1"].attempts == []
+
+        v.on_model_tried("coding", "model-b", True, 0.2)
+        # No RUNNING coding node left: newest coding node receives it.
+        assert len(v._trace.nodes["step-1"].attempts) == 1
+
+    def test_edge_paths_cached_on_layout(self):
+        v = self._make()
+        v.add_node({"id": "classify-0", "label": "C", "role": "router"})
+        v.add_node({
+            "id": "execute-0",
+            "label": "E",
+            "role": "coding",
+            "parent_ids": ["classify-0"],
+        })
+        canvas = v._canvas
+        assert not canvas._edge_path.isEmpty()
+        assert not canvas._arrow_path.isEmpty()
+        canvas.resize(canvas.minimumSize())
+        assert not canvas.grab().isNull()  # paints from the cached paths
+
+        v.reset()
+        assert canvas._edge_path.isEmpty()
+
+    def test_update_node_applies_all_fields(self):
+        v = self._make()
+        v.add_node({"id": "step-0", "label": "S", "role": "coding", "status": "running"})
+        v.update_node("step-0", {
+            "status": "failed",
+            "elapsed_s": 2.5,
+            "output_tokens": 7,
+            "result_preview": "oops",
+            "attempts": [{"model_id": "m", "success": False, "elapsed_s": 2.5}],
+        })
+        node = v._trace.nodes["step-0"]
+        assert node.status == NodeStatus.FAILED
+        assert node.elapsed_s == 2.5
+        assert node.output_tokens == 7
+        assert node.result_preview == "oops"
+        assert node.model_id is None
+        assert node.attempts[0].model_id == "m"
+
+    def test_reset_restores_updates_enabled(self):
+        v = self._make()
+        v.add_node({"id": "a", "label": "A", "role": "router"})
+        v.reset()
+        assert v.updatesEnabled()
+        assert v._canvas.isHidden()
+        assert v._toggle_btn.text() == "▶"
+
+    def test_tooltip_built_lazily_and_cached(self):
+        v = self._make()
+        v.add_node({"id": "exec-0", "label": "Execute", "role": "coding", "status": "running"})
+        canvas = v._canvas
+        assert canvas._tooltip_cache == {}
+
+        v.on_model_tried("coding", "model-a", False, 0.5)
+        assert canvas._tooltip_cache == {}  # nothing rendered until hovered
+        first = canvas._tooltip_for("exec-0")
+        assert "model-a: FAIL" in first
+        assert canvas._tooltip_for("exec-0") is first
+
+        v.on_model_tried("coding", "model-b", True, 1.0)
+        second = canvas._tooltip_for("exec-0")
+        assert "model-b: OK" in second
+        assert canvas._tooltip_for("missing") == ""
+
+    def test_tooltip_refreshed_when_attempts_replaced(self):
+        v = self._make()
+        v.add_node({"id": "exec-0", "label": "Execute", "role": "coding", "status": "running"})
+        v.update_node("exec-0", {"attempts": [
+            {"model_id": "m", "success": False, "elapsed_s": 0.5},
+        ]})
+        assert "m: FAIL (0.50s)" in v._canvas._tooltip_for("exec-0")
+
+        # Same number of attempts, different contents.
+        v.update_node("exec-0", {"attempts": [
+            {"model_id": "m", "success": True, "elapsed_s": 2.0},
+        ]})
+        assert "m: OK (2.00s)" in v._canvas._tooltip_for("exec-0")
+
+    def test_status_style_table_covers_all_statuses(self):
+        from aurarouter.gui.dag_visualizer import _STATUS_STYLE
+
+        assert set(_STATUS_STYLE) == set(NodeStatus)
+        _bg, (normal, hover) = _STATUS_STYLE[NodeStatus.FAILED]
+        assert normal.widthF() == 1.5
+        assert hover.widthF() == 2.0
+
+    def test_on_model_tried_ignores_untracked_role(self):
+        v = self._make()
+        v.add_node({"id": "exec-0", "label": "Execute", "role": "coding", "status": "running"})
+        v.on_model_tried("embedder", "embed-model", True, 0.1)
+        assert v._trace.nodes["exec-0"].attempts == []
+        assert not v._flush_timer.isActive()
+
+    def test_role_index_rebuilt_when_trace_swapped(self):
+        from aurarouter.gui.execution_trace import ExecutionTrace, TraceNode
+
+        v = self._make()
+        trace = ExecutionTrace()
+        trace.add_node(TraceNode(id="r", label="R", role="router", status=NodeStatus.RUNNING))
+        v._trace = trace  # as WorkspacePanel does for its idle template
+        v.on_model_tried("router", "m", True, 0.2)
+        assert trace.nodes["r"].model_id == "m"
@@ -10,7 +10,7 @@ Covers:
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -150,6 +150,49 @@ class TestGetLocalChain:
         )
         assert fabric.get_local_chain("coding") == ["g1"]
 
+    def test_cached_until_config_mutated(self):
+        fabric = _make_fabric(
+            models={"m1": {"provider": "ollama", "model_name": "l1", "endpoint": "http://x"}},
+            roles={"coding": ["m1"]},
+        )
+        config = fabric._config
+        with patch.object(config, "get_role_chain", wraps=config.get_role_chain) as spy:
+            assert fabric.get_local_chain("coding") == ["m1"]
+            assert fabric.get_local_chain("coding") == ["m1"]
+            assert spy.call_count == 1
+
+            config.set_model("m2", {"provider": "ollama", "model_name": "l2", "endpoint": "http://y"})
+            config.set_role_chain("coding", ["m1", "m2"])
+            assert fabric.get_local_chain("coding") == ["m1", "m2"]
+            assert spy.call_count == 2
+
+    def test_cache_not_shared_with_callers(self):
+        fabric = _make_fabric(
+            models={"m1": {"provider": "ollama", "model_name": "l1", "endpoint": "http://x"}},
+            roles={"coding": ["m1"]},
+        )
+        fabric.get_local_chain("coding").append("junk")
+        assert fabric.get_local_chain("coding") == ["m1"]
+
+    def test_cache_dropped_when_config_replaced(self):
+        fabric = _make_fabric(
+            models={"m1": {"provider": "ollama", "model_name": "l1", "endpoint": "http://x"}},
+            roles={"coding": ["m1"]},
+        )
+        assert fabric.get_local_chain("coding") == ["m1"]
+        fabric._config.config = {"models": {}, "roles": {"coding": []}}
+        assert fabric.get_local_chain("coding") == []
+
+    def test_known_model_ids_follow_config_changes(self):
+        fabric = _make_fabric(
+            models={"m1": {"provider": "ollama", "model_name": "l1", "endpoint": "http://x"}},
+            roles={"coding": ["m1"]},
+        )
+        assert fabric.known_model_ids() == frozenset({"m1"})
+        assert fabric.known_model_ids() is fabric.known_model_ids()
+        fabric._config.set_model("m2", {"provider": "ollama", "model_name": "l2", "endpoint": "http://y"})
+        assert fabric.known_model_ids() == frozenset({"m1", "m2"})
+
 
 # ---------------------------------------------------------------------------
 # ComputeFabric.set_routing_advisors
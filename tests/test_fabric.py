@@ -129,12 +129,14 @@ def test_execute_all_collects_all():
         roles={"coding": ["m1", "m2"]},
     )
 
+    replies = {
+        "a": GenerateResult(text="response1", input_tokens=10, output_tokens=20),
+        "b": GenerateResult(text="response2", input_tokens=15, output_tokens=25),
+    }
     with patch(
         "aurarouter.providers.ollama.OllamaProvider.generate_with_usage",
-        side_effect=[
-            GenerateResult(text="response1", input_tokens=10, output_tokens=20),
-            GenerateResult(text="response2", input_tokens=15, output_tokens=25),
-        ],
+        autospec=True,
+        side_effect=lambda self, prompt, json_mode=False: replies[self.config["model_name"]],
     ):
         results = fabric.execute_all("coding", "test prompt")
 
@@ -187,6 +189,160 @@ def test_execute_all_handles_failures():
     assert "ERROR" in results[0]["text"]
 
 
+def test_execute_all_submits_all_before_collecting():
+    """Model calls overlap, yet results keep the chain order."""
+    import threading
+
+    fabric = _make_fabric(
+        models={
+            "m1": {"provider": "ollama", "model_name": "a", "endpoint": "http://x"},
+            "m2": {"provider": "ollama", "model_name": "b", "endpoint": "http://y"},
+            "m3": {"provider": "ollama", "model_name": "c", "endpoint": "http://z"},
+        },
+        roles={"coding": ["m1", "m2", "m3"]},
+    )
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake(self, prompt, json_mode=False):
+        barrier.wait()  # deadlocks unless all three calls are in flight
+        return GenerateResult(text=self.config["model_name"])
+
+    with patch(
+        "aurarouter.providers.ollama.OllamaProvider.generate_with_usage",
+        autospec=True,
+        side_effect=fake,
+    ):
+        results = fabric.execute_all("coding", "p")
+
+    assert [r["text"] for r in results] == ["a", "b", "c"]
+
+
+def test_execute_all_respects_max_concurrency():
+    import threading
+
+    fabric = _make_fabric(
+        models={
+            f"m{i}": {"provider": "ollama", "model_name": str(i), "endpoint": "http://x"}
+            for i in range(4)
+        },
+        roles={"coding": [f"m{i}" for i in range(4)]},
+    )
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fake(self, prompt, json_mode=False):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.02)
+        with lock:
+            active -= 1
+        return GenerateResult(text="ok")
+
+    with patch(
+        "aurarouter.providers.ollama.OllamaProvider.generate_with_usage",
+        autospec=True,
+        side_effect=fake,
+    ):
+        results = fabric.execute_all("coding", "p", max_concurrency=2)
+
+    assert len(results) == 4
+    assert peak <= 2
+
+
+def test_execute_all_limits_calls_per_provider():
+    import threading
+    import time
+
+    fabric = _make_fabric(
+        models={
+            f"o{i}": {"provider": "ollama", "model_name": f"o{i}", "endpoint": "http://x"}
+            for i in range(4)
+        },
+        roles={"coding": ["o0", "o1", "o2", "o3"]},
+    )
+    fabric.config.config["execution"] = {"max_provider_concurrency": 1}
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fake(self, prompt, json_mode=False):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return GenerateResult(text=self.config["model_name"])
+
+    with patch(
+        "aurarouter.providers.ollama.OllamaProvider.generate_with_usage",
+        autospec=True,
+        side_effect=fake,
+    ):
+        results = fabric.execute_all("coding", "p")
+
+    assert [r["text"] for r in results] == ["o0", "o1", "o2", "o3"]
+    assert peak == 1
+
+
+def test_iter_all_yields_in_completion_order():
+    import threading
+
+    fabric = _make_fabric(
+        models={
+            "slow": {"provider": "ollama", "model_name": "slow", "endpoint": "http://x"},
+            "fast": {"provider": "ollama", "model_name": "fast", "endpoint": "http://y"},
+        },
+        roles={"coding": ["slow", "fast"]},
+    )
+    fast_done = threading.Event()
+
+    def fake(self, prompt, json_mode=False):
+        if self.config["model_name"] == "slow":
+            assert fast_done.wait(5)
+        else:
+            fast_done.set()
+        return GenerateResult(text=self.config["model_name"])
+
+    with patch(
+        "aurarouter.providers.ollama.OllamaProvider.generate_with_usage",
+        autospec=True,
+        side_effect=fake,
+    ):
+        texts = [r["text"] for r in fabric.iter_all("coding", "p")]
+
+    assert texts == ["fast", "slow"]
+
+
+def test_execute_batch_splits_numbered_reply():
+    fabric = _make_fabric(
+        models={"m1": {"provider": "ollama", "model_name": "a", "endpoint": "http://x"}},
+        roles={"coding": ["m1"]},
+    )
+    reply = GenerateResult(text="[1]\ndef a(): pass\n\n[2] def b():\n    return [1]\n")
+    with patch.object(fabric, "execute", return_value=reply) as mock:
+        answers = fabric.execute_batch("coding", "LANG: python", ["make a", "make b"])
+
+    assert answers == ["def a(): pass", "def b():\n    return [1]"]
+    prompt = mock.call_args.args[1]
+    assert prompt.startswith("LANG: python\n")
+    assert "[1] make a\n[2] make b" in prompt
+
+
+def test_execute_batch_returns_none_on_missing_answer():
+    fabric = _make_fabric(
+        models={"m1": {"provider": "ollama", "model_name": "a", "endpoint": "http://x"}},
+        roles={"coding": ["m1"]},
+    )
+    for text in ("[1]\nonly one", "[2]\nb\n[1]\na", "[1]\n\n[2]\nb"):
+        with patch.object(fabric, "execute", return_value=GenerateResult(text=text)):
+            assert fabric.execute_batch("coding", "", ["a", "b"]) is None
+    with patch.object(fabric, "execute", return_value=None):
+        assert fabric.execute_batch("coding", "", ["a", "b"]) is None
+
+
 # ------------------------------------------------------------------
 # _try_model edge cases
 # ------------------------------------------------------------------
@@ -142,3 +142,22 @@ def test_default_dir():
     """Default models_dir is ~/.auracore/models/."""
     storage = FileModelStorage()
     assert storage.models_dir == Path.home() / ".auracore" / "models"
+
+
+def test_list_models_for_display(tmp_path):
+    """Display rows carry pre-formatted size/date strings without touching the registry."""
+    model_file = tmp_path / "model.gguf"
+    model_file.write_bytes(b"x" * (3 * 1024 * 1024))
+
+    storage = FileModelStorage(tmp_path)
+    storage.register(repo="org/repo", filename="model.gguf", path=model_file)
+
+    rows = storage.list_models_for_display()
+    assert rows[0]["size_mb_str"] == "3"
+    assert rows[0]["downloaded_date"] == rows[0]["downloaded_at"][:10]
+    assert "size_mb_str" not in storage.list_models()[0]
+
+    # Strings follow the registry when the size changes.
+    model_file.write_bytes(b"x" * (5 * 1024 * 1024))
+    storage.register(repo="org/repo", filename="model.gguf", path=model_file)
+    assert storage.list_models_for_display()[0]["size_mb_str"] == "5"
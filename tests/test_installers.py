@@ -10,7 +10,8 @@ def test_gemini_installer_properties():
     assert inst.name == "Gemini"
     assert inst.server_name == "aurarouter"
     assert len(inst.config_candidates()) >= 2
-    assert inst.extra_args() == []
+    assert inst.EXTRA_ARGS == ()
+    assert inst.build_payload()["args"] == ["-m", "aurarouter"]
 
 
 def test_gemini_detect_finds_existing(tmp_path):
@@ -46,3 +47,99 @@ def test_install_writes_mcp_entry(tmp_path):
     entry = data["mcpServers"]["aurarouter"]
     assert "command" in entry
     assert "args" in entry
+
+
+def test_detect_result_cached_until_install(tmp_path):
+    from aurarouter.installers.registry import _first_existing
+
+    settings = tmp_path / "settings.json"
+    inst = GeminiInstaller()
+    with patch.object(inst, "config_candidates", return_value=[settings]):
+        assert inst.detect_config_path() is None
+        settings.write_text("{}")
+        assert inst.detect_config_path() is None  # memoized miss
+
+        with patch("builtins.input", return_value=str(settings)):
+            inst.install()
+        assert _first_existing.cache_info().currsize == 0
+        assert inst.detect_config_path() == settings
+
+
+def test_install_backs_up_invalid_json(tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text("{not json")
+
+    inst = GeminiInstaller()
+    with (
+        patch.object(inst, "detect_config_path", return_value=settings),
+        patch("builtins.input", return_value=""),
+    ):
+        inst.install()
+
+    assert (tmp_path / "settings.json.bak").read_text() == "{not json"
+    assert "aurarouter" in json.loads(settings.read_text())["mcpServers"]
+
+
+def test_install_json_fallback_without_orjson(tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text('{"theme": "dark"}')
+
+    inst = GeminiInstaller()
+    with (
+        patch("aurarouter.installers.registry.orjson", None),
+        patch.object(inst, "detect_config_path", return_value=settings),
+        patch("builtins.input", return_value=""),
+    ):
+        inst.install()
+
+    data = json.loads(settings.read_text())
+    assert data["theme"] == "dark"
+    assert "aurarouter" in data["mcpServers"]
+
+
+def test_install_write_is_atomic(tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text('{"theme": "dark"}')
+
+    inst = GeminiInstaller()
+    with (
+        patch.object(inst, "detect_config_path", return_value=settings),
+        patch("builtins.input", return_value=""),
+        patch("aurarouter.installers.registry.os.replace", side_effect=OSError("disk full")),
+    ):
+        inst.install()  # failure is reported, not raised
+
+    assert json.loads(settings.read_text()) == {"theme": "dark"}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_installer_and_cli_imports_do_not_load_pyside6():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import aurarouter.cli, aurarouter.installers.registry, aurarouter.installers.gemini\n"
+        "import aurarouter.installers.template\n"
+        "assert 'PySide6' not in sys.modules, sorted(m for m in sys.modules if 'PySide6' in m)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_create_config_template_copies_resource(tmp_path, capsys):
+    import yaml
+
+    from aurarouter.installers.template import create_config_template
+
+    with patch("aurarouter.installers.template.Path.home", return_value=tmp_path):
+        create_config_template()
+        target = tmp_path / ".auracore" / "aurarouter" / "auraconfig.yaml"
+        config = yaml.safe_load(target.read_text())
+        assert config["system"]["active_analyzer"] == "aurarouter-default"
+        assert "router" in config["roles"]
+
+        target.write_text("models: {custom: {}}\n")
+        create_config_template()  # existing file is left alone
+        assert target.read_text() == "models: {custom: {}}\n"
+    assert "already exists" in capsys.readouterr().out
@@ -4,11 +4,14 @@ Task Group C, TG1 — covers IPCServer and IPCClient with round-trip
 integration, error handling, lifecycle, and platform dispatch.
 """
 
+import gc
 import json
+import queue
 import socket
 import sys
 import threading
 import time
+import warnings
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -51,6 +54,9 @@ def _start_server_on_free_port(handlers: dict | None = None) -> IPCServer:
     server._handlers = {}
     server._server_socket = None
     server._thread = None
+    server._pool = None
+    server._bufpool = queue.LifoQueue(16)
+    server._wakeup = None
     server._running = False
 
     # Override _serve_loop to use TCP directly (bypass platform dispatch)
@@ -127,6 +133,82 @@ class TestIPCServerHandlerDispatch:
             server.stop()
 
 
+class TestWireCodec:
+    """Newline-delimited framing is identical with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_encode_decode_roundtrip(self, use_orjson):
+        from aurarouter import ipc
+
+        if use_orjson and ipc.orjson is None:
+            pytest.skip("orjson not installed")
+        msg = {"id": 1, "result": {"text": "héllo ✓", 3: [1.5, None]}}
+        with patch.object(ipc, "orjson", ipc.orjson if use_orjson else None):
+            line = ipc._encode_line(msg)
+            assert isinstance(line, bytes)
+            assert line.endswith(b"\n") and line.count(b"\n") == 1
+            decoded = ipc._decode_line(line + b"\r\n")
+            assert ipc._decode_line(memoryview(bytearray(line))) == decoded
+        assert decoded == {"id": 1, "result": {"text": "héllo ✓", "3": [1.5, None]}}
+        assert json.loads(line) == decoded
+
+    def test_recv_line_into_stops_at_newline_across_chunks(self):
+        from aurarouter.ipc import _recv_line_into
+
+        stream = [b'{"a":', b" 1}", b"\n", b"never read"]
+
+        def recv_into(view):
+            chunk = stream.pop(0)
+            view[: len(chunk)] = chunk
+            return len(chunk)
+
+        sock = MagicMock()
+        sock.recv_into.side_effect = recv_into
+        buf = bytearray(64)
+        used = _recv_line_into(sock, buf)
+        assert buf[:used] == b'{"a": 1}\n'
+        assert stream == [b"never read"]
+
+    def test_recv_line_into_grows_buffer(self):
+        from aurarouter.ipc import _RECV_SIZE, _recv_line_into
+
+        payload = b"y" * (_RECV_SIZE + 10) + b"\n"
+        stream = [payload[:_RECV_SIZE], payload[_RECV_SIZE:]]
+
+        def recv_into(view):
+            chunk = stream.pop(0)
+            view[: len(chunk)] = chunk
+            return len(chunk)
+
+        sock = MagicMock()
+        sock.recv_into.side_effect = recv_into
+        buf = bytearray(_RECV_SIZE)
+        used = _recv_line_into(sock, buf)
+        assert used == len(payload)
+        assert buf[:used] == payload
+
+    def test_server_reuses_receive_buffers(self):
+        server = _start_server_on_free_port({"echo": lambda msg="": msg})
+        try:
+            client = _make_client(server)
+            for _ in range(3):
+                assert client.call("echo", params={"msg": "hi"}) == "hi"
+            assert server._bufpool.qsize() == 1
+
+            assert client.call("echo", params={"msg": "z" * (1 << 17)}) == "z" * (1 << 17)
+            assert server._bufpool.qsize() <= 1
+        finally:
+            server.stop()
+
+    def test_large_payload_roundtrip(self):
+        blob = "x" * (1 << 20)
+        server = _start_server_on_free_port({"echo": lambda msg="": msg})
+        try:
+            assert _make_client(server).call("echo", params={"msg": blob}) == blob
+        finally:
+            server.stop()
+
+
 class TestIPCServerErrors:
     """Task 1.1.2–1.1.3 — Error codes."""
 
@@ -184,6 +266,78 @@ class TestIPCServerLifecycle:
         assert server._thread is first_thread
         server.stop()
 
+    def test_connections_handled_on_bounded_pool(self):
+        server = IPCServer(port=0)
+        server.register("whoami", lambda: threading.current_thread().name)
+        try:
+            server.start(wait_ready=True, timeout=5.0)
+            pool = server._pool
+            assert pool is not None
+            assert pool._max_workers == 16
+            client = IPCClient(port=server.port)
+            assert client.call("whoami").startswith("AuraRouter-IPC-W")
+        finally:
+            server.stop()
+        assert server._pool is None
+        assert pool._shutdown
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix socket path")
+    def test_stop_closes_queued_connections(self):
+        started, release = threading.Event(), threading.Event()
+        server = IPCServer(port=0)
+
+        def block():
+            started.set()
+            return release.wait(5) and "done"
+
+        server.register("block", block)
+        with patch("aurarouter.ipc._MAX_WORKERS", 1):
+            server.start(wait_ready=True, timeout=5.0)
+        busy = threading.Thread(
+            target=lambda: IPCClient(port=server.port).call("block"), daemon=True,
+        )
+        busy.start()
+        assert started.wait(5)  # the only worker is now occupied
+        queued = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            queued.settimeout(2.0)
+            queued.connect(server._address)
+            queued.sendall(b'{"method": "block", "id": 2}\n')
+            deadline = time.monotonic() + 2
+            while server._pool._work_queue.qsize() < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            gc.collect()  # flush sockets leaked by earlier tests
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                server.stop()
+                gc.collect()
+            # Closed explicitly, not left for the garbage collector.
+            leaked = [
+                w for w in caught
+                if issubclass(w.category, ResourceWarning)
+                and f"laddr={server._address}" in str(w.message)
+            ]
+            assert not leaked
+            # Closed with the request unread: EOF or a reset, never a hang.
+            try:
+                assert queued.recv(16) == b""
+            except ConnectionResetError:
+                pass
+        finally:
+            release.set()
+            queued.close()
+            busy.join(timeout=5)
+
+    def test_stop_wakes_idle_accept_loop_immediately(self):
+        server = IPCServer(port=0)
+        server.start(wait_ready=True, timeout=5.0)
+        thread = server._thread
+        t0 = time.monotonic()
+        server.stop()
+        assert not thread.is_alive()
+        assert time.monotonic() - t0 < 0.5
+        assert server._wakeup is None
+
 
 class TestIPCServerReadySignal:
     """Task 6.3 — Ready event signaling."""
@@ -265,6 +419,43 @@ class TestIPCServerPlatformDispatch:
         server._serve_win32.assert_not_called()
 
 
+class TestTcpNoDelay:
+    """TCP loopback sockets disable Nagle on both ends."""
+
+    def test_win32_accepted_connections_set_nodelay(self, tmp_path):
+        seen = []
+        server = IPCServer(port=0)
+        server._pool = MagicMock()
+        server._pool.submit.side_effect = lambda fn, conn: (
+            seen.append(conn.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)),
+            conn.close(),
+            server._wake(),
+        )
+        server._wakeup = socket.socketpair()
+        server._running = True
+        with patch("aurarouter.ipc._IPC_DIR", tmp_path):
+            t = threading.Thread(target=server._serve_win32, daemon=True)
+            t.start()
+            assert server._ready_event.wait(5.0)
+            socket.create_connection(("127.0.0.1", server.port)).close()
+            t.join(timeout=5.0)
+        assert not t.is_alive()
+        assert seen and seen[0] != 0
+
+    def test_win32_client_socket_sets_nodelay(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            client = IPCClient(port=listener.getsockname()[1])
+            with patch("aurarouter.ipc.sys") as mock_sys:
+                mock_sys.platform = "win32"
+                sock = client._connect(timeout=2.0)
+            try:
+                assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+            finally:
+                sock.close()
+
+
 # ---------------------------------------------------------------------------
 # IPCClient tests (Task 1.2)
 # ---------------------------------------------------------------------------
@@ -295,6 +486,21 @@ class TestIPCClientPing:
         finally:
             server.stop()
 
+    def test_ping_sends_preencoded_health_request(self):
+        from aurarouter.ipc import _PARAMLESS_REQUESTS
+
+        reply = b'{"id": 1, "result": {"status": "ok"}}\n'
+        sock = MagicMock()
+        sock.recv_into.side_effect = lambda view: (
+            view.__setitem__(slice(0, len(reply)), reply) or len(reply)
+        )
+        client = IPCClient.__new__(IPCClient)
+        client._connect = lambda timeout: sock
+        assert client.ping() is True
+        sent = sock.sendall.call_args[0][0]
+        assert sent is _PARAMLESS_REQUESTS["health"]
+        assert json.loads(sent) == {"method": "health", "id": 1}
+
     def test_ping_unreachable(self):
         client = IPCClient.__new__(IPCClient)
         client._address = ("127.0.0.1", 1)  # Not listening
@@ -367,3 +573,23 @@ class TestIPCClientPortFileDiscovery:
                 with pytest.raises(ConnectionError):
                     # Will fail to connect but should read port 54321
                     client.call("test")
+
+    def test_port_file_reread_only_when_rewritten(self, tmp_path):
+        import os
+
+        from aurarouter.ipc import _discover_port, _port_from_file
+
+        port_file = tmp_path / "aurarouter.port"
+        with patch("aurarouter.ipc._IPC_DIR", tmp_path):
+            assert _discover_port() == 19470  # no file yet
+
+            port_file.write_text("50001", encoding="utf-8")
+            os.utime(port_file, ns=(1_000_000_000, 1_000_000_000))
+            _port_from_file.cache_clear()
+            assert _discover_port() == 50001
+            assert _discover_port() == 50001
+            assert _port_from_file.cache_info().hits == 1
+
+            port_file.write_text("50002", encoding="utf-8")
+            os.utime(port_file, ns=(2_000_000_000, 2_000_000_000))
+            assert _discover_port() == 50002
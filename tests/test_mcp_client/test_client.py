@@ -4,7 +4,7 @@ import json
 
 import httpx
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aurarouter.mcp_client.client import GridMcpClient
 
@@ -88,10 +88,12 @@ class TestGridMcpClientConnect:
             assert len(calls) == 1
             url, kw = calls[0]
             assert url == "http://host:8080/mcp/message"
-            body = kw["json"]
+            assert kw["headers"]["Content-Type"] == "application/json"
+            body = json.loads(kw["content"])
             assert body["jsonrpc"] == "2.0"
             assert body["method"] == "tools/list"
             assert "id" in body
+            assert "params" not in body
 
     def test_connect_derives_capabilities_from_tool_names(self):
         """Capabilities are the set of discovered tool names."""
@@ -129,10 +131,9 @@ class TestGridMcpClientConnect:
     def test_connect_failure_is_graceful(self):
         """Top-level connection failure returns False, does not raise."""
         with patch("aurarouter.mcp_client.client.httpx.Client") as mock_cls:
-            mock_cls.return_value.__enter__ = MagicMock(
-                side_effect=Exception("Connection refused")
+            mock_cls.return_value.post.side_effect = httpx.ConnectError(
+                "Connection refused"
             )
-            mock_cls.return_value.__exit__ = MagicMock(return_value=False)
 
             c = GridMcpClient("http://unreachable:8080")
             assert c.connect() is False
@@ -278,3 +279,148 @@ class TestDiscoverModels:
             c = GridMcpClient("http://host:8080")
             c.connect()
             assert c.get_models() == []
+
+
+class TestCapabilities:
+    def test_capabilities_frozen_and_skip_nameless_tools(self):
+        resp = _jsonrpc_response(result={"tools": [{"name": "a"}, {"description": "x"}]})
+
+        with patch("aurarouter.mcp_client.client.httpx.Client") as mock_cls:
+            mock_cls.return_value = _mock_httpx_client(lambda url, **kw: resp)
+
+            c = GridMcpClient("http://host:8080")
+            assert isinstance(c.get_capabilities(), frozenset)
+            c.connect()
+            assert c.get_capabilities() == frozenset({"a"})
+
+
+class TestNullError:
+    def test_null_error_member_is_not_a_failure(self):
+        resp = MagicMock()
+        resp.json.return_value = {"jsonrpc": "2.0", "id": 1, "error": None, "result": 7}
+
+        with patch("aurarouter.mcp_client.client.httpx.Client") as mock_cls:
+            mock_cls.return_value = _mock_httpx_client(lambda url, **kw: resp)
+
+            c = GridMcpClient("http://host:8080")
+            c._connected = True
+            assert c.call_tool("t") == 7
+
+
+class TestJsonRpcIds:
+    def test_request_ids_increment_per_client(self):
+        a = GridMcpClient("http://a")
+        b = GridMcpClient("http://b")
+        ids = [a._jsonrpc_request("tools/list")["id"] for _ in range(3)]
+        assert ids == [1, 2, 3]
+        assert b._jsonrpc_request("tools/list")["id"] == 1
+
+    def test_params_omitted_when_empty(self):
+        c = GridMcpClient("http://a")
+        assert "params" not in c._jsonrpc_request("ping")
+        assert "params" not in c._jsonrpc_request("ping", {})
+        assert c._jsonrpc_request("x", {"k": 1})["params"] == {"k": 1}
+
+
+class TestGridMcpClientPooling:
+    def test_http_client_reused_across_calls(self):
+        """connect() and call_tool() share one persistent httpx.Client."""
+        resp = _jsonrpc_response(result={"tools": [{"name": "t"}]})
+
+        with patch("aurarouter.mcp_client.client.httpx.Client") as mock_cls:
+            mock_cls.return_value = _mock_httpx_client(MagicMock(return_value=resp))
+
+            c = GridMcpClient("http://host:8080")
+            assert mock_cls.call_count == 0  # created lazily
+            c.connect()
+            c.call_tool("t")
+            c.call_tool("t")
+
+            assert mock_cls.call_count == 1
+            assert mock_cls.return_value.post.call_count == 3
+            assert "limits" in mock_cls.call_args.kwargs
+
+    @pytest.mark.parametrize("h2_module", [None, object()])
+    def test_http2_enabled_only_with_h2_installed(self, h2_module):
+        with patch("aurarouter.mcp_client.client.h2", h2_module), \
+                patch("aurarouter.mcp_client.client.httpx.Client") as mock_cls, \
+                patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_acls:
+            c = GridMcpClient("http://host:8080")
+            c._client()
+            c._aclient()
+        expected = h2_module is not None
+        assert mock_cls.call_args.kwargs["http2"] is expected
+        assert mock_acls.call_args.kwargs["http2"] is expected
+
+    def test_close_releases_and_reopens(self):
+        resp = _jsonrpc_response(result={"tools": []})
+
+        with patch("aurarouter.mcp_client.client.httpx.Client") as mock_cls:
+            mock_cls.return_value = _mock_httpx_client(MagicMock(return_value=resp))
+
+            c = GridMcpClient("http://host:8080")
+            c.close()  # no-op before first use
+            c.connect()
+            c.close()
+            c.close()
+            mock_cls.return_value.close.assert_called_once()
+
+            c.connect()
+            assert mock_cls.call_count == 2
+
+    def test_context_manager_closes(self):
+        resp = _jsonrpc_response(result={"tools": []})
+
+        with patch("aurarouter.mcp_client.client.httpx.Client") as mock_cls:
+            mock_cls.return_value = _mock_httpx_client(MagicMock(return_value=resp))
+
+            with GridMcpClient("http://host:8080") as c:
+                assert c.connect() is True
+            mock_cls.return_value.close.assert_called_once()
+
+
+class TestGridMcpClientAsync:
+    async def test_aconnect_and_acall_tool(self):
+        list_resp = _jsonrpc_response(result={"tools": [{"name": "echo"}]})
+        call_resp = _jsonrpc_response(result={"echo": "hi"})
+
+        with patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.post = AsyncMock(side_effect=[list_resp, call_resp])
+            mock_cls.return_value.aclose = AsyncMock()
+
+            c = GridMcpClient("http://host:8080")
+            assert await c.aconnect() is True
+            assert c.get_capabilities() == {"echo"}
+            assert await c.acall_tool("echo", text="hi") == {"echo": "hi"}
+
+            body = mock_cls.return_value.post.call_args.kwargs["json"]
+            assert body["method"] == "tools/call"
+            assert body["params"] == {"name": "echo", "arguments": {"text": "hi"}}
+            assert mock_cls.call_count == 1
+
+            await c.aclose()
+            await c.aclose()
+            mock_cls.return_value.aclose.assert_awaited_once()
+
+    async def test_aconnect_failure_is_graceful(self):
+        with patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.post = AsyncMock(
+                side_effect=httpx.ConnectError("Connection refused")
+            )
+
+            c = GridMcpClient("http://unreachable:8080")
+            assert await c.aconnect() is False
+            assert c.connected is False
+
+    async def test_acall_tool_error_raises(self):
+        resp = _jsonrpc_response(error={"code": -32601, "message": "nope"})
+
+        with patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.post = AsyncMock(return_value=resp)
+
+            c = GridMcpClient("http://host:8080")
+            with pytest.raises(ConnectionError):
+                await c.acall_tool("x")
+            c._connected = True
+            with pytest.raises(RuntimeError, match="nope"):
+                await c.acall_tool("x")
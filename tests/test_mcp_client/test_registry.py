@@ -1,6 +1,8 @@
 """Tests for McpClientRegistry."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 
 from aurarouter.config import ConfigLoader
 from aurarouter.mcp_client.client import GridMcpClient
@@ -17,9 +19,11 @@ class TestRegistration:
 
     def test_unregister_existing(self):
         reg = McpClientRegistry()
-        reg.register("svc1", MagicMock(spec=GridMcpClient))
+        client = MagicMock(spec=GridMcpClient)
+        reg.register("svc1", client)
         assert reg.unregister("svc1") is True
         assert "svc1" not in reg.get_clients()
+        client.close.assert_called_once()
 
     def test_unregister_nonexistent(self):
         reg = McpClientRegistry()
@@ -33,6 +37,138 @@ class TestRegistration:
         assert "b" not in reg.get_clients()  # original unchanged
 
 
+class TestSnapshot:
+    def test_readers_see_stable_snapshot_during_mutation(self):
+        reg = McpClientRegistry()
+        a = MagicMock(spec=GridMcpClient)
+        reg.register("a", a)
+        before = reg._entries
+        reg.register("b", MagicMock(spec=GridMcpClient))
+        assert before == (("a", a),)  # published tuples are never mutated
+        assert [n for n, _ in reg._entries] == ["a", "b"]
+        reg.unregister("a")
+        assert [n for n, _ in reg._entries] == ["b"]
+
+    def test_concurrent_register_and_lookup(self):
+        import threading
+
+        reg = McpClientRegistry()
+        client = MagicMock(spec=GridMcpClient)
+        client.connected = True
+        client.get_capabilities.return_value = {"search"}
+        errors = []
+
+        def writer():
+            for i in range(500):
+                reg.register(f"c{i}", client)
+                reg.unregister(f"c{i - 1}")
+
+        def reader():
+            try:
+                for _ in range(2000):
+                    reg.get_clients_with_capability("search")
+            except Exception as exc:  # pragma: no cover - failure path
+                errors.append(exc)
+
+        threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert list(reg.get_clients()) == ["c499"]
+
+
+class TestRefresh:
+    def _client(self, aconnect):
+        client = MagicMock(spec=GridMcpClient)
+        client.aconnect = AsyncMock(**aconnect)
+        client.aclose = AsyncMock()
+        return client
+
+    async def test_arefresh_all_reports_per_client(self):
+        reg = McpClientRegistry()
+        reg.register("up", self._client({"return_value": True}))
+        reg.register("down", self._client({"return_value": False}))
+        reg.register("boom", self._client({"side_effect": OSError("x")}))
+        assert await reg.arefresh_all() == {"up": True, "down": False, "boom": False}
+
+    async def test_aget_all_remote_tools_refreshes_first(self):
+        reg = McpClientRegistry()
+        client = self._client({"return_value": True})
+        client.connected = True
+        client.get_tools.return_value = [{"name": "t"}]
+        reg.register("svc", client)
+        tools = await reg.aget_all_remote_tools()
+        client.aconnect.assert_awaited_once()
+        assert tools == [{"name": "t", "_source_client": "svc"}]
+
+    def test_refresh_all_sync_closes_async_pools(self):
+        reg = McpClientRegistry()
+        client = self._client({"return_value": True})
+        reg.register("svc", client)
+        assert reg.refresh_all() == {"svc": True}
+        client.aclose.assert_awaited_once()
+
+
+def _http_response(body):
+    resp = MagicMock()
+    resp.json.return_value = body
+    return resp
+
+
+class TestBatchedRefresh:
+    async def test_shared_base_url_uses_one_batch_post(self):
+        replies = [
+            {"jsonrpc": "2.0", "id": 1, "result": {"tools": [{"name": "b"}]}},
+            {"jsonrpc": "2.0", "id": 0, "result": {"tools": [{"name": "a"}]}},
+        ]
+        with patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.post = AsyncMock(return_value=_http_response(replies))
+            reg = McpClientRegistry()
+            reg.register("ctx-a", GridMcpClient("http://host:8080", name="ctx-a"))
+            reg.register("ctx-b", GridMcpClient("http://host:8080/", name="ctx-b"))
+
+            assert await reg.arefresh_all() == {"ctx-a": True, "ctx-b": True}
+
+            post = mock_cls.return_value.post
+            post.assert_awaited_once()
+            batch = post.call_args.kwargs["json"]
+            assert [r["id"] for r in batch] == [0, 1]
+            assert {r["method"] for r in batch} == {"tools/list"}
+            clients = reg.get_clients()
+            assert clients["ctx-a"].get_capabilities() == {"a"}
+            assert clients["ctx-b"].get_capabilities() == {"b"}
+
+    async def test_missing_reply_marks_client_disconnected(self):
+        replies = [{"jsonrpc": "2.0", "id": 0, "result": {"tools": []}}]
+        with patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.post = AsyncMock(return_value=_http_response(replies))
+            a = GridMcpClient("http://host:8080")
+            b = GridMcpClient("http://host:8080")
+            assert await GridMcpClient.aconnect_batch([a, b]) == [True, False]
+            assert b.connected is False
+
+    async def test_falls_back_when_batches_unsupported(self):
+        single = _http_response({"jsonrpc": "2.0", "id": "x", "result": {"tools": [{"name": "t"}]}})
+        rejected = _http_response({"jsonrpc": "2.0", "id": None, "error": {"code": -32600}})
+        with patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.post = AsyncMock(side_effect=[rejected, single, single])
+            a = GridMcpClient("http://host:8080")
+            b = GridMcpClient("http://host:8080")
+            assert await GridMcpClient.aconnect_batch([a, b]) == [True, True]
+            assert mock_cls.return_value.post.await_count == 3
+
+    async def test_http_error_falls_back(self):
+        with patch("aurarouter.mcp_client.client.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value.post = AsyncMock(
+                side_effect=httpx.ConnectError("refused")
+            )
+            a = GridMcpClient("http://host:8080")
+            b = GridMcpClient("http://host:8080")
+            assert await GridMcpClient.aconnect_batch([a, b]) == [False, False]
+
+
 class TestCapabilityLookup:
     def test_get_clients_with_capability(self):
         reg = McpClientRegistry()
@@ -111,6 +247,44 @@ class TestRemoteTools:
 
         assert reg.get_all_remote_tools() == []
 
+    def test_source_client_from_tool_is_kept(self):
+        reg = McpClientRegistry()
+        c = MagicMock(spec=GridMcpClient)
+        c.connected = True
+        c.get_tools.return_value = [{"name": "t", "_source_client": "origin"}]
+        reg.register("proxy", c)
+        assert reg.get_all_remote_tools()[0]["_source_client"] == "origin"
+
+    def test_aggregate_cached_within_ttl(self):
+        reg = McpClientRegistry()
+        c = MagicMock(spec=GridMcpClient)
+        c.connected = True
+        c.get_tools.return_value = [{"name": "t"}]
+        reg.register("svc", c)
+
+        with patch("aurarouter.mcp_client.registry.time.monotonic", return_value=100.0):
+            first = reg.get_all_remote_tools()
+            first.append({"name": "caller-owned"})
+            assert reg.get_all_remote_tools() == [{"_source_client": "svc", "name": "t"}]
+        assert c.get_tools.call_count == 1
+
+        with patch("aurarouter.mcp_client.registry.time.monotonic", return_value=105.0):
+            reg.get_all_remote_tools()
+        assert c.get_tools.call_count == 2
+
+    def test_register_and_unregister_invalidate_cache(self):
+        reg = McpClientRegistry()
+        c = MagicMock(spec=GridMcpClient)
+        c.connected = True
+        c.get_tools.return_value = [{"name": "t"}]
+        reg.register("a", c)
+        assert len(reg.get_all_remote_tools()) == 1
+
+        reg.register("b", c)
+        assert len(reg.get_all_remote_tools()) == 2
+        reg.unregister("a")
+        assert len(reg.get_all_remote_tools()) == 1
+
 
 class TestSyncModels:
     def test_sync_adds_models(self):
@@ -158,6 +332,23 @@ class TestSyncModels:
         assert reg.sync_models(config) == 1
         assert reg.sync_models(config) == 0  # already present
 
+    def test_sync_dedupes_within_one_pass_without_config_lookups(self):
+        config = ConfigLoader(allow_missing=True)
+        config.config = {"models": {"svc/existing": {"provider": "x"}}, "roles": {}}
+
+        reg = McpClientRegistry()
+        client = MagicMock(spec=GridMcpClient)
+        client.connected = True
+        client.base_url = "http://host:8080"
+        client.get_models.return_value = [
+            {"id": "existing"}, {"id": "new"}, {"id": "new"},
+        ]
+        reg.register("svc", client)
+
+        with patch.object(config, "get_model_config", side_effect=AssertionError):
+            assert reg.sync_models(config) == 1
+        assert config.get_model_config("svc/existing") == {"provider": "x"}
+
     def test_sync_skips_disconnected(self):
         config = ConfigLoader(allow_missing=True)
         config.config = {"models": {}, "roles": {}}
@@ -1,20 +1,27 @@
 """Tests for MCP tool implementations (mcp_tools.py)."""
 
+import datetime
 import json
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from aurarouter.config import ConfigLoader
 from aurarouter.fabric import ComputeFabric
 from aurarouter.mcp_tools import (
+    _json_dumps,
     compare_models,
     generate_code,
+    iter_compare_models,
     list_assets,
+    list_models,
     local_inference,
     register_asset,
     register_remote_asset,
     route_task,
     unregister_asset,
 )
+from aurarouter.response_cache import ResponseCache
 from aurarouter.savings.models import GenerateResult
 
 
@@ -60,6 +67,15 @@ class TestRouteTask:
             assert "Step 1" in result
             assert "Step 2" in result
 
+    def test_low_complexity_skips_planning(self):
+        fabric = _make_fabric()
+        with patch.object(fabric, "execute", side_effect=[
+            GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING", "complexity": 2})),
+            GenerateResult(text="direct answer"),
+        ]) as mock:
+            assert route_task(fabric, None, task="small but odd") == "direct answer"
+        assert [c.args[0] for c in mock.call_args_list] == ["router", "coding"]
+
     def test_all_models_fail(self):
         fabric = _make_fabric()
         with patch.object(fabric, "execute", side_effect=[
@@ -69,6 +85,339 @@ class TestRouteTask:
             result = route_task(fabric, None, task="test")
             assert "Error" in result
 
+    def test_simple_intent_served_from_cache(self):
+        fabric = _make_fabric()
+        cache = ResponseCache()
+        triage = GenerateResult(text=json.dumps({"intent": "SIMPLE_CODE", "complexity": 3}))
+        with patch.object(fabric, "execute", side_effect=[
+            triage, GenerateResult(text="first"),
+        ]) as mock:
+            assert route_task(fabric, None, task="hello", cache=cache) == "first"
+            assert route_task(fabric, None, task="hello", cache=cache) == "first"
+        assert mock.call_count == 2  # triage and answer both cached
+
+    def test_cache_skipped_for_structured_format(self):
+        fabric = _make_fabric()
+        cache = ResponseCache()
+        triage = GenerateResult(text=json.dumps({"intent": "SIMPLE_CODE"}))
+        with patch.object(fabric, "execute", side_effect=[
+            triage, GenerateResult(text="{}"),
+        ]):
+            route_task(fabric, None, task="t", format="json", cache=cache)
+        assert len(cache) == 0
+
+    def test_failures_not_cached(self):
+        fabric = _make_fabric()
+        cache = ResponseCache()
+        with patch.object(fabric, "execute", side_effect=[
+            GenerateResult(text=json.dumps({"intent": "SIMPLE_CODE"})), None,
+        ]):
+            assert "Error" in route_task(fabric, None, task="t", cache=cache)
+        assert len(cache) == 0
+
+    def test_plan_previous_output_unchanged_for_sequential_steps(self):
+        fabric = _make_fabric()
+        prompts = []
+
+        def fake_execute(role, prompt, **kw):
+            prompts.append(prompt)
+            if len(prompts) == 1:
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if len(prompts) == 2:
+                return GenerateResult(text=json.dumps(["s1", "s2"]))
+            return GenerateResult(text=f"out{len(prompts)}")
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            route_task(fabric, None, task="t")
+        assert "PREVIOUS_OUTPUT: []" in prompts[2]
+        assert "PREVIOUS_OUTPUT: ['\\n# --- Step 1: s1 ---\\nout3']" in prompts[3]
+
+    def test_sequential_plan_prompt_size_is_bounded(self):
+        fabric = _make_fabric()
+        prompts = []
+
+        def fake_execute(role, prompt, **kw):
+            prompts.append(prompt)
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(["s1", "s2", "s3", "s4"]))
+            return GenerateResult(text=f"out-{prompt.rsplit(' ', 1)[-1]}")
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, None, task="t")
+
+        last = prompts[-1]
+        assert "out-s2" in last and "out-s3" in last
+        assert "out-s1" not in last
+        assert all(f"Step {i}: s{i}" in result for i in range(1, 5))
+
+    def test_task_prompt_layout(self):
+        from aurarouter.mcp_tools import _task_prompt
+
+        assert _task_prompt("t") == "TASK: t"
+        assert _task_prompt("t", "c", "json", respond_only=True) == (
+            "TASK: t\nCONTEXT: c\nFORMAT: json\nRESPOND WITH OUTPUT ONLY."
+        )
+
+    def test_plan_step_prompt_extends_batch_prefix(self):
+        from aurarouter.mcp_tools import _route_plan_prompts
+
+        step_prompt, batch_prefix = _route_plan_prompts("ctx", "text")
+        prefix = batch_prefix(["p"])
+        assert prefix == "Return ONLY the requested output.\nCONTEXT: ctx\nPREVIOUS_OUTPUT: ['p']"
+        assert step_prompt("g", ["p"]) == prefix + "\nGOAL: g"
+
+    def test_independent_plan_steps_run_concurrently(self):
+        import threading
+
+        fabric = _make_fabric()
+        plan = [
+            {"step": "a", "depends_on": []},
+            {"step": "b", "depends_on": []},
+            {"step": "c", "depends_on": [1, 2]},
+        ]
+        barrier = threading.Barrier(2, timeout=5)
+        prompts = []
+
+        def fake_execute(role, prompt, **kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(plan))
+            goal = prompt.rsplit("\n", 1)[-1]
+            if goal in ("GOAL: a", "GOAL: b"):
+                barrier.wait()  # deadlocks unless a and b overlap
+            prompts.append(prompt)
+            return GenerateResult(text=goal.lower())
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, None, task="t")
+
+        assert result.index("Step 1: a") < result.index("Step 2: b") < result.index("Step 3: c")
+        last = prompts[-1]
+        assert last.endswith("GOAL: c")
+        assert "goal: a" in last and "goal: b" in last
+
+    def test_plan_steps_unbatched_by_default(self):
+        fabric = _make_fabric()
+        plan = [{"step": "a", "depends_on": []}, {"step": "b", "depends_on": []}]
+        calls = []
+
+        def fake_execute(role, prompt, **kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(plan))
+            calls.append(prompt)
+            return GenerateResult(text="out")
+
+        with patch.object(fabric, "execute", side_effect=fake_execute), \
+                patch.object(fabric, "execute_batch") as batch:
+            route_task(fabric, None, task="t")
+
+        batch.assert_not_called()
+        assert sorted(c.rsplit("GOAL: ", 1)[1] for c in calls) == ["a", "b"]
+
+    def test_independent_plan_steps_share_one_prompt(self):
+        fabric = _make_fabric()
+        fabric.config.config["execution"] = {"plan_batch_size": 8}
+        plan = [
+            {"step": "a", "depends_on": []},
+            {"step": "b", "depends_on": []},
+            {"step": "c", "depends_on": [1, 2]},
+        ]
+        calls = []
+
+        def fake_execute(role, prompt, **kw):
+            calls.append(prompt)
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(plan))
+            if "[1] a" in prompt:
+                return GenerateResult(text="[1]\nout a\n[2]\nout b")
+            return GenerateResult(text="out c")
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, None, task="t")
+
+        assert len(calls) == 4  # triage, plan, one batch for a+b, then c
+        assert calls[2].count("CONTEXT:") == 1
+        assert "Step 1: a ---\nout a" in result
+        assert "Step 2: b ---\nout b" in result
+        assert "out a" in calls[3] and "out b" in calls[3]
+
+    def test_unparseable_batch_falls_back_to_single_steps(self):
+        fabric = _make_fabric()
+        fabric.config.config["execution"] = {"plan_batch_size": 8}
+        plan = [{"step": "a", "depends_on": []}, {"step": "b", "depends_on": []}]
+
+        def fake_execute(role, prompt, **kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(plan))
+            if "[1] a" in prompt:
+                return GenerateResult(text="only one answer")
+            return GenerateResult(text=prompt.rsplit("\n", 1)[-1].lower())
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, None, task="t")
+
+        assert "Step 1: a ---\ngoal: a" in result
+        assert "Step 2: b ---\ngoal: b" in result
+
+    def test_similar_task_served_from_semantic_cache(self):
+        fabric = _make_fabric()
+        semantic = MagicMock()
+        semantic.lookup.return_value = None
+        with patch.object(fabric, "execute", side_effect=[
+            GenerateResult(text=json.dumps({"intent": "DIRECT", "complexity": 2})),
+            GenerateResult(text="answer"),
+        ]):
+            assert route_task(fabric, None, task="t", semantic_cache=semantic) == "answer"
+        semantic.store.assert_called_once_with("route_task", "t\n", "answer")
+
+        semantic.lookup.return_value = "cached"
+        with patch.object(fabric, "execute") as mock:
+            assert route_task(fabric, None, task="t2", semantic_cache=semantic) == "cached"
+        mock.assert_not_called()
+
+    def test_incomplete_plan_not_semantically_cached(self):
+        fabric = _make_fabric()
+        semantic = MagicMock()
+        semantic.lookup.return_value = None
+
+        def fake_execute(role, prompt, **kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(["s1", "s2"]))
+            return None
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, None, task="t", semantic_cache=semantic)
+        assert "Step 1 Failed." in result
+        semantic.store.assert_not_called()
+
+    def test_failed_correction_not_semantically_cached(self):
+        fabric = _make_fabric(roles={
+            "router": ["m1"], "reasoning": ["m1"], "coding": ["m1"], "reviewer": ["m1"],
+        })
+        fabric.config.config["execution"] = {"max_review_iterations": 2}
+        semantic = MagicMock()
+        semantic.lookup.return_value = None
+
+        def fake_execute(role, prompt, **kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "SIMPLE_CODE"}))
+            if role == "reviewer":
+                return GenerateResult(text=json.dumps(
+                    {"verdict": "FAIL", "feedback": "bad", "correction_hints": []}
+                ))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(["Fix a"]))
+            if "GOAL: Fix a" in prompt:
+                return None
+            return GenerateResult(text="draft")
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, None, task="t", semantic_cache=semantic)
+        assert "# Correction Step 1 Failed." in result
+        semantic.store.assert_not_called()
+
+    def _run_sequential_plan(self, fabric, coding_result, **kwargs):
+        calls = []
+
+        def fake_execute(role, prompt, **kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"}))
+            if role == "reasoning":
+                calls.append("PLAN")
+                return GenerateResult(text=json.dumps(["s1", "s2", "s3", "s4"]))
+            calls.append(prompt)
+            return coding_result(prompt)
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, None, task="t", **kwargs)
+        return result, [c for c in calls if c != "PLAN"]
+
+    def test_plan_stops_after_consecutive_failures(self):
+        fabric = _make_fabric()
+        result, calls = self._run_sequential_plan(fabric, lambda p: None)
+        assert len(calls) == 2
+        assert "Step 2 Failed." in result
+        assert "Step 3 Skipped: plan aborted after 2 consecutive failed steps." in result
+        assert "Step 4 Skipped" in result
+
+    def test_failed_step_retried_with_backoff(self):
+        fabric = _make_fabric()
+        fabric.config.config["execution"] = {"plan_step_retries": 2}
+        replies = iter([None, None, GenerateResult(text="ok")])
+
+        def coding_result(prompt):
+            return next(replies, GenerateResult(text="ok"))
+
+        with patch("aurarouter.mcp_tools.time.sleep") as sleep:
+            result, calls = self._run_sequential_plan(fabric, coding_result)
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+        assert len(calls) == 6
+        assert "Failed" not in result
+
+    def test_plan_stops_at_token_budget(self):
+        fabric = _make_fabric()
+        fabric.config.config["execution"] = {"plan_token_budget": 1}
+        result, calls = self._run_sequential_plan(
+            fabric, lambda p: GenerateResult(text="done"),
+        )
+        assert len(calls) == 1
+        assert "Step 2 Skipped: plan token budget of 1 reached." in result
+
+    def test_interrupted_plan_resumes_from_checkpoint(self, tmp_path):
+        fabric = _make_fabric()
+        path = tmp_path / "plan.jsonl"
+
+        def flaky(prompt):
+            return None if prompt.endswith("GOAL: s2") else GenerateResult(text="done")
+
+        first, _ = self._run_sequential_plan(fabric, flaky, checkpoint_path=path)
+        assert "Step 2 Failed." in first
+        assert path.exists()
+
+        with patch("aurarouter.mcp_tools.generate_plan") as planner:
+            second, calls = self._run_sequential_plan(
+                fabric, lambda p: GenerateResult(text="fixed"), checkpoint_path=path,
+            )
+        planner.assert_not_called()
+        # s1 is reused; s2 failed, and the later steps build on it.
+        assert [c.rsplit("GOAL: ", 1)[1] for c in calls] == ["s2", "s3", "s4"]
+        assert "Step 1: s1 ---\ndone" in second
+        assert "Step 4: s4 ---\nfixed" in second
+        assert not path.exists()
+
+    def test_checkpoints_off_by_default(self, tmp_path):
+        fabric = _make_fabric()
+        with patch("aurarouter.plan_checkpoint.PlanCheckpoint.DEFAULT_DIR", tmp_path):
+            self._run_sequential_plan(fabric, lambda p: None)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_triage_router_picks_execution_role(self):
+        fabric = _make_fabric()
+        triage = MagicMock()
+        triage.select_role.return_value = "coding"
+
+        def fake_execute(role, prompt, **kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "DIRECT", "complexity": 2}))
+            return GenerateResult(text=f"from {role}")
+
+        with patch.object(fabric, "execute", side_effect=fake_execute):
+            result = route_task(fabric, triage, task="t")
+
+        triage.select_role.assert_called_once_with(2)
+        assert result == "from coding"
+
 
 # ------------------------------------------------------------------
 # local_inference
@@ -97,6 +446,15 @@ class TestLocalInference:
         assert "Error" in result
         assert "local" in result.lower()
 
+    def test_cached_separately_from_other_tools(self):
+        fabric = _make_fabric()
+        cache = ResponseCache()
+        cache.store("coding", "p", "cloud answer")
+        with patch.object(fabric, "execute", return_value=GenerateResult(text="local")) as mock:
+            assert local_inference(fabric, prompt="p", cache=cache) == "local"
+            assert local_inference(fabric, prompt="p", cache=cache) == "local"
+        mock.assert_called_once()
+
     def test_includes_context(self):
         fabric = _make_fabric()
         with patch.object(fabric, "execute") as mock:
@@ -105,6 +463,20 @@ class TestLocalInference:
             prompt_sent = mock.call_args.args[1]
             assert "extra context" in prompt_sent
 
+    def test_reuses_route_task_answer_only_when_enabled(self):
+        from aurarouter.semantic_cache import SemanticCache
+
+        fabric = _make_fabric()
+        semantic = SemanticCache(lambda text: [1.0, float(len(text.split()))])
+        semantic.store("route_task", "explain x\n", "routed answer")
+        with patch.object(fabric, "execute", return_value=GenerateResult(text="local")) as mock:
+            assert local_inference(fabric, prompt="explain x", semantic_cache=semantic) == "local"
+            assert local_inference(
+                fabric, prompt="explain x", semantic_cache=semantic,
+                reuse_routed_answers=True,
+            ) == "routed answer"
+        mock.assert_called_once()
+
 
 # ------------------------------------------------------------------
 # generate_code
@@ -139,6 +511,24 @@ class TestGenerateCode:
             assert "Step 1" in result
             assert "Step 2" in result
 
+    def test_step_prompts_share_stable_prefix(self):
+        fabric = _make_fabric()
+        with patch.object(fabric, "execute", side_effect=[
+            GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING"})),
+            GenerateResult(text=json.dumps(["create module", "add tests"])),
+            GenerateResult(text="# module code"),
+            GenerateResult(text="# test code"),
+        ]) as mock:
+            generate_code(
+                fabric, None,
+                task_description="t", file_context="big file", language="go",
+            )
+        first, second = (c.args[1] for c in mock.call_args_list[2:])
+        prefix = "Return ONLY valid code.\nLANG: go\nCONTEXT: big file\nPREVIOUS_CODE: ["
+        assert first.startswith(prefix) and second.startswith(prefix)
+        assert first.endswith("GOAL: create module")
+        assert second.endswith("GOAL: add tests")
+
 
 # ------------------------------------------------------------------
 # compare_models
@@ -174,6 +564,92 @@ class TestCompareModels:
             call_kwargs = mock.call_args
             assert call_kwargs.kwargs.get("model_ids") == ["m1", "m2"]
 
+    def test_output_layout(self):
+        fabric = _make_fabric()
+        with patch.object(fabric, "execute_all", return_value=[
+            {"model_id": "m1", "provider": "ollama", "success": True,
+             "text": "r1", "elapsed_s": 1.0, "input_tokens": 1, "output_tokens": 2},
+            {"model_id": "m2", "provider": "google", "success": False,
+             "text": "ERROR: x", "elapsed_s": 0.5, "input_tokens": 0, "output_tokens": 0},
+        ]):
+            result = compare_models(fabric, prompt="test")
+        assert result == (
+            "=== m1 (ollama) [SUCCESS] (1.0s, 1in/2out) ===\nr1\n\n"
+            "=== m2 (google) [FAILED] (0.5s, 0in/0out) ===\nERROR: x\n"
+        )
+
+    def test_iter_yields_blocks_as_models_finish(self):
+        fabric = _make_fabric()
+        results = [
+            {"model_id": "m2", "provider": "google", "success": True,
+             "text": "fast", "elapsed_s": 0.1, "input_tokens": 1, "output_tokens": 1},
+            {"model_id": "m1", "provider": "ollama", "success": True,
+             "text": "slow", "elapsed_s": 2.0, "input_tokens": 1, "output_tokens": 1},
+        ]
+        with patch.object(fabric, "iter_all", return_value=iter(results)) as mock:
+            blocks = list(iter_compare_models(fabric, prompt="p", models="m1,m2"))
+        assert [b.split("\n")[1] for b in blocks] == ["fast", "slow"]
+        assert mock.call_args.kwargs["model_ids"] == ["m1", "m2"]
+
+    def test_passes_max_concurrency(self):
+        fabric = _make_fabric()
+        with patch.object(fabric, "execute_all", return_value=[]) as mock:
+            compare_models(fabric, prompt="test", max_concurrency=3)
+            assert mock.call_args.kwargs["max_concurrency"] == 3
+
+    def test_unknown_model_ids_dropped(self):
+        fabric = _make_fabric()
+        with patch.object(fabric, "execute_all", return_value=[]) as mock:
+            compare_models(fabric, prompt="test", models="m1, nope, m2")
+        assert mock.call_args.kwargs["model_ids"] == ["m1", "m2"]
+
+    def test_all_unknown_model_ids_skip_execution(self):
+        fabric = _make_fabric()
+        with patch.object(fabric, "execute_all") as mock_all, \
+                patch.object(fabric, "iter_all") as mock_iter:
+            result = compare_models(fabric, prompt="test", models="x, y")
+            blocks = list(iter_compare_models(fabric, prompt="test", models="x"))
+        assert result == "Error: None of the requested models are configured: x, y."
+        assert blocks == ["Error: None of the requested models are configured: x."]
+        mock_all.assert_not_called()
+        mock_iter.assert_not_called()
+
+
+# ------------------------------------------------------------------
+# list_models / JSON replies
+# ------------------------------------------------------------------
+
+class TestListModels:
+    def test_lists_every_model(self):
+        fabric = _make_fabric()
+        data = json.loads(list_models(fabric))
+        assert [m["model_id"] for m in data] == ["m1", "m2"]
+        assert data[0] == {
+            "model_id": "m1", "provider": "ollama", "endpoint": "http://x",
+            "model_name": "test", "tags": [],
+        }
+
+    def test_reply_is_indented(self):
+        assert list_models(_make_fabric()).startswith('[\n  {\n    "model_id"')
+
+    def test_json_dumps_falls_back_to_stdlib(self):
+        big = 2 ** 70
+        assert json.loads(_json_dumps({"n": big, 1: "é"})) == {"n": big, "1": "é"}
+
+    @pytest.mark.parametrize("value", ["café", 2 ** 70])
+    def test_json_dumps_matches_stdlib(self, value):
+        data = {"name": value, "items": [1, 2.5, None, True]}
+        assert _json_dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+    @pytest.mark.parametrize("value", [
+        datetime.date(2024, 1, 2),
+        datetime.datetime(2024, 1, 2, 3, 4),
+        GenerateResult(text="x"),
+    ])
+    def test_json_dumps_rejects_what_stdlib_rejects(self, value):
+        with pytest.raises(TypeError):
+            _json_dumps({"value": value})
+
 
 # ------------------------------------------------------------------
 # list_assets
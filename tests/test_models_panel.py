@@ -148,3 +148,29 @@ class TestGridSectionVisibility:
                 available = False
 
             assert available is False
+
+
+class TestDeferredRefresh:
+    """Refreshes requested while the panel is hidden run on next show."""
+
+    def test_refresh_deferred_until_shown(self):
+        from PySide6.QtWidgets import QApplication
+
+        from aurarouter.gui.models_panel import ModelsPanel
+
+        _app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+        api = MagicMock()
+        api.list_models.return_value = []
+        api.list_roles.return_value = []
+        api.list_catalog_artifacts.return_value = []
+
+        with patch.object(ModelsPanel, "_do_refresh_catalog"):
+            panel = ModelsPanel(api)
+            api.list_models.assert_not_called()
+            assert panel._dirty_models is True
+
+            panel.show()
+            api.list_models.assert_called_once()
+            assert panel._dirty_models is False
+            panel.hide()
+            panel.deleteLater()
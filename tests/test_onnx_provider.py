@@ -51,12 +51,18 @@ mock_np.argmax.side_effect = lambda x: x.data.index(max(x.data))
 mock_np.mean.side_effect = lambda x, axis=None: SimpleMockArray([sum(i)/len(i) for i in zip(*x.data)]) if axis==0 else sum(x.data)/len(x.data)
 
 # We must keep these in sys.modules for the whole test
+_real_numpy = sys.modules.get("numpy")
 sys.modules["onnxruntime"] = mock_ort
 sys.modules["numpy"] = mock_np
 sys.modules["tokenizers"] = mock_tokenizers
 
 from aurarouter.providers.onnx import ONNXProvider
 
+# The provider only needs the numpy mock at import time (and via the
+# fixture below); later test modules must get the real numpy.
+if _real_numpy is not None:
+    sys.modules["numpy"] = _real_numpy
+
 
 @pytest.fixture(autouse=True)
 def patch_onnx_deps():
@@ -174,3 +174,33 @@ class TestResourceStructure:
         pkg_root = pathlib.Path(__file__).parent.parent / "src" / "aurarouter"
         assert (pkg_root / "resources" / "onnx" / "tokenizer.json").exists()
         assert (pkg_root / "resources" / "onnx" / "metadata.py").exists()
+
+
+# ---------------------------------------------------------------------------
+# Embedding
+# ---------------------------------------------------------------------------
+
+
+class TestEmbed:
+    def test_embed_falls_back_to_token_type_ids(self, empty_registry: IntentRegistry) -> None:
+        """Exports that also require token_type_ids still embed."""
+        import numpy as np
+
+        def run(_outputs, feed):
+            if "token_type_ids" not in feed:
+                raise ValueError("missing token_type_ids")
+            return [np.ones((1, feed["input_ids"].shape[1], 4), dtype=np.float32)]
+
+        analyzer = ONNXVectorAnalyzer(intent_registry=empty_registry, model_path="/fake.onnx")
+        analyzer._session = MagicMock()
+        analyzer._session.run.side_effect = run
+        analyzer._loaded = True
+
+        vec = analyzer.embed("hello world")
+        assert vec is not None
+        assert abs(float(np.linalg.norm(vec)) - 1.0) < 1e-5
+
+    def test_embed_none_when_unavailable(self, empty_registry: IntentRegistry) -> None:
+        analyzer = ONNXVectorAnalyzer(intent_registry=empty_registry, model_path="/fake.onnx")
+        analyzer._loaded = True  # load attempted, no session
+        assert analyzer.embed("hello") is None
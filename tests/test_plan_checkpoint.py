@@ -0,0 +1,104 @@
+"""Tests for resumable plan checkpoints."""
+
+import os
+import time
+
+from aurarouter.plan_checkpoint import PlanCheckpoint
+from aurarouter.routing import PlanStep
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "c.jsonl"
+    cp = PlanCheckpoint(path)
+    assert cp.plan is None
+    steps = cp.start([PlanStep("a", []), PlanStep("b", [0])])
+    assert steps[1].depends_on == [0]
+    cp.record(0, "part a")
+
+    again = PlanCheckpoint(path)
+    assert [s.goal for s in again.plan] == ["a", "b"]
+    assert again.completed == {0: "part a"}
+
+
+def test_plain_string_plan_gets_sequential_dependencies(tmp_path):
+    cp = PlanCheckpoint(tmp_path / "c.jsonl")
+    steps = cp.start(["a", "b"])
+    assert steps[0].depends_on == []
+    assert steps[1].depends_on == [0]
+
+
+def test_torn_last_line_ignored(tmp_path):
+    path = tmp_path / "c.jsonl"
+    cp = PlanCheckpoint(path)
+    cp.start([PlanStep("a", []), PlanStep("b", [])])
+    cp.record(0, "part a")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"step": 1, "res')
+    assert PlanCheckpoint(path).completed == {0: "part a"}
+
+
+def test_steps_without_plan_ignored(tmp_path):
+    path = tmp_path / "c.jsonl"
+    path.write_text('{"step": 0, "result": "x"}\n', encoding="utf-8")
+    cp = PlanCheckpoint(path)
+    assert cp.plan is None
+    assert cp.completed == {}
+
+
+def test_discard_removes_file(tmp_path):
+    path = tmp_path / "c.jsonl"
+    cp = PlanCheckpoint(path)
+    cp.start(["a"])
+    cp.discard()
+    assert not path.exists()
+    assert cp.plan is None
+    cp.discard()  # already gone
+
+
+def test_for_task_keys_on_namespace_task_and_context(tmp_path):
+    a = PlanCheckpoint.for_task("route_task", "t", "ctx", directory=tmp_path)
+    assert a.path == PlanCheckpoint.for_task("route_task", "t", "ctx", directory=tmp_path).path
+    assert a.path.parent == tmp_path
+    assert len(a.path.stem) == 12
+    assert a.path != PlanCheckpoint.for_task("route_task", "t", "other", directory=tmp_path).path
+    assert a.path != PlanCheckpoint.for_task("generate_code:python", "t", "ctx", directory=tmp_path).path
+
+
+def test_later_plan_resets_completed_steps(tmp_path):
+    path = tmp_path / "c.jsonl"
+    cp = PlanCheckpoint(path)
+    cp.start(["a", "b"])
+    cp.record(0, "old a")
+    cp.start(["x", "y"])
+    cp.record(1, "new y")
+    again = PlanCheckpoint(path)
+    assert [s.goal for s in again.plan] == ["x", "y"]
+    assert again.completed == {1: "new y"}
+
+
+def _age(path, seconds):
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def test_stale_checkpoint_discarded_on_read(tmp_path):
+    path = tmp_path / "c.jsonl"
+    cp = PlanCheckpoint(path)
+    cp.start(["a"])
+    cp.record(0, "part a")
+    _age(path, PlanCheckpoint.MAX_AGE + 60)
+    again = PlanCheckpoint(path)
+    assert again.plan is None
+    assert again.completed == {}
+    assert not path.exists()
+
+
+def test_for_task_prunes_stale_checkpoints(tmp_path):
+    stale = PlanCheckpoint.for_task("route_task", "old", directory=tmp_path)
+    stale.start(["a"])
+    fresh = PlanCheckpoint.for_task("route_task", "new", directory=tmp_path)
+    fresh.start(["b"])
+    _age(stale.path, PlanCheckpoint.MAX_AGE + 60)
+    PlanCheckpoint.for_task("route_task", "other", directory=tmp_path)
+    assert not stale.path.exists()
+    assert fresh.path.exists()
@@ -1,6 +1,7 @@
 """Tests for the pricing catalog and cost engine."""
 
 import calendar
+import math
 from datetime import datetime, timezone
 from unittest.mock import patch
 
@@ -113,6 +114,19 @@ def test_shadow_cost():
     assert result["savings"] == pytest.approx(-actual_expected)
 
 
+def test_get_rates_per_token(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    engine = CostEngine(PricingCatalog(), store)
+    in_rate, out_rate = engine.get_rates("google", "gemini-2.5-pro")
+    assert math.isclose(in_rate, 1.25e-6)
+    assert math.isclose(out_rate, 10.0e-6)
+    assert engine.get_rates("ollama", "llama3") == (0.0, 0.0)
+    assert math.isclose(
+        engine.calculate_cost(2000, 1000, "gemini-2.5-pro", "google"),
+        2000 * in_rate + 1000 * out_rate,
+    )
+
+
 def test_total_spend(tmp_path):
     store = UsageStore(db_path=tmp_path / "usage.db")
     # Two local requests (free)
@@ -154,6 +168,53 @@ def test_spend_by_provider(tmp_path):
     assert breakdown["llamacpp-server"] == pytest.approx(0.0)
 
 
+def test_spend_grouped_matches_per_record(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    rows = [
+        ("gemini-2.0-flash", "google", 1000, 2000),
+        ("gemini-2.0-flash", "google", 3000, 500),
+        ("gemini-2.5-pro", "google", 700, 900),
+        ("claude", "anthropic", 1200, 800),
+    ]
+    for model, prov, inp, out in rows:
+        store.record(_make_record(
+            model_id=model, provider=prov, input_tokens=inp, output_tokens=out,
+        ))
+
+    engine = CostEngine(PricingCatalog(), store)
+    per_record = {}
+    for model, prov, inp, out in rows:
+        per_record[prov] = per_record.get(prov, 0.0) + engine.calculate_cost(inp, out, model, prov)
+
+    breakdown = engine.spend_by_provider()
+    assert breakdown.keys() == per_record.keys()
+    for prov, cost in per_record.items():
+        assert math.isclose(breakdown[prov], cost)
+    assert math.isclose(engine.total_spend(), sum(per_record.values()))
+
+
+def test_window_stats_single_query(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    store.record(_make_record(model_id="gemini-2.0-flash", provider="google", input_tokens=1000, output_tokens=2000))
+    store.record(_make_record(model_id="gemini-2.0-flash", provider="google", input_tokens=500, output_tokens=0))
+    store.record(_make_record(model_id="llama3", provider="ollama", input_tokens=10, output_tokens=20))
+    engine = CostEngine(PricingCatalog(), store)
+
+    calls = []
+    real = store.aggregate
+    store.aggregate = lambda *a, **kw: calls.append(a) or real(*a, **kw)
+    stats = engine.window_stats()
+    assert len(calls) == 1
+
+    assert stats["total_requests"] == 3
+    assert stats["input_tokens"] == 1510
+    assert stats["total_tokens"] == 3530
+    expected = engine.calculate_cost(1500, 2000, "gemini-2.0-flash", "google")
+    assert math.isclose(stats["total_cost"], expected)
+    assert stats["spend_by_provider"]["ollama"] == 0.0
+    assert stats["by_model"] == store.aggregate_tokens(group_by="model_id")
+
+
 def test_monthly_projection(tmp_path):
     store = UsageStore(db_path=tmp_path / "usage.db")
 
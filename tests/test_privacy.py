@@ -181,6 +181,15 @@ def test_privacy_store_record_and_query(tmp_path):
     assert r["recommendation"] == "Consider routing to a local model"
 
 
+def test_privacy_store_query_epoch_ms(tmp_path):
+    store = PrivacyStore(db_path=tmp_path / "usage.db")
+    store.record(_make_event(timestamp="2025-06-15T10:00:00Z"))
+    store.record(_make_event(timestamp="2025-06-15T10:00:00.250+00:00"))
+
+    epochs = sorted(r["ts_epoch_ms"] for r in store.query())
+    assert epochs == [1749981600000, 1749981600250]
+
+
 def test_privacy_store_summary(tmp_path):
     store = PrivacyStore(db_path=tmp_path / "usage.db")
 
@@ -38,13 +38,13 @@ def _make_event(**overrides) -> PrivacyEvent:
 
 
 def _wait_for_refresh(tab, timeout_s: float = 5.0) -> None:
-    """Spin the event loop until the worker thread completes."""
+    """Spin the event loop until the pooled worker completes."""
     from PySide6.QtCore import QCoreApplication
 
     deadline = time.monotonic() + timeout_s
     while time.monotonic() < deadline:
         QCoreApplication.processEvents()
-        if tab._thread is None:
+        if not tab._busy:
             return
         time.sleep(0.01)
 
@@ -170,3 +170,58 @@ def test_badge_appears_for_high_severity(tmp_path):
     badge_widget = tab._event_table.cellWidget(0, 5)
     assert badge_widget is not None
     assert "Consider Local Routing" in badge_widget.text()
+
+
+def test_event_selection_is_debounced(tmp_path):
+    """Rapid selection changes render the detail panel once, for the last row."""
+    from aurarouter.gui.privacy_tab import PrivacyAuditTab
+
+    store = PrivacyStore(db_path=tmp_path / "usage.db")
+    store.record(_make_event(
+        timestamp="2025-06-15T10:00:00Z",
+        matches=[PrivacyMatch("Email Address", "medium", "user***", 10)],
+    ))
+    store.record(_make_event(
+        timestamp="2025-06-15T11:00:00Z",
+        matches=[PrivacyMatch("SSN", "high", "123-***", 0)],
+    ))
+
+    tab = PrivacyAuditTab()
+    tab._range_combo.setCurrentText("All Time")
+    tab.set_data_source(store)
+    tab.refresh()
+    _wait_for_refresh(tab)
+
+    tab._on_event_selected(1, 0, -1, -1)
+    tab._on_event_selected(0, 0, 1, 0)
+    assert tab._detail_timer.isActive()
+    assert tab._detail_label.isHidden()
+
+    tab._detail_timer.stop()
+    tab._render_selected_event()
+    # Newest first, so row 0 is the SSN event.
+    assert "SSN" in tab._detail_label.text()
+    assert "Email Address" not in tab._detail_label.text()
+
+
+def test_repeated_refresh_reuses_signals(tmp_path):
+    """Consecutive refreshes report through the same long-lived signals object."""
+    from aurarouter.gui.privacy_tab import PrivacyAuditTab
+
+    store = PrivacyStore(db_path=tmp_path / "usage.db")
+    store.record(_make_event(timestamp="2025-06-15T10:00:00Z"))
+
+    tab = PrivacyAuditTab()
+    tab._range_combo.setCurrentText("All Time")
+    tab.set_data_source(store)
+    signals = tab._signals
+
+    tab.refresh()
+    _wait_for_refresh(tab)
+    assert tab._lbl_total.text() == "1"
+
+    store.record(_make_event(timestamp="2025-06-15T11:00:00Z"))
+    tab.refresh()
+    _wait_for_refresh(tab)
+    assert tab._lbl_total.text() == "2"
+    assert tab._signals is signals
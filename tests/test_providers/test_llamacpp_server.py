@@ -28,6 +28,7 @@ def test_generate_sends_post_to_completion():
     payload = call_args[1]["json"]
     assert payload["temperature"] == 0.1
     assert payload["n_predict"] == 512
+    assert payload["cache_prompt"] is True
 
 
 def test_json_mode_adds_json_schema():
@@ -54,6 +55,24 @@ def test_json_mode_adds_json_schema():
     assert "json_schema" in payload
 
 
+def test_cache_prompt_can_be_disabled():
+    provider = LlamaCppServerProvider({"parameters": {"cache_prompt": False}})
+
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"content": "hello"}
+    mock_resp.raise_for_status = MagicMock()
+
+    mock_client = MagicMock()
+    mock_client.post.return_value = mock_resp
+
+    with patch("httpx.Client") as MockClient:
+        MockClient.return_value.__enter__ = MagicMock(return_value=mock_client)
+        MockClient.return_value.__exit__ = MagicMock(return_value=False)
+        provider.generate("test")
+
+    assert mock_client.post.call_args[1]["json"]["cache_prompt"] is False
+
+
 def test_default_endpoint():
     cfg = {"parameters": {}}
     provider = LlamaCppServerProvider(cfg)
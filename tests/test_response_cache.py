@@ -0,0 +1,53 @@
+"""Tests for the in-memory tool response cache."""
+
+from unittest.mock import patch
+
+from aurarouter.response_cache import ResponseCache
+
+
+def test_lookup_miss_then_hit():
+    cache = ResponseCache()
+    assert cache.lookup("coding", "write add()") is None
+    cache.store("coding", "write add()", "def add(a, b): return a + b")
+    assert cache.lookup("coding", "write add()") == "def add(a, b): return a + b"
+
+
+def test_whitespace_variants_share_entry():
+    cache = ResponseCache()
+    cache.store("coding", "TASK: add\nCONTEXT:  x", "ok")
+    assert cache.lookup("coding", "  TASK: add CONTEXT: x\n") == "ok"
+
+
+def test_namespaces_are_separate():
+    cache = ResponseCache()
+    cache.store("coding", "p", "cloud answer")
+    assert cache.lookup("local_inference", "p") is None
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.store("r", "a", "A")
+    cache.store("r", "b", "B")
+    assert cache.lookup("r", "a") == "A"  # a is now most recent
+    cache.store("r", "c", "C")
+    assert cache.lookup("r", "b") is None
+    assert cache.lookup("r", "a") == "A"
+    assert len(cache) == 2
+
+
+def test_ttl_expiry():
+    cache = ResponseCache(ttl_seconds=10)
+    with patch("aurarouter.response_cache.time.monotonic", return_value=100.0):
+        cache.store("r", "p", "old")
+    with patch("aurarouter.response_cache.time.monotonic", return_value=105.0):
+        assert cache.lookup("r", "p") == "old"
+    with patch("aurarouter.response_cache.time.monotonic", return_value=111.0):
+        assert cache.lookup("r", "p") is None
+    assert len(cache) == 0
+
+
+def test_clear():
+    cache = ResponseCache()
+    cache.store("r", "p", "x")
+    cache.clear()
+    assert len(cache) == 0
@@ -1,6 +1,7 @@
 """Tests for review loop business logic (TG-B2)."""
 
 import json
+import threading
 from unittest.mock import patch, MagicMock
 
 from aurarouter.config import ConfigLoader
@@ -216,6 +217,52 @@ class TestRouteTaskReviewLoop:
             # Returns the last corrected output
             assert result == "still bad"
 
+    def test_correction_steps_share_one_batched_call(self):
+        """Multi-step corrections send the file context once per batch."""
+        fabric = _make_review_fabric(max_iterations=2)
+        fabric._config.config["execution"]["plan_batch_size"] = 8
+        with patch.object(fabric, "execute", side_effect=[
+            GenerateResult(text=json.dumps({"intent": "SIMPLE_CODE"})),
+            GenerateResult(text="bad output"),
+            GenerateResult(text=json.dumps({"verdict": "FAIL", "feedback": "Bad", "correction_hints": []})),
+            GenerateResult(text=json.dumps(["Fix a", "Fix b"])),
+            # one batched call answers both correction steps
+            GenerateResult(text="[1]\nfixed a\n[2]\nfixed b"),
+            GenerateResult(text=json.dumps({"verdict": "PASS", "feedback": "ok", "correction_hints": []})),
+        ]):
+            result = route_task(fabric, None, task="build widget", context="CTX-BODY")
+            batch_prompt = fabric.execute.call_args_list[4][0][1]
+        assert result == "fixed a\nfixed b"
+        assert batch_prompt.count("CTX-BODY") == 1
+        assert batch_prompt.startswith("CONTEXT: CTX-BODY\n")
+
+    def test_unbatched_correction_steps_run_concurrently(self):
+        """Without batching, correction steps overlap and keep their order."""
+        fabric = _make_review_fabric(max_iterations=2)
+        barrier = threading.Barrier(2, timeout=2)
+        reviews = iter(["FAIL", "PASS"])
+
+        def execute(role, prompt, **_kw):
+            if role == "router":
+                return GenerateResult(text=json.dumps({"intent": "SIMPLE_CODE"}))
+            if role == "reviewer":
+                return GenerateResult(text=json.dumps(
+                    {"verdict": next(reviews), "feedback": "f", "correction_hints": []}
+                ))
+            if role == "reasoning":
+                return GenerateResult(text=json.dumps(["Fix a", "Fix b"]))
+            if "GOAL: Fix a" in prompt:
+                barrier.wait()
+                return GenerateResult(text="fixed a")
+            if "GOAL: Fix b" in prompt:
+                barrier.wait()
+                return None
+            return GenerateResult(text="bad output")
+
+        with patch.object(fabric, "execute", side_effect=execute):
+            result = route_task(fabric, None, task="build widget")
+        assert result == "fixed a\n\n# Correction Step 2 Failed."
+
 
 # ------------------------------------------------------------------
 # Review loop in generate_code
@@ -3,7 +3,14 @@ from unittest.mock import patch
 
 from aurarouter.config import ConfigLoader
 from aurarouter.fabric import ComputeFabric
-from aurarouter.routing import TriageResult, analyze_intent, generate_plan
+from aurarouter.routing import (
+    PlanStep,
+    TriageResult,
+    analyze_intent,
+    generate_plan,
+    plan_step_budget,
+    plan_waves,
+)
 from aurarouter.savings.models import GenerateResult
 
 
@@ -69,3 +76,95 @@ def test_generate_plan_fallback_on_failure():
     fabric = _make_fabric()
     with patch.object(fabric, "execute", return_value=None):
         assert generate_plan(fabric, "my task", "") == ["my task"]
+
+
+def test_generate_plan_with_dependencies():
+    fabric = _make_fabric()
+    plan_json = json.dumps([
+        {"step": "a", "depends_on": []},
+        {"step": "b", "depends_on": []},
+        {"step": "c", "depends_on": [1, 2]},
+    ])
+    with patch.object(fabric, "execute", return_value=GenerateResult(text=plan_json)):
+        result = generate_plan(fabric, "task", "", with_dependencies=True)
+    assert result == [PlanStep("a", []), PlanStep("b", []), PlanStep("c", [0, 1])]
+
+
+def test_generate_plan_dependencies_sanitised():
+    fabric = _make_fabric()
+    plan_json = json.dumps([
+        "a",
+        {"step": "b", "depends_on": [2, 3, 0, "1", True]},
+        {"step": "c"},
+    ])
+    with patch.object(fabric, "execute", return_value=GenerateResult(text=plan_json)):
+        result = generate_plan(fabric, "task", "", with_dependencies=True)
+    # Self/forward/non-int references are dropped; missing lists mean sequential.
+    assert result == [PlanStep("a", []), PlanStep("b", []), PlanStep("c", [0, 1])]
+
+
+def test_generate_plan_with_dependencies_fallback():
+    fabric = _make_fabric()
+    with patch.object(fabric, "execute", return_value=None):
+        assert generate_plan(fabric, "t", "", with_dependencies=True) == [PlanStep("t", [])]
+
+
+def test_sequential_plan_steps_see_recent_steps_only():
+    fabric = _make_fabric()
+    plan_json = json.dumps(["a", "b", "c", "d", {"step": "e"}])
+    with patch.object(fabric, "execute", return_value=GenerateResult(text=plan_json)):
+        result = generate_plan(fabric, "task", "", with_dependencies=True)
+    assert [s.depends_on for s in result] == [[], [0], [0, 1], [1, 2], [2, 3]]
+
+
+def test_analyze_intent_memoized_per_fabric():
+    fabric = _make_fabric()
+    reply = GenerateResult(text=json.dumps({"intent": "SIMPLE_CODE", "complexity": 2}))
+    with patch.object(fabric, "execute", return_value=reply) as mock:
+        first = analyze_intent(fabric, "write a sort function")
+        second = analyze_intent(fabric, "write a sort function")
+        analyze_intent(fabric, "something else")
+    assert first == second
+    assert mock.call_count == 2
+
+    other = _make_fabric()
+    with patch.object(other, "execute", return_value=reply) as mock:
+        analyze_intent(other, "write a sort function")
+    mock.assert_called_once()
+
+
+def test_analyze_intent_failures_not_memoized():
+    fabric = _make_fabric()
+    with patch.object(fabric, "execute", side_effect=[
+        GenerateResult(text="not json"),
+        GenerateResult(text=json.dumps({"intent": "COMPLEX_REASONING", "complexity": 8})),
+    ]):
+        assert analyze_intent(fabric, "task").intent == "DIRECT"
+        assert analyze_intent(fabric, "task").intent == "COMPLEX_REASONING"
+
+
+def test_plan_step_budget_bands():
+    assert plan_step_budget(1) == 0
+    assert plan_step_budget(3) == 0
+    assert plan_step_budget(5) == 3
+    assert plan_step_budget(9) is None
+    assert plan_step_budget("bogus") is None
+
+
+def test_generate_plan_max_steps_hint():
+    fabric = _make_fabric()
+    with patch.object(fabric, "execute", return_value=GenerateResult(text='["a"]')) as mock:
+        generate_plan(fabric, "task", "", max_steps=3)
+    assert "at most 3 steps" in mock.call_args.args[1]
+
+
+def test_plan_waves_group_independent_steps():
+    steps = [
+        PlanStep("a", []),
+        PlanStep("b", []),
+        PlanStep("c", [0, 1]),
+        PlanStep("d", [0]),
+    ]
+    assert plan_waves(steps) == [[0, 1], [2, 3]]
+    assert plan_waves([PlanStep("x", []), PlanStep("y", [0])]) == [[0], [1]]
+    assert plan_waves([]) == []
@@ -0,0 +1,64 @@
+"""Tests for the embedding-based answer cache."""
+
+import numpy as np
+
+from aurarouter.semantic_cache import SemanticCache
+
+_VOCAB = ["reverse", "string", "sort", "list", "python", "tcp"]
+
+
+def _embed(text):
+    words = text.lower().replace("?", "").split()
+    vec = np.array([float(w in words) for w in _VOCAB], dtype=np.float32)
+    return vec if vec.any() else None
+
+
+def test_similar_request_hits():
+    cache = SemanticCache(_embed, threshold=0.8)
+    cache.store("route_task", "reverse a python string", "s[::-1]")
+    assert cache.lookup("route_task", "python: reverse string?") == "s[::-1]"
+
+
+def test_dissimilar_request_misses():
+    cache = SemanticCache(_embed, threshold=0.8)
+    cache.store("route_task", "reverse a python string", "s[::-1]")
+    assert cache.lookup("route_task", "sort a python list") is None
+
+
+def test_namespaces_are_separate():
+    cache = SemanticCache(_embed)
+    cache.store("route_task", "reverse string", "cloud answer")
+    assert cache.lookup("local_inference", "reverse string") is None
+
+
+def test_best_match_wins():
+    cache = SemanticCache(_embed, threshold=0.5)
+    cache.store("r", "reverse string", "A")
+    cache.store("r", "sort list python", "B")
+    assert cache.lookup("r", "sort python list") == "B"
+
+
+def test_oldest_entry_evicted():
+    cache = SemanticCache(_embed, max_entries=2)
+    cache.store("r", "reverse", "A")
+    cache.store("r", "sort", "B")
+    cache.store("r", "tcp", "C")
+    assert len(cache) == 2
+    assert cache.lookup("r", "reverse") is None
+    assert cache.lookup("r", "tcp") == "C"
+
+
+def test_long_or_unembeddable_text_bypasses_cache():
+    cache = SemanticCache(_embed, max_words=3)
+    cache.store("r", "reverse a python string now", "A")
+    cache.store("r", "hello", "B")  # _embed returns None
+    assert len(cache) == 0
+    cache.store("r", "reverse string", "C")
+    assert cache.lookup("r", "reverse string and more words") is None
+
+
+def test_clear():
+    cache = SemanticCache(_embed)
+    cache.store("r", "reverse", "A")
+    cache.clear()
+    assert len(cache) == 0
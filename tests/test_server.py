@@ -108,6 +108,50 @@ def test_compare_models_enabled_by_config():
     assert "compare_models" in tool_names
 
 
+def test_compare_models_tool_returns_blocks_in_completion_order():
+    import asyncio
+    from unittest.mock import patch
+
+    cfg = _make_config()
+    cfg.config["mcp"] = {"tools": {"compare_models": {"enabled": True}}}
+    mcp = create_mcp_server(cfg)
+    results = [
+        {"model_id": mid, "provider": "ollama", "success": True, "text": text,
+         "elapsed_s": 0.1, "input_tokens": 1, "output_tokens": 2}
+        for mid, text in (("fast", "quick"), ("slow", "late"))
+    ]
+    with patch("aurarouter.fabric.ComputeFabric.iter_all", return_value=iter(results)):
+        out = asyncio.run(mcp.call_tool("compare_models", {"prompt": "x"}))
+    text = out[0][0].text if isinstance(out, tuple) else out[0].text
+    assert text.index("=== fast") < text.index("=== slow")
+    assert "quick" in text and "late" in text
+
+
+def test_local_inference_calls_overlap():
+    import asyncio
+    import threading
+    from unittest.mock import patch
+
+    cfg = _make_config()
+    mcp = create_mcp_server(cfg)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_local_inference(fabric, *, prompt, context="", **_caches):
+        barrier.wait()  # deadlocks unless both calls run at once
+        return prompt.upper()
+
+    async def run_both():
+        return await asyncio.gather(
+            mcp.call_tool("local_inference", {"prompt": "a"}),
+            mcp.call_tool("local_inference", {"prompt": "b"}),
+        )
+
+    with patch("aurarouter.server._local_inference", side_effect=fake_local_inference):
+        outs = asyncio.run(run_both())
+    texts = [(o[0][0] if isinstance(o, tuple) else o[0]).text for o in outs]
+    assert texts == ["A", "B"]
+
+
 def test_deprecated_alias_enabled_by_config():
     """intelligent_code_gen can be re-enabled explicitly in config."""
     cfg = _make_config()
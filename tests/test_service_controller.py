@@ -0,0 +1,115 @@
+"""Tests for ServiceController background dispatch."""
+
+import time
+
+import pytest
+
+PySide6 = pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+from aurarouter.gui.environment import EnvironmentContext, HealthStatus, ServiceState
+from aurarouter.gui.service_controller import ServiceController
+
+# Ensure a QApplication exists for signal delivery.
+_app = QApplication.instance() or QApplication([])
+
+
+class _FakeContext(EnvironmentContext):
+    def __init__(self):
+        super().__init__()
+        self.calls: list[str] = []
+        self._state = ServiceState.STOPPED
+
+    def start(self) -> None:
+        self.calls.append("start")
+        self._state = ServiceState.RUNNING
+        self.state_changed.emit(self._state.value)
+
+    def stop(self) -> None:
+        self.calls.append("stop")
+        raise RuntimeError("stop failed")
+
+    def pause(self) -> None:
+        self.calls.append("pause")
+
+    def resume(self) -> None:
+        self.calls.append("resume")
+
+    def get_state(self) -> ServiceState:
+        return self._state
+
+    def check_health(self) -> HealthStatus:
+        self.calls.append("health")
+        return HealthStatus(healthy=True, message="ok")
+
+
+def _spin_until(predicate, timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        if predicate():
+            return
+        time.sleep(0.01)
+
+
+class TestServiceController:
+    def test_start_forwards_state(self):
+        ctx = _FakeContext()
+        ctrl = ServiceController(ctx)
+        states: list[str] = []
+        ctrl.state_changed.connect(states.append)
+
+        ctrl.start_service()
+        _spin_until(lambda: states)
+        assert ctx.calls == ["start"]
+        assert states == [ServiceState.RUNNING.value]
+
+    def test_health_result_delivered(self):
+        ctx = _FakeContext()
+        ctrl = ServiceController(ctx)
+        results: list[HealthStatus] = []
+        ctrl.health_result.connect(results.append)
+
+        ctrl.run_health_check()
+        _spin_until(lambda: results)
+        assert results[0].healthy is True
+
+    def test_error_forwarded(self):
+        ctx = _FakeContext()
+        ctrl = ServiceController(ctx)
+        errors: list[str] = []
+        ctrl.error.connect(errors.append)
+
+        ctrl.stop_service()
+        _spin_until(lambda: errors)
+        assert errors == ["stop failed"]
+
+    def test_operations_are_serialized(self):
+        ctx = _FakeContext()
+        ctrl = ServiceController(ctx)
+        results: list[HealthStatus] = []
+        ctrl.health_result.connect(results.append)
+
+        ctrl.start_service()
+        ctrl.run_health_check()
+        # Second request is queued behind the in-flight start.
+        assert len(ctrl._pending) == 1
+
+        _spin_until(lambda: results)
+        assert ctx.calls == ["start", "health"]
+        assert ctrl._busy is False
+        assert not ctrl._pending
+
+    def test_pause_runs_off_gui_thread(self):
+        import threading
+
+        ctx = _FakeContext()
+        seen: list[threading.Thread] = []
+        ctx.pause = lambda: seen.append(threading.current_thread())
+        ctrl = ServiceController(ctx)
+
+        ctrl.pause_service()
+        _spin_until(lambda: seen and not ctrl._busy)
+        assert seen and seen[0] is not threading.main_thread()
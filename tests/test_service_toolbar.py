@@ -0,0 +1,126 @@
+"""Tests for the ServiceToolbar widget."""
+
+from unittest.mock import patch
+
+import pytest
+
+PySide6 = pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QLabel
+
+from aurarouter.gui.environment import HealthStatus, ServiceState
+from aurarouter.gui.service_toolbar import ServiceToolbar
+
+# Ensure a QApplication exists for widget tests.
+_app = QApplication.instance() or QApplication([])
+
+
+class TestServiceToolbar:
+    def test_initial_state(self):
+        tb = ServiceToolbar()
+        assert tb._current_state == ServiceState.STOPPED
+        assert tb._start_btn.isEnabled()
+        assert not tb._stop_btn.isEnabled()
+
+    def test_set_state_updates_buttons(self):
+        tb = ServiceToolbar()
+        tb.show()
+        tb.set_state(ServiceState.PAUSED.value)
+        assert tb._pause_btn.text() == "Resume"
+        assert not tb._start_btn.isEnabled()
+        assert not tb._env_combo.isEnabled()
+
+    def test_repeated_state_skips_setters(self):
+        tb = ServiceToolbar()
+        tb.show()
+        tb.set_state(ServiceState.RUNNING.value)
+        with patch.object(QLabel, "setStyleSheet") as mock_style:
+            tb.set_state(ServiceState.RUNNING.value)
+        mock_style.assert_not_called()
+
+    def test_repeated_health_skips_setters(self):
+        tb = ServiceToolbar()
+        status = HealthStatus(healthy=True, message="ok")
+        tb.set_health(status)
+        assert tb._health_label.text() == "Health: OK"
+        with patch.object(QLabel, "setStyleSheet") as mock_style:
+            tb.set_health(HealthStatus(healthy=True, message="ok"))
+        mock_style.assert_not_called()
+
+    def test_state_label_uses_prebuilt_display(self):
+        tb = ServiceToolbar()
+        tb.show()
+        tb.set_state(ServiceState.LOADING_MODEL.value)
+        assert tb._state_label.text() == "  Loading model..."
+        assert "#1565c0" in tb._state_label.styleSheet()
+        assert tb._loading_progress.isVisibleTo(tb)
+
+    def test_health_dashboard_cached_by_content(self):
+        from aurarouter.gui.service_toolbar import _HealthDashboardDialog
+
+        tb = ServiceToolbar()
+        tb.set_health(HealthStatus(healthy=True, details={"m1": True}))
+        with patch.object(_HealthDashboardDialog, "exec"):
+            tb._show_health_dashboard()
+            first = tb._health_dialog
+            tb.set_health(HealthStatus(healthy=True, details={"m1": True}))
+            tb._show_health_dashboard()
+            assert tb._health_dialog is first
+
+            tb.set_health(HealthStatus(healthy=False, message="down", details={"m1": False}))
+            tb._show_health_dashboard()
+            assert tb._health_dialog is not first
+
+    def test_hidden_toolbar_defers_state_until_shown(self):
+        tb = ServiceToolbar()
+        tb.set_state(ServiceState.RUNNING.value)
+        assert tb._current_state == ServiceState.RUNNING
+        assert tb._state_label.text() == "  Stopped"
+
+        tb.show()
+        assert tb._state_label.text() == "  Running"
+        assert tb._stop_btn.isEnabled()
+        tb.hide()
+
+    def test_separators_are_painted_not_widgets(self):
+        from PySide6.QtWidgets import QFrame
+
+        tb = ServiceToolbar()
+        assert all(
+            f.frameShape() != QFrame.Shape.VLine for f in tb.findChildren(QFrame)
+        )
+        tb.resize(800, 40)
+        assert not tb.grab().isNull()
+
+    def test_set_environment(self):
+        tb = ServiceToolbar(auragrid_available=True)
+        tb.set_environment("AuraGrid")
+        assert tb.current_environment() == "AuraGrid"
+        tb.set_environment("Unknown")
+        assert tb.current_environment() == "AuraGrid"
+
+    def test_health_label_click_opens_dashboard(self):
+        from PySide6.QtCore import QPoint
+        from PySide6.QtTest import QTest
+
+        with patch.object(ServiceToolbar, "_show_health_dashboard") as mock_show:
+            tb = ServiceToolbar()
+            QTest.mouseClick(tb._health_label, Qt.MouseButton.LeftButton, pos=QPoint(2, 2))
+        mock_show.assert_called_once()
+
+
+class TestHealthDashboardDialog:
+    def test_details_rendered_in_single_label(self):
+        from aurarouter.gui.service_toolbar import _HealthDashboardDialog
+
+        status = HealthStatus(
+            healthy=False,
+            message="1 down",
+            details={"model-a": True, "<model-b>": False},
+        )
+        dlg = _HealthDashboardDialog(status)
+        text = dlg._details_label.text()
+        assert "model-a" in text
+        assert "&lt;model-b&gt;" in text
+        assert text.count("<span") == 2
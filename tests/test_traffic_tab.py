@@ -1,5 +1,6 @@
 """Tests for the Token Traffic Monitor tab."""
 
+import math
 import sys
 import time
 
@@ -45,7 +46,7 @@ def _wait_for_refresh(tab, timeout_s: float = 5.0) -> None:
     deadline = time.monotonic() + timeout_s
     while time.monotonic() < deadline:
         QCoreApplication.processEvents()
-        if tab._thread is None:
+        if not tab._busy:
             return
         time.sleep(0.01)
 
@@ -85,6 +86,16 @@ def test_time_range_options():
     assert options == ["Last Hour", "Today", "This Week", "This Month", "All Time"]
 
 
+def test_time_range_bounds_are_closed():
+    """Windowed ranges carry an end bound; All Time is unbounded."""
+    from aurarouter.gui.traffic_tab import _time_range_bounds
+
+    start, end = _time_range_bounds("Last Hour")
+    assert start is not None and end is not None
+    assert start < end
+    assert _time_range_bounds("All Time") == (None, None)
+
+
 def test_refresh_with_empty_store(tmp_path):
     """Refresh with an empty store shows zero values."""
     from aurarouter.gui.traffic_tab import TokenTrafficTab
@@ -92,6 +103,7 @@ def test_refresh_with_empty_store(tmp_path):
     store, engine = _make_sources(tmp_path)
     tab = TokenTrafficTab()
     tab.set_data_sources(store, engine)
+    tab.show()
     tab.refresh()
     _wait_for_refresh(tab)
 
@@ -122,6 +134,7 @@ def test_refresh_with_data(tmp_path):
     # Select "All Time" so date filtering doesn't exclude records.
     tab._range_combo.setCurrentText("All Time")
     tab.set_data_sources(store, engine)
+    tab.show()
     tab.refresh()
     _wait_for_refresh(tab)
 
@@ -131,3 +144,289 @@ def test_refresh_with_data(tmp_path):
     assert tab._provider_table.rowCount() == 2
     assert tab._intent_table.rowCount() == 2
     assert tab._role_table.rowCount() == 2
+
+
+def test_refresh_groups_costs_per_model(tmp_path):
+    """Per-group costs and latencies match the per-record sums."""
+    from aurarouter.gui.traffic_tab import _TrafficSignals, _TrafficWorker
+
+    store, engine = _make_sources(tmp_path)
+    for inp, out, elapsed in ((1000, 2000, 1.0), (3000, 4000, 3.0)):
+        store.record(_make_record(
+            model_id="gemini-2.0-flash", provider="google",
+            input_tokens=inp, output_tokens=out, elapsed_s=elapsed,
+        ))
+
+    signals = _TrafficSignals()
+    payloads = []
+    signals.finished.connect(lambda payload, _gen: payloads.append(payload))
+    _TrafficWorker(store, engine, "All Time", signals).run()
+
+    data = payloads[0]
+    assert data["total_requests"] == 2
+    assert data["summary_text"][:3] == ("2", "4,000", "6,000")
+    (row,) = data["provider_rows"]
+    assert row["requests"] == 2
+    assert math.isclose(row["avg_latency"], 2.0)
+    assert math.isclose(row["cost"], engine.total_spend())
+    assert math.isclose(data["total_cost"], row["cost"])
+
+
+def test_bucketed_bounds_snap_outward():
+    """Bucketed bounds are aligned and contain the raw bounds."""
+    from datetime import datetime
+
+    from aurarouter.gui.traffic_tab import _bucketed_bounds, _time_range_bounds
+
+    raw_start, raw_end = _time_range_bounds("Last Hour")
+    start, end = _bucketed_bounds("Last Hour")
+    assert start <= raw_start and end >= raw_end
+    assert datetime.fromisoformat(start).timestamp() % 30 == 0
+    assert datetime.fromisoformat(end).timestamp() % 30 == 0
+    assert _bucketed_bounds("All Time") == (None, None)
+
+
+def test_traffic_payload_cached_until_store_changes(tmp_path, monkeypatch):
+    """Repeated runs reuse the payload until a new row is written."""
+    from datetime import datetime, timezone
+
+    from aurarouter.gui.traffic_tab import _TrafficSignals, _TrafficWorker
+
+    now = datetime.now(timezone.utc).isoformat()
+    store, engine = _make_sources(tmp_path)
+    store.record(_make_record(timestamp=now))
+    calls = []
+    real_aggregate = store.aggregate
+    monkeypatch.setattr(
+        store, "aggregate", lambda *a, **kw: calls.append(a) or real_aggregate(*a, **kw)
+    )
+
+    signals = _TrafficSignals()
+    payloads = []
+    signals.finished.connect(lambda payload, _gen: payloads.append(payload))
+    memo = {}
+    for _ in range(2):
+        _TrafficWorker(store, engine, "Last Hour", signals, memo=memo).run()
+    assert len(calls) == 1
+    assert payloads[0] is payloads[1]
+
+    store.record(_make_record(timestamp=now))
+    _TrafficWorker(store, engine, "Last Hour", signals, memo=memo).run()
+    assert len(calls) == 2
+    assert payloads[2]["total_requests"] == 2
+
+    # A write from another process (its own UsageStore on the same file)
+    # leaves this store's revision alone but still invalidates the memo.
+    other = UsageStore(db_path=tmp_path / "usage.db")
+    other.record(_make_record(timestamp=now))
+    _TrafficWorker(store, engine, "Last Hour", signals, memo=memo).run()
+    assert len(calls) == 3
+    assert payloads[3]["total_requests"] == 3
+
+
+def test_traffic_payload_recomputed_after_config_edit(tmp_path):
+    """Editing the config invalidates the memoized sliding-range payload."""
+    from datetime import datetime, timezone
+
+    from aurarouter.config import ConfigLoader
+    from aurarouter.gui.traffic_tab import _TrafficSignals, _TrafficWorker
+
+    store, engine = _make_sources(tmp_path)
+    store.record(_make_record(timestamp=datetime.now(timezone.utc).isoformat()))
+    config = ConfigLoader(allow_missing=True)
+    config.config = {"models": {}}
+    signals = _TrafficSignals()
+    payloads = []
+    signals.finished.connect(lambda payload, _gen: payloads.append(payload))
+    memo = {}
+
+    _TrafficWorker(store, engine, "Last Hour", signals, config, memo=memo).run()
+    config.set_model("test-model", {"provider": "ollama", "hosting_tier": "cloud"})
+    _TrafficWorker(store, engine, "Last Hour", signals, config, memo=memo).run()
+    assert payloads[0] is not payloads[1]
+    assert payloads[1]["provider_rows"][0]["tier"] == "cloud"
+
+
+def test_incremental_refresh_queries_only_new_rows(tmp_path, monkeypatch):
+    """Fixed-start ranges fold new rows into the carried-over state."""
+    from aurarouter.gui.traffic_tab import _TrafficSignals, _TrafficWorker
+
+    store, engine = _make_sources(tmp_path)
+    store.record(_make_record(model_id="m1", input_tokens=10, output_tokens=20))
+    signals = _TrafficSignals()
+    payloads = []
+    signals.finished.connect(lambda payload, _gen: payloads.append(payload))
+
+    _TrafficWorker(store, engine, "All Time", signals).run()
+    state = payloads[-1]["state"]
+    assert state["watermark"] == 1
+
+    calls = []
+    real_aggregate = store.aggregate
+    monkeypatch.setattr(
+        store, "aggregate", lambda *a, **kw: calls.append(kw) or real_aggregate(*a, **kw)
+    )
+    _TrafficWorker(store, engine, "All Time", signals, prior_state=state).run()
+    assert calls == []  # nothing new since the watermark
+
+    store.record(_make_record(model_id="m1", input_tokens=5, output_tokens=5))
+    store.record(_make_record(model_id="m2", intent="CHAT", input_tokens=1, output_tokens=1))
+    _TrafficWorker(store, engine, "All Time", signals, prior_state=state).run()
+    assert {kw["after_id"] for kw in calls} == {1}
+    data = payloads[-1]
+    assert data["total_requests"] == 3
+    by_model = {r["model"]: r for r in data["provider_rows"]}
+    assert by_model["m1"]["requests"] == 2
+    assert by_model["m1"]["input_tokens"] == 15
+    assert [r["intent"] for r in data["intent_rows"]] == ["CHAT", "SIMPLE_CODE"]
+
+    # A purge invalidates the carried state.
+    store.purge_before("2100-01-01T00:00:00Z")
+    _TrafficWorker(store, engine, "All Time", signals, prior_state=data["state"]).run()
+    assert payloads[-1]["total_requests"] == 0
+
+
+def test_repeated_refresh_reuses_pool(tmp_path):
+    """Back-to-back refreshes run on the pool and never stack."""
+    from aurarouter.gui.traffic_tab import TokenTrafficTab
+
+    store, engine = _make_sources(tmp_path)
+    store.record(_make_record())
+    tab = TokenTrafficTab()
+    tab._range_combo.setCurrentText("All Time")
+    tab.set_data_sources(store, engine)
+    tab.show()
+    for _ in range(3):
+        store.record(_make_record())
+        tab.refresh()
+        assert tab._busy is True
+        tab.refresh()  # ignored while in flight
+        _wait_for_refresh(tab)
+        assert tab._busy is False
+        assert tab._refresh_btn.isEnabled()
+    assert tab._lbl_requests.text() == "4"
+
+
+def test_tables_filled_from_preformatted_cells(tmp_path):
+    """Provider table cells come straight from the worker-formatted payload."""
+    from aurarouter.gui.traffic_tab import TokenTrafficTab
+
+    store, engine = _make_sources(tmp_path)
+    store.record(_make_record(model_id="m1", input_tokens=1500, output_tokens=2500))
+    tab = TokenTrafficTab()
+    tab._range_combo.setCurrentText("All Time")
+    tab.set_data_sources(store, engine)
+    tab.show()
+    tab.refresh()
+    _wait_for_refresh(tab)
+
+    t = tab._provider_table
+    assert t.rowCount() == 1
+    assert [t.item(0, c).text() for c in (0, 1, 3, 4, 5)] == [
+        "ollama", "m1", "1", "1,500", "2,500",
+    ]
+    assert t.updatesEnabled()
+    assert not t.signalsBlocked()
+    assert tab._intent_table.item(0, 0).text() == "SIMPLE_CODE"
+
+
+def test_refresh_deferred_while_hidden(tmp_path):
+    """Hidden tabs skip the query and refresh once shown."""
+    from aurarouter.gui.traffic_tab import TokenTrafficTab
+
+    store, engine = _make_sources(tmp_path)
+    store.record(_make_record())
+    tab = TokenTrafficTab()
+    tab.set_data_sources(store, engine)
+    tab._range_combo.setCurrentText("All Time")  # triggers refresh()
+    assert tab._busy is False
+    assert tab._dirty is True
+
+    tab.show()
+    assert tab._dirty is False
+    _wait_for_refresh(tab)
+    assert tab._lbl_requests.text() == "1"
+    tab.hide()
+
+
+def test_hosting_tier_resolved_once_per_model(tmp_path):
+    """Tier lookups are memoized per tab until the config changes."""
+    from unittest.mock import MagicMock
+
+    from aurarouter.gui.traffic_tab import TokenTrafficTab
+
+    store, engine = _make_sources(tmp_path)
+    store.record(_make_record(model_id="m1"))
+    config = MagicMock()
+    config.get_model_hosting_tier.return_value = "cloud"
+    config.revision = 0
+
+    tab = TokenTrafficTab()
+    tab._range_combo.setCurrentText("All Time")
+    tab.set_data_sources(store, engine, config)
+    tab.show()
+    for _ in range(2):
+        store.record(_make_record(model_id="m1"))
+        tab.refresh()
+        _wait_for_refresh(tab)
+    assert tab._provider_table.item(0, 2).text() == "cloud"
+    config.get_model_hosting_tier.assert_called_once_with("m1")
+
+    config.revision += 1  # an edit through a ConfigLoader mutation method
+    assert tab._tiers.get("ollama", "m1") == "cloud"
+    assert config.get_model_hosting_tier.call_count == 2
+    tab.hide()
+
+
+def test_duplicate_refresh_dropped_until_data_changes(tmp_path):
+    """A refresh matching the last completed bucket key is a no-op."""
+    from aurarouter.gui.traffic_tab import TokenTrafficTab
+
+    store, engine = _make_sources(tmp_path)
+    tab = TokenTrafficTab()
+    tab._range_combo.setCurrentText("All Time")
+    tab.set_data_sources(store, engine)
+    tab.show()
+    tab.refresh()
+    _wait_for_refresh(tab)
+
+    tab.refresh()
+    assert tab._busy is False  # duplicate dropped
+
+    store.record(_make_record())
+    tab.refresh()
+    assert tab._busy is True
+    _wait_for_refresh(tab)
+    assert tab._lbl_requests.text() == "1"
+
+    tab._last_completed -= 10  # outside the duplicate window
+    tab.refresh()
+    assert tab._busy is True
+    _wait_for_refresh(tab)
+    tab.hide()
+
+
+def test_result_from_replaced_sources_dropped(tmp_path):
+    """A worker finishing after set_data_sources cannot leak old totals."""
+    from aurarouter.gui.traffic_tab import TokenTrafficTab
+
+    old_store, engine = _make_sources(tmp_path)
+    old_store.record(_make_record(model_id="old"))
+    new_dir = tmp_path / "new"
+    new_dir.mkdir()
+    new_store, new_engine = _make_sources(new_dir)
+
+    tab = TokenTrafficTab()
+    tab._range_combo.setCurrentText("All Time")
+    tab.set_data_sources(old_store, engine)
+    tab.show()
+    stale = tab._generation
+    tab._busy = True  # a worker on the old store is still in flight
+
+    tab.set_data_sources(new_store, new_engine)
+    tab._apply_data({"state": {"label": "All Time", "watermark": 1}}, stale)
+    _wait_for_refresh(tab)  # the dropped result triggers a fresh refresh
+    assert tab._busy is False
+    assert tab._agg_state["All Time"]["watermark"] == 0
+    assert tab._lbl_requests.text() == "0"
+    tab.hide()
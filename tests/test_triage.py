@@ -44,6 +44,30 @@ def test_no_rules_returns_default():
     assert router.select_role(10) == "coding"
 
 
+def test_select_role_remembered_per_score():
+    router = _make_router()
+    with patch.object(router, "_match_role", wraps=router._match_role) as spy:
+        assert router.select_role(2) == "coding_lite"
+        assert router.select_role(2) == "coding_lite"
+        assert router.select_role(5) == "coding"
+    assert spy.call_count == 2
+
+
+def test_select_role_cache_follows_rule_changes():
+    router = _make_router()
+    assert router.select_role(2) == "coding_lite"
+
+    router.rules = [TriageRule(max_complexity=1, preferred_role="tiny")]
+    assert router.select_role(2) == "coding"
+
+    router.default_role = "reasoning"
+    assert router.select_role(2) == "reasoning"
+
+    router.rules[0].max_complexity = 5
+    router.clear_cache()
+    assert router.select_role(2) == "tiny"
+
+
 # ---------------------------------------------------------------------------
 # TriageRouter.from_config tests
 # ---------------------------------------------------------------------------
@@ -99,6 +99,75 @@ def test_aggregate_tokens(tmp_path):
     assert by_model["m2"]["total_tokens"] == 110
 
 
+def test_aggregate_multi_column(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    store.record(_make_record(model_id="m1", provider="ollama", input_tokens=10, output_tokens=20, elapsed_s=1.0))
+    store.record(_make_record(model_id="m1", provider="ollama", input_tokens=30, output_tokens=40, elapsed_s=3.0))
+    store.record(_make_record(model_id="m2", provider="google", input_tokens=50, output_tokens=60, elapsed_s=2.0))
+
+    rows = store.aggregate(("provider", "model_id"))
+    assert rows == [
+        ("google", "m2", 1, 50, 60, 2.0),
+        ("ollama", "m1", 2, 40, 60, 4.0),
+    ]
+    assert store.aggregate(("intent",), start="2030-01-01T00:00:00Z") == []
+    with pytest.raises(ValueError):
+        store.aggregate(("timestamp",))
+
+
+def test_timestamp_index_covers_aggregates(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    conn = store._connect()
+    names = {r[1] for r in conn.execute("PRAGMA index_list(usage)")}
+    assert "idx_usage_ts" in names
+
+    plan = " ".join(
+        str(r[-1])
+        for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT role, COUNT(*), SUM(input_tokens), "
+            "SUM(output_tokens), SUM(elapsed_s) FROM usage "
+            "WHERE timestamp >= ? AND timestamp <= ? GROUP BY role",
+            ("2025-01-01", "2025-02-01"),
+        )
+    )
+    assert "COVERING INDEX idx_usage_ts" in plan
+
+
+def test_revision_bumps_on_write(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    assert store.revision == 0
+    store.record(_make_record(timestamp="2025-01-01T00:00:00Z"))
+    assert store.revision == 1
+    store.purge_before("2024-01-01T00:00:00Z")  # nothing deleted
+    assert store.revision == 1
+    store.purge_before("2026-01-01T00:00:00Z")
+    assert store.revision == 2
+
+
+def test_aggregate_id_window_and_last_id(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    assert store.last_id() == 0
+    for n in (10, 20, 30):
+        store.record(_make_record(input_tokens=n))
+    assert store.last_id() == 3
+    rows = store.aggregate(("model_id",), after_id=1, upto_id=2)
+    assert rows == [("test-model", 1, 20, 200, 1.0)]
+
+
+def test_iter_query_streams_in_batches(tmp_path):
+    store = UsageStore(db_path=tmp_path / "usage.db")
+    for day in range(1, 6):
+        store.record(_make_record(timestamp=f"2025-01-0{day}T00:00:00Z", input_tokens=day))
+
+    it = store.iter_query(start="2025-01-02T00:00:00Z", batch_size=2)
+    first = next(it)
+    assert first.input_tokens == 2
+    # Writes between batches do not deadlock the open cursor.
+    store.record(_make_record(timestamp="2024-12-31T00:00:00Z"))
+    assert [r.input_tokens for r in it] == [3, 4, 5]
+    assert len(store.query()) == 6
+
+
 def test_total_tokens(tmp_path):
     store = UsageStore(db_path=tmp_path / "usage.db")
     store.record(_make_record(input_tokens=100, output_tokens=200))
@@ -0,0 +1,106 @@
+"""Tests for the shared worker pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aurarouter.worker_pool import (
+    bounded_map,
+    get_executor,
+    run_coroutine,
+    shutdown_executor,
+)
+
+
+class TestSharedExecutor:
+    def test_same_pool_returned(self):
+        assert get_executor() is get_executor()
+
+    def test_recreated_after_shutdown(self):
+        first = get_executor()
+        shutdown_executor(wait=True)
+        second = get_executor()
+        assert second is not first
+        assert second.submit(lambda: 42).result() == 42
+
+
+class TestBoundedMap:
+    def test_yields_every_index(self):
+        out = dict(bounded_map(lambda x: x * 2, [1, 2, 3, 4], 2))
+        assert out == {0: 2, 1: 4, 2: 6, 3: 8}
+
+    def test_limits_calls_in_flight(self):
+        lock = threading.Lock()
+        active = peak = 0
+
+        def work(_):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        list(bounded_map(work, list(range(8)), 3))
+        assert peak <= 3
+
+    def test_close_stops_submitting(self):
+        started = []
+
+        def work(x):
+            started.append(x)
+            time.sleep(0.01)
+            return x
+
+        results = bounded_map(work, list(range(20)), 2)
+        next(results)
+        results.close()
+        time.sleep(0.05)
+        assert len(started) < 20
+
+    def test_exception_propagates(self):
+        def boom(_):
+            raise RuntimeError("bad")
+
+        with pytest.raises(RuntimeError, match="bad"):
+            list(bounded_map(boom, [1], 1))
+
+
+class TestRunCoroutine:
+    def test_returns_result(self):
+        async def work():
+            await asyncio.sleep(0)
+            return 7
+
+        assert run_coroutine(work(), timeout=1.0) == 7
+
+    def test_bridge_does_not_occupy_shared_pool(self):
+        """A bridged coroutine that fans out onto the shared pool cannot
+        starve it, because bridges run on their own threads."""
+        names = []
+
+        async def fan_out():
+            names.append(threading.current_thread().name)
+            return dict(bounded_map(lambda x: x + 1, [1, 2], 2))
+
+        assert run_coroutine(fan_out()) == {0: 2, 1: 3}
+        assert names[0].startswith("AuraRouter-Bridge")
+
+    def test_timeout_cancels_coroutine(self):
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        started = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            run_coroutine(slow(), timeout=0.05)
+        assert cancelled.is_set()
+        assert time.monotonic() - started < 5